@@ -1,3 +1,21 @@
-from settings_doc.main import OutputFormat, render
+from __future__ import annotations
 
-__all__ = ["render", "OutputFormat"]
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from settings_doc.main import OutputFormat, render
+    from settings_doc.renderer import Renderer
+
+__all__ = ["render", "OutputFormat", "Renderer"]
+
+_MODULES = {"render": "main", "OutputFormat": "main", "Renderer": "renderer"}
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first access, so that importing `settings_doc.main` for the CLI stays cheap.
+    if name in _MODULES:
+        from importlib import import_module  # pylint: disable=import-outside-toplevel
+
+        return getattr(import_module(f"{__name__}.{_MODULES[name]}"), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import sysconfig
+import time
+from importlib.machinery import ModuleSpec, PathFinder
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Final, Iterable, Iterator
+
+from settings_doc.walking import DEFAULT_MAX_DEPTH, reached_classes
+
+DEFAULT_CACHE_DIR: Final[str] = ".settings-doc-cache"
+DEFAULT_BYTECODE_CACHE_DIR: Final[str] = f"{DEFAULT_CACHE_DIR}/bytecode"
+DEFAULT_DAEMON_SOCKET: Final[str] = f"{DEFAULT_CACHE_DIR}/daemon.sock"
+DEFAULT_MAX_AGE: Final[float] = 7 * 24 * 60 * 60
+DEFAULT_MAX_SIZE: Final[int] = 50 * 1024 * 1024
+_ENTRY_SUFFIX: Final[str] = ".json"
+_INSTALL_PATHS: Final[tuple[str, ...]] = ("stdlib", "platstdlib", "purelib", "platlib")
+
+
+def _settings_doc_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version  # pylint: disable=import-outside-toplevel
+
+    try:
+        return version("settings-doc")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def create_cache_folder(folder: Path) -> None:
+    """Create a cache folder, ignored by git, if it doesn't exist yet."""
+    if not folder.exists():
+        folder.mkdir(parents=True)
+        (folder / ".gitignore").write_text("# Created by settings-doc automatically.\n*\n", encoding="utf-8")
+
+
+def find_module_spec(module_path: str) -> ModuleSpec | None:
+    """Locate a module without importing it (or any of its parent packages)."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return getattr(module, "__spec__", None)
+
+    search_path = None
+    spec = None
+
+    for part in module_path.split("."):
+        if spec is not None and search_path is None:
+            return None  # Parent is not a package
+        spec = PathFinder.find_spec(part, search_path)
+        if spec is None:
+            return None
+        search_path = spec.submodule_search_locations
+
+    return spec
+
+
+def find_module_source(module_path: str) -> Path | None:
+    """Locate the source file of a module without importing it (or any of its parent packages)."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        origin = getattr(module, "__file__", None)
+        return Path(origin) if origin else None
+
+    spec = find_module_spec(module_path)
+    if spec is None or not spec.has_location or spec.origin is None:
+        return None
+
+    return Path(spec.origin)
+
+
+def _fingerprint(path: Path) -> bytes:
+    return f"{path}\0".encode() + hashlib.sha256(path.read_bytes()).digest()
+
+
+def _content_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _unchanged(dependencies: Any) -> bool:
+    """Whether stored dependencies are well-formed and their files still have the stored content hashes."""
+    try:
+        return all(_content_hash(Path(path)) == content_hash for path, content_hash in dependencies)
+    except (TypeError, ValueError):
+        return False
+
+
+def _parent_modules(module_path: str) -> Iterator[str]:
+    """The module and its parent packages, which are imported (and run) first."""
+    parts = module_path.split(".")
+    for index in range(len(parts), 0, -1):
+        yield ".".join(parts[:index])
+
+
+def _imported_modules(module_path: str, source: Path) -> Iterator[str]:
+    """Modules imported by the source code of a module, including names imported from packages, which may be
+    submodules, and the parent packages of all of them."""
+    try:
+        tree = ast.parse(source.read_bytes())
+    except (SyntaxError, ValueError):
+        return
+
+    package = module_path if source.stem == "__init__" else module_path.rpartition(".")[0]
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield from _parent_modules(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".")
+                parent = ".".join(parts[: len(parts) - node.level + 1])
+                base = f"{parent}.{base}" if base else parent
+            if base:
+                yield from _parent_modules(base)
+                yield from (f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+
+
+class _Project:
+    """Modules of the same project as some settings modules: of the same top-level packages, or located in the same
+    folders as their top-level packages, unless those hold installed packages."""
+
+    def __init__(self, module_paths: Iterable[str]):
+        install_paths = sysconfig.get_paths()
+        self._install_folders = [Path(install_paths[name]).resolve() for name in _INSTALL_PATHS]
+        self._top_level_names: set[str] = set()
+        self._folders: set[Path] = set()
+        self._other_top_level_names: dict[str, bool] = {}
+
+        for module_path in module_paths:
+            self._top_level_names.add(module_path.split(".")[0])
+            source = find_module_source(module_path)
+            if source is not None:
+                folder = source.resolve().parents[module_path.count(".") + (source.stem == "__init__")]
+                if not self._is_installed(folder):
+                    self._folders.add(folder)
+
+    def _is_installed(self, path: Path) -> bool:
+        return any(path == folder or folder in path.parents for folder in self._install_folders)
+
+    def __contains__(self, module_path: str) -> bool:
+        top_level_name = module_path.split(".")[0]
+        if top_level_name in self._top_level_names:
+            return True
+
+        if top_level_name not in self._other_top_level_names:
+            source = find_module_source(top_level_name) if self._folders else None
+            self._other_top_level_names[top_level_name] = source is not None and self._is_in_folders(source.resolve())
+
+        return self._other_top_level_names[top_level_name]
+
+    def _is_in_folders(self, path: Path) -> bool:
+        return any(folder in path.parents for folder in self._folders) and not self._is_installed(path)
+
+
+def model_sources(models: Iterable[type]) -> list[Path]:
+    """Source files the rendered documentation of the models depends on.
+
+    These are the source files of the modules defining the models, their nested models, enums of their fields and
+    base classes, and of the modules of the same project imported by them, directly or not, as those can provide
+    default values or descriptions. Only imports found in the source code are followed, not dynamic imports.
+    """
+    models = list(models)
+    module_paths = dict.fromkeys(cls.__module__ for cls in reached_classes(models))
+    project = _Project(dict.fromkeys(cls.__module__ for cls in models))
+    pending = [module_path for module_path in module_paths if module_path in project]
+
+    while pending:
+        module_path = pending.pop()
+        source = find_module_source(module_path)
+        if source is None or source.suffix != ".py" or not source.is_file():
+            continue
+
+        for imported in _imported_modules(module_path, source):
+            if imported not in module_paths and imported in project:
+                module_paths[imported] = None
+                pending.append(imported)
+
+    sources = dict.fromkeys(find_module_source(module_path) for module_path in module_paths)
+    return [source for source in sources if source is not None and source.is_file()]
+
+
+class RenderCache:
+    """A persistent cache of rendered documents.
+
+    Entries are keyed on the content of the source files of the settings modules and of the snapshots, the content
+    of all templates visible to the template loader, the output format, the heading offset, the options validating
+    the settings and the version of `settings-doc`. Each entry also stores the content hashes of its dependencies
+    (see `model_sources()`) and is a miss once any of them changes, as is an entry which cannot be read.
+    Entries not used for `max_age` seconds are evicted, as are the least recently used entries once the cache grows
+    over `max_size` bytes.
+    """
+
+    def __init__(self, folder: Path, max_age: float = DEFAULT_MAX_AGE, max_size: int = DEFAULT_MAX_SIZE):
+        self.folder = Path(folder)
+        self.max_age = max_age
+        self.max_size = max_size
+
+    def key(
+        self,
+        output_format: str,
+        heading_offset: int,
+        module_path: tuple[str, ...],
+        class_path: tuple[str, ...],
+        *,
+        template_folders: tuple[Path, ...],
+        snapshot_files: tuple[Path, ...] = (),
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        fail_on_conflicts: bool = False,
+        static: bool = False,
+    ) -> str | None:
+        """Compute a cache key or `None` if some of the sources cannot be located without importing them."""
+        digest = hashlib.sha256()
+        digest.update(f"{_settings_doc_version()}\0{output_format}\0{heading_offset}\0".encode())
+        digest.update(f"{max_depth}\0{fail_on_conflicts}\0{static}\0".encode())
+
+        module_paths = list(module_path) + [path.rsplit(".", maxsplit=1)[0] for path in class_path]
+        digest.update("\0".join(module_path + ("",) + class_path).encode())
+
+        for path in module_paths:
+            source = find_module_source(path)
+            if source is None or not source.is_file():
+                return None
+            digest.update(_fingerprint(source))
+
+        for snapshot_file in snapshot_files:
+            digest.update(_fingerprint(Path(snapshot_file)))
+
+        for folder in template_folders:
+            for template_file in sorted(_ for _ in Path(folder).rglob("*") if _.is_file()):
+                digest.update(_fingerprint(template_file))
+
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.folder / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        """Get the cached document, or `None` if there is none or any of its dependencies changed."""
+        entry = self._entry(key)
+        try:
+            stored = json.loads(entry.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            stored = None
+
+        if (
+            not isinstance(stored, dict)
+            or not isinstance(stored.get("content"), str)
+            or time.time() - entry.stat().st_mtime > self.max_age
+            or not _unchanged(stored.get("dependencies"))
+        ):
+            entry.unlink(missing_ok=True)
+            return None
+
+        os.utime(entry)  # Mark as recently used
+        return stored["content"]
+
+    def set(self, key: str, content: str, dependencies: Iterable[Path] = ()) -> None:
+        """Store the document with the content hashes of the files it depends on."""
+        create_cache_folder(self.folder)
+        stored = {
+            "dependencies": [[str(path), _content_hash(Path(path))] for path in dependencies],
+            "content": content,
+        }
+
+        with NamedTemporaryFile("w", encoding="utf-8", dir=self.folder, suffix=".tmp", delete=False) as file:
+            json.dump(stored, file)
+
+        os.replace(file.name, self._entry(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries and the least recently used ones over the size limit."""
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+
+        for entry in self.folder.glob(f"*{_ENTRY_SUFFIX}"):
+            stat = entry.stat()
+            if now - stat.st_mtime > self.max_age:
+                entry.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
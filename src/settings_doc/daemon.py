@@ -0,0 +1,276 @@
+"""A resident process generating documentation on behalf of `generate --daemon-socket` over a Unix socket.
+
+The daemon keeps the settings modules imported and the templates compiled between requests, so that a request
+costs only the render. Modules imported by earlier requests are imported again when their source files change,
+together with the modules importing from them. Requests are served one at a time, each running `generate` with
+the forwarded command-line arguments in the daemon process and sending back its output and exit code. Unix sockets
+are not available on Windows, so neither is this module.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Final, NamedTuple, Optional, Sequence, Tuple
+
+import click
+
+from settings_doc.options import RAW_ARGS_KEY
+
+PROTOCOL_VERSION: Final[int] = 1
+_OPTION: Final[str] = "--daemon-socket"
+
+_FileState = Optional[Tuple[int, int]]
+
+
+class Response(NamedTuple):
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def forwarded_args(ctx: click.Context) -> list[str]:
+    """The raw arguments of the command without `--daemon-socket`, which the daemon must not forward again."""
+    args: list[str] = []
+    raw_args = iter(ctx.meta[RAW_ARGS_KEY])
+
+    for arg in raw_args:
+        if arg == _OPTION:
+            # The value is optional, see `options.daemon_socket_option`
+            value = next(raw_args, None)
+            if value is not None and value.startswith("-"):
+                args.append(value)
+        elif not arg.startswith(f"{_OPTION}="):
+            args.append(arg)
+
+    return args
+
+
+def _exchange(socket_path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        return json.loads(_receive_all(client))
+
+
+def _receive_all(connection: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def forward(socket_path: Path, args: Sequence[str]) -> Response | None:
+    """Run `generate` with the arguments in the daemon listening on the socket.
+
+    Returns:
+        The output and the exit code of the command, or `None` if no daemon is listening on the socket.
+    """
+    try:
+        response = _exchange(socket_path, {"version": PROTOCOL_VERSION, "cwd": os.getcwd(), "args": list(args)})
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+    return Response(response["exit_code"], response["stdout"], response["stderr"])
+
+
+def forward_command(ctx: click.Context, socket_path: Path) -> None:
+    """Run the command in the daemon listening on the socket, print its output and exit with its exit code.
+
+    Returns only if no daemon is listening on the socket, so that the command has to run in this process.
+    """
+    response = forward(socket_path, forwarded_args(ctx))
+    if response is None:
+        click.secho(f"No daemon is listening on '{socket_path}', generating in this process.", fg="yellow", err=True)
+        return
+
+    sys.stdout.write(response.stdout)
+    sys.stderr.write(response.stderr)
+    ctx.exit(response.exit_code)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _file_state(module: Any) -> tuple[str, _FileState] | None:
+    file = getattr(module, "__file__", None)
+    if not isinstance(file, str):
+        return None
+
+    try:
+        stat = os.stat(file)
+    except OSError:
+        return file, None
+    return file, (stat.st_mtime_ns, stat.st_size)
+
+
+class ModuleTracker:
+    """Tracks the source files of modules imported after it was created, to import them again when they change."""
+
+    def __init__(self) -> None:
+        self._known = set(sys.modules)
+        self._states: dict[str, tuple[str, _FileState]] = {}
+
+    def track(self) -> None:
+        """Start tracking the modules imported since the last call."""
+        for module_path in set(sys.modules) - self._known:
+            self._known.add(module_path)
+            state = _file_state(sys.modules[module_path])
+            if state is not None:
+                self._states[module_path] = state
+
+    def forget_changed(self) -> list[str]:
+        """Forget the tracked modules whose source files changed since they were imported, and the tracked modules
+        importing from them, so they are imported again by the next request.
+
+        Returns:
+            Import paths of the forgotten modules.
+        """
+        from settings_doc.watching import forget_modules  # pylint: disable=import-outside-toplevel
+
+        changed = []
+        for module_path, (file, state) in self._states.items():
+            if module_path in sys.modules and _file_state(sys.modules[module_path]) != (file, state):
+                changed.append(module_path)
+
+        if not changed:
+            return []
+
+        forgotten = forget_modules(changed, self._states)
+        for module_path in forgotten:
+            self._known.discard(module_path)
+            self._states.pop(module_path, None)
+        return forgotten
+
+
+def _forget_out_of_process_imports() -> None:
+    """Modules imported in worker processes are never seen by the tracker, so they are imported on each request."""
+    for module_path in ("settings_doc.parallel_importing",):
+        module = sys.modules.get(module_path)
+        if module is not None:
+            module.import_module_path.cache_clear()
+
+
+def _run_generate(command: click.Group, args: list[str]) -> Response:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            command.main(["generate", *args], prog_name="settings-doc")
+            exit_code = 0
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        except Exception:  # pylint: disable=broad-exception-caught
+            traceback.print_exc()
+            exit_code = 1
+
+    return Response(exit_code, stdout.getvalue(), stderr.getvalue())
+
+
+class Daemon:
+    """Serves `generate` requests sent by `forward()` in the current working directory.
+
+    Args:
+        command: The command-line interface with the `generate` command.
+    """
+
+    def __init__(self, command: click.Group):
+        # pylint: disable-next=import-outside-toplevel
+        from settings_doc.streaming import OutputFormat, create_environment, get_template
+
+        # Compiled and imported ahead of the first request, which then costs only the import of the settings modules
+        for output_format in set(OutputFormat) - {OutputFormat.JSON}:
+            get_template(create_environment(()), output_format)
+        import pydantic_settings  # pylint: disable=import-outside-toplevel,unused-import
+
+        self.command = command
+        self.cwd = os.getcwd()
+        self.tracker = ModuleTracker()
+        self._server: _Server | None = None
+
+    def handle(self, request: dict[str, Any]) -> Response:
+        """Run `generate` with the arguments of the request, forgetting changed modules first."""
+        if request.get("version") != PROTOCOL_VERSION:
+            return Response(2, "", f"Error: The daemon speaks protocol version {PROTOCOL_VERSION}, restart it.\n")
+
+        if request.get("cwd") != self.cwd:
+            return Response(2, "", f"Error: The daemon serves '{self.cwd}', not '{request.get('cwd')}'.\n")
+
+        try:
+            self.tracker.forget_changed()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            return Response(1, "", f"Error: Cannot forget the changed modules: {exc}\n")
+
+        _forget_out_of_process_imports()
+        response = _run_generate(self.command, request["args"])
+        self.tracker.track()
+        return response
+
+    def serve(self, socket_path: Path) -> None:
+        """Serve requests on the socket until interrupted or `shutdown()` is called.
+
+        Raises:
+            click.UsageError: If another daemon is listening on the socket already.
+        """
+        if _is_listening(socket_path):
+            raise click.UsageError(f"A daemon is listening on '{socket_path}' already.")
+
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+
+        with _Server(socket_path, self) as server:
+            self._server = server
+            try:
+                server.serve_forever()
+            finally:
+                self._server = None
+                socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop serving requests, waiting for the current one to finish."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def serve_connection(self, connection: socket.socket) -> None:
+        """Read a request from the connection and send back the response."""
+        try:
+            request = json.loads(_receive_all(connection))
+        except ValueError:
+            response = Response(2, "", "Error: Malformed request.\n")
+        else:
+            response = self.handle(request)
+
+        try:
+            connection.sendall(json.dumps(response._asdict()).encode("utf-8"))
+        except OSError:  # The client went away
+            pass
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        self.server.settings_daemon.serve_connection(self.request)
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, settings_daemon: Daemon):
+        self.settings_daemon = settings_daemon
+        super().__init__(str(socket_path), _RequestHandler)
@@ -0,0 +1,182 @@
+"""Discovering the modules of a package that define settings classes.
+
+All modules of a package are found without importing any of them. Only modules mentioning `Settings` in their
+source code (for example `BaseSettings` or a base class like `AppSettings`) may define settings classes, so only
+those are imported to find out whether they do. `__main__` modules are never imported. The results are kept in
+an on-disk index, so that later runs import only the modules known to define settings classes. Entries of the
+index are invalidated when the modification time or the size of their source file changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pkgutil
+from importlib.machinery import PathFinder
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator
+
+import click
+
+from settings_doc.cache import DEFAULT_CACHE_DIR, create_cache_folder, find_module_spec
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+
+if TYPE_CHECKING:
+    from settings_doc.isolated_importing import Isolation
+
+INDEX_FILE_NAME: Final[str] = "package-index.json"
+_INDEX_VERSION: Final[int] = 1
+_SETTINGS_MARKER: Final[bytes] = b"Settings"
+
+
+def _walk_locations(locations: Iterable[str], prefix: str) -> Iterator[tuple[str, Path]]:
+    for module_info in pkgutil.iter_modules(list(locations), prefix):
+        spec = PathFinder.find_spec(module_info.name, list(locations))
+        if spec is None or module_info.name.rsplit(".", maxsplit=1)[-1] == "__main__":
+            continue
+
+        if spec.has_location and spec.origin is not None and spec.origin.endswith(".py"):
+            yield module_info.name, Path(spec.origin)
+
+        if module_info.ispkg and spec.submodule_search_locations:
+            yield from _walk_locations(spec.submodule_search_locations, f"{module_info.name}.")
+
+
+def walk_package(package: str) -> Iterator[tuple[str, Path]]:
+    """Find the package and all its (nested) modules with their source files, without importing any of them.
+
+    Raises:
+        click.BadParameter: If the package cannot be found.
+    """
+    spec = find_module_spec(package)
+    if spec is None or spec.submodule_search_locations is None:
+        raise click.BadParameter(f"Cannot find the package '{package}'.")
+
+    if spec.has_location and spec.origin is not None and spec.origin.endswith(".py"):
+        yield package, Path(spec.origin)
+
+    yield from _walk_locations(spec.submodule_search_locations, f"{package}.")
+
+
+def _load_index(index_file: Path) -> dict[str, dict[str, Any]]:
+    try:
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+        return {}
+    return index.get("modules", {})
+
+
+def _save_index(index_file: Path, modules: dict[str, dict[str, Any]]) -> None:
+    create_cache_folder(index_file.parent)
+
+    with NamedTemporaryFile("w", encoding="utf-8", dir=index_file.parent, suffix=".tmp", delete=False) as file:
+        json.dump({"version": _INDEX_VERSION, "modules": modules}, file, indent=2, sort_keys=True)
+
+    os.replace(file.name, index_file)
+
+
+def _skip(module_path: str, error: str) -> None:
+    click.secho(f"Skipping module '{module_path}': {error}", fg="yellow", err=True)
+
+
+def _defines_settings(module_path: str, static: bool) -> bool:
+    from settings_doc import importing, static_importing  # pylint: disable=import-outside-toplevel
+
+    try:
+        if static:
+            settings = static_importing.module_settings(module_path)
+        else:
+            settings = importing.module_settings(importing.import_module(module_path), module_path)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _skip(
+            module_path,
+            (
+                exc.message
+                if isinstance(exc, click.ClickException)
+                else f"Importing '{module_path}' failed with {type(exc).__name__}: {exc}"
+            ),
+        )
+        return False
+
+    return any(cls.__module__ == module_path for cls in settings)
+
+
+def _define_settings(
+    module_paths: list[str], static: bool, jobs: int, max_depth: int, isolation: Isolation | None
+) -> list[bool]:
+    """Find out which modules define settings classes, importing them the same way as their settings later."""
+    if isolation is None or static:
+        return [_defines_settings(module_path, static) for module_path in module_paths]
+
+    from settings_doc import isolated_importing  # pylint: disable=import-outside-toplevel
+
+    descriptions = isolated_importing.describe_modules(module_paths, jobs, max_depth, isolation)
+    for module_path, description in zip(module_paths, descriptions):
+        if isinstance(description, str):
+            _skip(module_path, description)
+
+    return [
+        not isinstance(description, str) and any(cls.module == module_path for cls in description.classes)
+        for module_path, description in zip(module_paths, descriptions)
+    ]
+
+
+def discover_modules(  # pylint: disable=too-many-arguments
+    packages: Iterable[str],
+    cache_dir: Path | None = None,
+    *,
+    static: bool = False,
+    jobs: int = 1,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    isolation: Isolation | None = None,
+) -> tuple[str, ...]:
+    """Find the modules of packages (recursively) that define settings classes.
+
+    Modules are imported only if they were not indexed yet or changed since and mention `Settings`. They are
+    imported the same way as the settings later: re-created from their source code with `static`, or each in its
+    own child process (up to `jobs` at once) with `isolation`. Modules failing to import are reported and indexed
+    as not defining any settings classes. The index is kept in `cache_dir`, `DEFAULT_CACHE_DIR` by default.
+
+    Returns:
+        Import paths of the modules in the order they were found.
+    """
+    index_file = Path(cache_dir or DEFAULT_CACHE_DIR) / INDEX_FILE_NAME
+    index = _load_index(index_file)
+    found: list[str] = []
+    candidates: list[str] = []
+    changed = False
+
+    for package in packages:
+        stale = {
+            module_path for module_path in index if module_path == package or module_path.startswith(f"{package}.")
+        }
+
+        for module_path, source in walk_package(package):
+            stale.discard(module_path)
+            found.append(module_path)
+            stat = source.stat()
+            state = (str(source), stat.st_mtime_ns, stat.st_size)
+            entry = index.get(module_path)
+
+            if entry is None or (entry["source"], entry["mtime_ns"], entry["size"]) != state:
+                index[module_path] = {"source": state[0], "mtime_ns": state[1], "size": state[2], "settings": False}
+                if _SETTINGS_MARKER in source.read_bytes():
+                    candidates.append(module_path)
+                changed = True
+
+        for module_path in stale:
+            del index[module_path]
+            changed = True
+
+    candidates = list(dict.fromkeys(candidates))
+    for module_path, defined in zip(candidates, _define_settings(candidates, static, jobs, max_depth, isolation)):
+        index[module_path]["settings"] = defined
+
+    if changed:
+        _save_index(index_file, index)
+
+    return tuple(module_path for module_path in dict.fromkeys(found) if index[module_path]["settings"])
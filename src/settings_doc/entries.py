@@ -0,0 +1,211 @@
+"""Per-field records consumed by the built-in templates.
+
+Everything the templates need is derived from a `FieldInfo` once per field, instead of calling the template
+functions for every field in every render. Records are shared by all output formats rendered from the same
+walked settings class.
+"""
+
+from __future__ import annotations
+
+from enum import EnumMeta
+from functools import lru_cache
+from typing import Any, Final, Iterable
+from weakref import WeakKeyDictionary
+
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from settings_doc.template_functions import (
+    _fix_str_enum_value,
+    _is_enum,
+    _is_typing_literal,
+    _is_values_with_descriptions,
+    _serialize_dict,
+)
+
+_UNSET: Any = object()
+_LINE_LENGTH: Final[int] = 75
+_MARKDOWN_INLINE_PADDING: Final[int] = len("``")
+_ENV_INLINE_PADDING: Final[int] = len("#   ``")
+
+
+class ValueList:
+    """Normalized example or possible values.
+
+    Attributes:
+        items: The values. If `described`, each of them is a tuple of a value and optionally its description.
+        described: Whether the values come with descriptions.
+        joined: Values joined by "`, `" for rendering them inline. Empty if `described`.
+        markdown_inline: Whether `joined` fits on a line of the Markdown output.
+        env_inline: Whether `joined` fits on a comment line of the .env output.
+    """
+
+    __slots__ = ("items", "described", "joined", "markdown_inline", "env_inline")
+
+    def __init__(self, values: Iterable[Any], check_descriptions: bool = True):
+        self.described = check_descriptions and _is_values_with_descriptions(values)
+
+        if self.described:
+            self.items: tuple[Any, ...] = tuple(tuple(value) for value in values)
+            self.joined = ""
+        else:
+            self.items = tuple(values)
+            self.joined = "`, `".join(str(value) for value in self.items)
+
+        self.markdown_inline = not self.described and len(self.joined) + _MARKDOWN_INLINE_PADDING <= _LINE_LENGTH
+        self.env_inline = not self.described and len(self.joined) + _ENV_INLINE_PADDING <= _LINE_LENGTH
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+@lru_cache(maxsize=1024)
+def _literal_values(typed_args: tuple[tuple[type, Any], ...]) -> ValueList:
+    # Keyed by the types too, as `Literal[1]` and `Literal[True]` are equal in older Python versions
+    return ValueList([arg for _, arg in typed_args])
+
+
+# Keyed weakly, so that enums of reloaded modules are not kept alive
+_ENUM_VALUES: WeakKeyDictionary[EnumMeta, ValueList] = WeakKeyDictionary()
+
+
+def _enum_values(enum: EnumMeta) -> ValueList:
+    values = _ENUM_VALUES.get(enum)
+    if values is None:
+        values = ValueList([member.value for member in enum])  # type: ignore[var-annotated]
+        values = _ENUM_VALUES.setdefault(enum, values)
+    return values
+
+
+def _annotation_values(field: FieldInfo) -> ValueList | None:
+    """Possible values of a `Literal` or `Enum` annotation, normalized once per annotation and shared by all
+    fields using it."""
+    if _is_typing_literal(field):
+        args = field.annotation.__args__  # type: ignore[union-attr]
+        try:
+            return _literal_values(tuple((type(arg), arg) for arg in args))
+        except TypeError:  # Unhashable values
+            return ValueList(args)
+
+    if _is_enum(field):
+        return _enum_values(field.annotation)  # type: ignore[arg-type]
+
+    return None
+
+
+def _json_schema_extra(field: FieldInfo) -> dict[str, Any]:
+    return field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+
+
+class SettingEntry:  # pylint: disable=too-many-instance-attributes
+    """A single environment variable of a walked settings class, as rendered by the built-in templates.
+
+    Attributes:
+        raw_env_name: The name of the environment variable as walked, without changing its case.
+        env_name: Upper-cased name of the environment variable.
+        field: The underlying pydantic field.
+        required: Whether the variable must be set.
+        default: The default value as shown in Markdown or `None` if there is none.
+        env_default: The default value as written into a .env file. Empty if there is none.
+        description: The description of the field.
+        examples: Example values (Markdown), either as a string or a `ValueList`. Computed on first access.
+        possible_values: Possible values (Markdown) as a `ValueList`. Computed on first access.
+        env_possible_values: Possible values (.env) as a `ValueList`. Computed on first access.
+    """
+
+    __slots__ = (
+        "raw_env_name",
+        "env_name",
+        "field",
+        "required",
+        "default",
+        "env_default",
+        "description",
+        "_examples",
+        "_possible_values",
+        "_env_possible_values",
+        "_annotation_values_cache",
+    )
+
+    def __init__(self, env_name: str, field: FieldInfo):
+        self.raw_env_name = env_name
+        self.env_name = env_name.upper()
+        self.field = field
+        self.required = field.is_required()
+        self.description = field.description
+
+        if field.default is PydanticUndefined:
+            self.default = None
+            self.env_default = ""
+        else:
+            default = _fix_str_enum_value(field.default)
+            self.default = str(default)
+            self.env_default = "" if field.default is None else str(_serialize_dict(default))
+
+        self._examples = _UNSET
+        self._possible_values = _UNSET
+        self._env_possible_values = _UNSET
+        self._annotation_values_cache = _UNSET
+
+    def describes_same(self, other: SettingEntry) -> bool:
+        """Whether both entries document the same environment variable in the same way."""
+        if self.field is other.field:
+            return self.env_name == other.env_name
+
+        return (
+            self.env_name == other.env_name
+            and self.required == other.required
+            and self.default == other.default
+            and self.env_default == other.env_default
+            and self.description == other.description
+            and self.field.annotation == other.field.annotation
+            and repr(self.field.examples) == repr(other.field.examples)
+            and repr(self.field.json_schema_extra) == repr(other.field.json_schema_extra)
+        )
+
+    @property
+    def examples(self) -> str | ValueList | None:
+        if self._examples is _UNSET:
+            json_schema_extra = _json_schema_extra(self.field)
+            if "examples" in json_schema_extra:
+                examples = json_schema_extra["examples"]
+                self._examples = examples if isinstance(examples, str) else ValueList(examples)
+            elif self.field.examples:
+                self._examples = ValueList(self.field.examples, check_descriptions=False)
+            else:
+                self._examples = None
+        return self._examples
+
+    @property
+    def possible_values(self) -> ValueList | None:
+        if self._possible_values is _UNSET:
+            json_schema_extra = _json_schema_extra(self.field)
+            if "possible_values" in json_schema_extra:
+                values = json_schema_extra["possible_values"]
+                self._possible_values = ValueList(values) if values else None
+            else:
+                self._possible_values = self._shared_annotation_values
+        return self._possible_values
+
+    @property
+    def env_possible_values(self) -> ValueList | None:
+        if self._env_possible_values is _UNSET:
+            self._env_possible_values = self._shared_annotation_values
+            if self._env_possible_values is None:
+                values = _serialize_dict(_json_schema_extra(self.field).get("possible_values"))
+                self._env_possible_values = ValueList(values) if values else None
+        return self._env_possible_values
+
+    @property
+    def _shared_annotation_values(self) -> ValueList | None:
+        """Values of a `Literal` or `Enum` annotation, shared by both orders of precedence."""
+        if self._annotation_values_cache is _UNSET:
+            self._annotation_values_cache = _annotation_values(self.field)
+        return self._annotation_values_cache
+
+
+def create_entries(fields: Iterable[tuple[str, FieldInfo]]) -> list[SettingEntry]:
+    return [SettingEntry(env_name, field) for env_name, field in fields]
@@ -3,14 +3,36 @@ from __future__ import annotations
 import importlib
 from functools import lru_cache
 from inspect import isclass
+from types import ModuleType
+from typing import Final
 
 import click
 from pydantic_settings import BaseSettings
 
-_MODULE_ERROR_MSG = "No `pydantic.BaseSettings` subclasses found in module '{module_path}'."
+MODULE_ERROR_MSG = "No `pydantic.BaseSettings` subclasses found in module '{module_path}'."
+MODULE_PARAM_HINT: Final[str] = "'--module' / '-m'"
+CLASS_PARAM_HINT: Final[str] = "'--class' / '-c'"
 _RELATIVE_IMPORT_ERROR_MSG = "Relative imports are not supported."
 
 
+def import_module(module_path: str) -> ModuleType:
+    try:
+        return importlib.import_module(module_path)
+    except (ModuleNotFoundError, TypeError) as exc:
+        cause = str(exc)
+        if isinstance(exc, TypeError) and "relative import" in cause:
+            cause = _RELATIVE_IMPORT_ERROR_MSG
+        raise click.BadParameter(f"Cannot read the module: {cause}", param_hint=MODULE_PARAM_HINT) from exc
+
+
+def module_settings(module: ModuleType, module_path: str) -> dict[type[BaseSettings], None]:
+    return {
+        obj: None
+        for obj in vars(module).values()
+        if isclass(obj) and issubclass(obj, BaseSettings) and obj.__module__.startswith(module_path)
+    }
+
+
 @lru_cache
 def import_module_path(module_paths: tuple[str, ...]) -> dict[type[BaseSettings], None]:
     if not module_paths:
@@ -19,36 +41,33 @@ def import_module_path(module_paths: tuple[str, ...]) -> dict[type[BaseSettings]
     settings: dict[type[BaseSettings], None] = {}
 
     for module_path in module_paths:
-        try:
-            module = importlib.import_module(module_path)
-        except (ModuleNotFoundError, TypeError) as exc:
-            cause = str(exc)
-            if isinstance(exc, TypeError) and "relative import" in cause:
-                cause = _RELATIVE_IMPORT_ERROR_MSG
-            raise click.BadParameter(f"Cannot read the module: {cause}") from exc
-
-        new_classes: dict[type[BaseSettings], None] = {
-            obj: None
-            for obj in vars(module).values()
-            if isclass(obj) and issubclass(obj, BaseSettings) and obj.__module__.startswith(module_path)
-        }
+        new_classes = module_settings(import_module(module_path), module_path)
 
         if not new_classes:
             if len(module_paths) > 1:
-                click.secho(_MODULE_ERROR_MSG.format(module_path=module_path), fg="yellow", err=True)
+                click.secho(MODULE_ERROR_MSG.format(module_path=module_path), fg="yellow", err=True)
         else:
             settings.update(new_classes)
 
     if not settings:
         raise click.BadParameter(
-            _MODULE_ERROR_MSG.format(module_path=module_paths[0])
-            if len(module_paths) == 1
-            else "No `pydantic.BaseSettings` subclasses found in any of the modules."
+            (
+                MODULE_ERROR_MSG.format(module_path=module_paths[0])
+                if len(module_paths) == 1
+                else "No `pydantic.BaseSettings` subclasses found in any of the modules."
+            ),
+            param_hint=MODULE_PARAM_HINT,
         )
 
     return settings
 
 
+def clear_caches() -> None:
+    """Forget the settings classes of all import paths, so that they are resolved again on next use."""
+    import_module_path.cache_clear()
+    import_class_path.cache_clear()
+
+
 @lru_cache
 def import_class_path(class_paths: tuple[str, ...]) -> dict[type[BaseSettings], None]:
     settings: dict[type[BaseSettings], None] = {}
@@ -61,28 +80,19 @@ def import_class_path(class_paths: tuple[str, ...]) -> dict[type[BaseSettings],
             cause = str(exc)
             if isinstance(exc, TypeError) and "relative import" in cause:
                 cause = _RELATIVE_IMPORT_ERROR_MSG
-            raise click.BadParameter(f"Cannot read the settings class: {cause}") from exc
+            raise click.BadParameter(f"Cannot read the settings class: {cause}", param_hint=CLASS_PARAM_HINT) from exc
 
         if not isclass(new_class):
-            raise click.BadParameter(f"Target '{class_name}' in module '{module}' is not a class.")
+            raise click.BadParameter(
+                f"Target '{class_name}' in module '{module}' is not a class.", param_hint=CLASS_PARAM_HINT
+            )
 
         if not issubclass(new_class, BaseSettings):
             raise click.BadParameter(
-                f"Target class must be a subclass of BaseSettings but '{new_class.__name__}' found."
+                f"Target class must be a subclass of BaseSettings but '{new_class.__name__}' found.",
+                param_hint=CLASS_PARAM_HINT,
             )
 
         settings[new_class] = None
 
     return settings
-
-
-def module_path_callback(ctx: click.Context, param: click.Parameter, value: list[str]) -> list[str]:
-    del ctx, param
-    import_module_path(tuple(value))
-    return value
-
-
-def class_path_callback(ctx: click.Context, param: click.Parameter, value: list[str]) -> list[str]:
-    del ctx, param
-    import_class_path(tuple(value))
-    return value
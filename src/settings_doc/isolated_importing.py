@@ -0,0 +1,208 @@
+"""Import settings modules in sandboxed child processes with a time and memory budget.
+
+Each module (or the module of each class) is imported in a fresh child process, which sends back only
+a description of the settings fields, as in `parallel_importing`. A child process taking longer than the
+timeout is killed, and the address space of each child process can be limited with `RLIMIT_AS`, so that
+a module blocking or allocating excessively at import time fails with an error naming it instead of
+hanging or exhausting the machine.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import SpawnProcess
+from typing import Final, NamedTuple, Sequence
+
+import click
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings
+
+from settings_doc import importing
+from settings_doc.parallel_importing import (
+    ModuleDescription,
+    create_classes,
+    create_module_settings,
+    describe_module,
+    describe_settings,
+)
+
+DEFAULT_TIMEOUT: Final[float] = 60.0
+_MEBIBYTE: Final[int] = 1024 * 1024
+_STOP_TIMEOUT: Final[float] = 1.0
+
+
+class Isolation(NamedTuple):
+    """Budget of each child process importing a module."""
+
+    timeout: float = DEFAULT_TIMEOUT
+    """Seconds after which the child process is killed."""
+    memory_limit: int | None = None
+    """Limit of the address space of the child process in MiB, or `None` for no limit."""
+
+
+def describe_class_path(class_path: str, max_depth: int) -> ModuleDescription | str:
+    """Import a settings class and describe it. Runs in a child process.
+
+    Returns:
+        The description or an error message if the class cannot be imported or walked.
+    """
+    from settings_doc.streaming import model_fields  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    try:
+        settings = importing.import_class_path((class_path,))
+        return describe_settings({cls: model_fields(cls, max_depth) for cls in settings})
+    except click.BadParameter as exc:
+        return exc.message
+
+
+def _describe_isolated(
+    connection: Connection, path: str, is_class: bool, max_depth: int, memory_limit: int | None
+) -> None:
+    """Describe a module or a class within the memory limit and send the result to the parent process."""
+    if memory_limit is not None:
+        import resource  # pylint: disable=import-outside-toplevel
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit * _MEBIBYTE, memory_limit * _MEBIBYTE))
+
+    result: ModuleDescription | str
+    try:
+        result = describe_class_path(path, max_depth) if is_class else describe_module(path, max_depth)
+    except MemoryError:
+        result = f"Importing '{path}' exceeded the memory limit of {memory_limit} MiB."
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        result = f"Importing '{path}' failed with {type(exc).__name__}: {exc}"
+
+    connection.send(result)
+    connection.close()
+
+
+def _stop(process: SpawnProcess) -> None:
+    process.terminate()
+    process.join(_STOP_TIMEOUT)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _receive(path: str, process: SpawnProcess, connection: Connection) -> ModuleDescription | str:
+    try:
+        return connection.recv()
+    except EOFError:
+        process.join(_STOP_TIMEOUT)
+        return f"Importing '{path}' failed, the process importing it exited with code {process.exitcode}."
+
+
+def _describe_all(
+    paths: Sequence[tuple[str, bool]], jobs: int, max_depth: int, isolation: Isolation, fail_fast: bool = True
+) -> list[ModuleDescription | str]:
+    """Describe modules or classes, each in its own child process, running up to `jobs` of them at once.
+
+    Raises:
+        click.BadParameter: With the error message of the first module or class that fails, if `fail_fast` is set.
+            Otherwise, error messages are returned in place of the descriptions.
+    """
+    context = multiprocessing.get_context("spawn")
+    results: dict[int, ModuleDescription | str] = {}
+    pending = list(enumerate(paths))
+    running: dict[int, tuple[SpawnProcess, Connection, float]] = {}
+
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                index, (path, is_class) = pending.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_describe_isolated,
+                    args=(sender, path, is_class, max_depth, isolation.memory_limit),
+                    daemon=True,
+                )
+                process.start()
+                sender.close()
+                running[index] = (process, receiver, time.monotonic() + isolation.timeout)
+
+            deadline = min(deadline for _, _, deadline in running.values())
+            ready = wait([receiver for _, receiver, _ in running.values()], max(0.0, deadline - time.monotonic()))
+
+            for index, (process, receiver, deadline) in list(running.items()):
+                path = paths[index][0]
+                if receiver in ready:
+                    results[index] = _receive(path, process, receiver)
+                elif time.monotonic() >= deadline:
+                    results[index] = f"Importing '{path}' took longer than {isolation.timeout:g} seconds."
+                else:
+                    continue
+
+                del running[index]
+                _stop(process)
+                receiver.close()
+
+                if fail_fast and isinstance(results[index], str):
+                    raise click.BadParameter(
+                        str(results[index]),
+                        param_hint=importing.CLASS_PARAM_HINT if paths[index][1] else importing.MODULE_PARAM_HINT,
+                    )
+    finally:
+        for process, receiver, _ in running.values():
+            _stop(process)
+            receiver.close()
+
+    return [results[index] for index in range(len(paths))]
+
+
+def _check_memory_limit(isolation: Isolation) -> None:
+    if isolation.memory_limit is not None:
+        try:
+            import resource  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as exc:
+            raise click.BadParameter("Limiting the memory of imports is not supported on this platform.") from exc
+
+
+def describe_modules(
+    module_paths: Sequence[str], jobs: int, max_depth: int, isolation: Isolation
+) -> list[ModuleDescription | str]:
+    """Import each module in its own child process and describe its settings classes.
+
+    Returns:
+        The description of each module, in the same order, or an error message if it cannot be imported, takes
+        longer than the timeout, exceeds the memory limit, or its classes cannot be walked.
+
+    Raises:
+        click.BadParameter: If the memory limit is not supported on this platform.
+    """
+    _check_memory_limit(isolation)
+    return _describe_all([(path, False) for path in module_paths], jobs, max_depth, isolation, fail_fast=False)
+
+
+def import_paths(
+    module_paths: tuple[str, ...], class_paths: tuple[str, ...], jobs: int, max_depth: int, isolation: Isolation
+) -> dict[type[BaseSettings], list[tuple[str, FieldInfo]]]:
+    """Import each module and the module of each class in its own child process and re-create the settings classes.
+
+    Returns:
+        Stand-ins of the settings classes (of `class_paths` first) mapped to their (nested) fields with environment
+        variable names. The stand-ins carry `model_config` and `model_fields` but are not `BaseSettings` subclasses.
+
+    Raises:
+        click.BadParameter: If a module cannot be imported, takes longer than the timeout, exceeds the memory limit,
+            or if no settings classes are found.
+    """
+    _check_memory_limit(isolation)
+    descriptions = _describe_all(
+        [(path, True) for path in class_paths] + [(path, False) for path in module_paths], jobs, max_depth, isolation
+    )
+    settings: dict[type[BaseSettings], list[tuple[str, FieldInfo]]] = {}
+
+    for description in descriptions[: len(class_paths)]:
+        settings.update(create_classes(description))  # type: ignore[arg-type]  # Errors were raised already
+
+    if module_paths:
+        # Classes given by both a class path and a module are described twice, keep only the first stand-in
+        names = {(cls.__module__, cls.__qualname__) for cls in settings}
+        for cls, fields in create_module_settings(module_paths, descriptions[len(class_paths) :]).items():
+            if (cls.__module__, cls.__qualname__) not in names:
+                names.add((cls.__module__, cls.__qualname__))
+                settings[cls] = fields
+
+    return settings
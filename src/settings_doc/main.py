@@ -1,26 +1,45 @@
 from __future__ import annotations
 
-import itertools
-import logging
-import re
+import os
 import shutil
-from enum import Enum, auto
-from inspect import isclass
+import sys
+from contextlib import nullcontext
 from os import listdir
 from pathlib import Path
-from typing import Final, Iterator
+from typing import TYPE_CHECKING, ContextManager, Iterable, Sequence
 
 import click
-from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo
-from pydantic_settings import BaseSettings
+from click.core import ParameterSource
+
+from settings_doc import options
+from settings_doc.cache import (
+    DEFAULT_BYTECODE_CACHE_DIR,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_DAEMON_SOCKET,
+    RenderCache,
+    model_sources,
+)
+from settings_doc.manifest import ManifestJob, load_manifest
+from settings_doc.streaming import (
+    TEMPLATES_FOLDER,
+    OutputFormat,
+    collect_entries,
+    create_environment,
+    get_template,
+    render_settings,
+    store_rendered,
+    stream_entries,
+)
+from settings_doc.walking import DEFAULT_MAX_DEPTH
 
-from settings_doc import importing
-from settings_doc.template_functions import JINJA_ENV_GLOBALS
+if TYPE_CHECKING:
+    # Imported lazily, so that commands not rendering anything (and `--help`) start quickly.
+    from pydantic.fields import FieldInfo
+    from pydantic_settings import BaseSettings
 
-TEMPLATES_FOLDER: Final[Path] = Path(__file__).parent / "templates"
-LOGGER = logging.getLogger(__name__)
+    from settings_doc.entries import SettingEntry
+    from settings_doc.isolated_importing import Isolation
+    from settings_doc.profiling import Profile
 
 
 @click.group()
@@ -28,203 +47,753 @@ def app():
     pass
 
 
-class OutputFormat(Enum):
-    # noinspection PyMethodParameters
-    def _generate_next_value_(name, start, count, last_values):  # pylint: disable=no-self-argument
-        del start, count, last_values
-        return name.lower()  # pylint: disable=no-member
-
-    DOTENV = auto()
-    MARKDOWN = auto()
-    DEBUG = auto()
-
-
-def get_template(env: Environment, output_format: OutputFormat) -> Template:
-    return env.get_template(f"{output_format.value}.jinja")
-
-
-def _model_fields_recursive(
-    cls: type[BaseModel], prefix: str, env_nested_delimiter: str | None
-) -> Iterator[tuple[str, FieldInfo]]:
-    for field_name, model_field in cls.model_fields.items():
-        if model_field.validation_alias is not None:
-            if isinstance(model_field.validation_alias, str):
-                yield model_field.validation_alias, model_field
-            else:
-                LOGGER.error(f"Unsupported validation alias type '{type(model_field.validation_alias)}'.")
-        elif isclass(model_field.annotation) and issubclass(model_field.annotation, BaseModel):
-            # There are nested fields and they can be joined by a delimiter. Generate variable names recursively.
-            if issubclass(model_field.annotation, BaseSettings):
-                yield from _model_fields(model_field.annotation)
-            else:  # BaseModel
-                yield from _model_fields_recursive(
-                    model_field.annotation,
-                    prefix + field_name + (env_nested_delimiter or ""),
-                    env_nested_delimiter or "",
-                )
-        else:
-            yield prefix + field_name, model_field
+def _import_settings(
+    module_path: tuple[str, ...], class_path: tuple[str, ...], static: bool = False
+) -> dict[type[BaseSettings], None]:
+    from settings_doc import importing, static_importing  # pylint: disable=import-outside-toplevel
+
+    importer = static_importing if static else importing
+    settings: dict[type[BaseSettings], None] = dict.fromkeys(importer.import_class_path(class_path))
+    settings.update(dict.fromkeys(importer.import_module_path(module_path)))
+    return settings
+
+
+def _load_settings(  # pylint: disable=too-many-arguments
+    module_path: tuple[str, ...],
+    class_path: tuple[str, ...],
+    *,
+    static: bool,
+    jobs: int,
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]],
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    snapshot_files: tuple[Path, ...] = (),
+    profile: Profile | None = None,
+    isolation: Isolation | None = None,
+) -> dict[type[BaseSettings], None]:
+    """Import settings classes, filling `walked_fields` for those walked in worker or child processes or loaded
+    from snapshots. With `profile`, the import time of each module imported in this process is recorded in it."""
+    described_fields: dict[type[BaseSettings], list[tuple[str, FieldInfo]]] = {}
+
+    if profile is not None and not static and isolation is None:
+        profile.import_modules(
+            [path.rsplit(".", maxsplit=1)[0] for path in class_path] + list(module_path if jobs == 1 else ())
+        )
+
+    if isolation is not None and not static:
+        from settings_doc import isolated_importing  # pylint: disable=import-outside-toplevel
+
+        described_fields.update(isolated_importing.import_paths(module_path, class_path, jobs, max_depth, isolation))
+        module_path, class_path = (), ()
+    elif jobs > 1 and module_path and not static:
+        from settings_doc import parallel_importing  # pylint: disable=import-outside-toplevel
+
+        described_fields.update(parallel_importing.import_module_path(module_path, jobs, max_depth))
+        module_path = ()
+
+    if snapshot_files:
+        from settings_doc import snapshots  # pylint: disable=import-outside-toplevel
+
+        for snapshot_file in snapshot_files:
+            described_fields.update(snapshots.load_snapshot(snapshot_file))
+
+    settings = _import_settings(module_path, class_path, static)
 
+    if described_fields:
+        from settings_doc.entries import create_entries  # pylint: disable=import-outside-toplevel
 
-def _model_fields(cls: type[BaseSettings]) -> Iterator[tuple[str, FieldInfo]]:
-    yield from _model_fields_recursive(cls, cls.model_config["env_prefix"], cls.model_config["env_nested_delimiter"])
+        walked_fields.update((cls, create_entries(fields)) for cls, fields in described_fields.items())
+        settings.update(dict.fromkeys(described_fields))
 
+    return settings
 
-def render(
+
+def render(  # pylint: disable=too-many-arguments
     output_format: OutputFormat,
     module_path: tuple[str, ...] | None = None,
     class_path: tuple[str, ...] | None = None,
     heading_offset: int = 0,
     templates: tuple[Path, ...] | None = None,
+    *,
+    cache_dir: Path | None = None,
+    static: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    jobs: int = 1,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+    snapshot_files: tuple[Path, ...] | None = None,
+    isolation: Isolation | None = None,
 ) -> str:
-    """Render the settings documentation."""
-    if not class_path and not module_path:
+    """Render the settings documentation.
+
+    When `cache_dir` is given, rendered documents are cached there and returned without importing
+    the settings modules as long as their source files and the templates do not change.
+
+    When `static` is set, settings classes are re-created from their source code without importing
+    it. Only modules with classes that cannot be resolved that way are imported.
+
+    When `bytecode_cache_dir` is given, compiled templates are stored there and reused by later runs.
+
+    When `jobs` is greater than 1, modules in `module_path` are imported in up to that many worker processes
+    instead of the current one. Has no effect with `static`.
+
+    Nested models are walked up to `max_depth` levels deep. Deeper nesting and models containing themselves
+    raise `click.BadParameter`.
+
+    Environment variables defined identically by several classes are documented only once. Differing
+    definitions are all documented and reported as a warning, or raise `click.BadParameter` if
+    `fail_on_conflicts` is set.
+
+    Settings classes can also be re-created from `snapshot_files`, written with the `OutputFormat.JSON` format,
+    without importing anything.
+
+    With `isolation`, each module in `module_path` and `class_path` is imported in its own child process, running
+    up to `jobs` of them at once, which is killed when it exceeds the time or memory budget of `isolation`.
+    Has no effect with `static`.
+    """
+    return "".join(
+        _stream_many(
+            (output_format,),
+            module_path=module_path,
+            class_path=class_path,
+            heading_offset=heading_offset,
+            templates=templates,
+            cache_dir=cache_dir,
+            static=static,
+            bytecode_cache_dir=bytecode_cache_dir,
+            jobs=jobs,
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+            snapshot_files=snapshot_files,
+            isolation=isolation,
+        )[0]
+    )
+
+
+def _phase(profile: Profile | None, name: str) -> ContextManager[None]:
+    return nullcontext() if profile is None else profile.phase(name)
+
+
+def _stream_many(  # pylint: disable=too-many-arguments
+    output_formats: tuple[OutputFormat, ...],
+    module_path: tuple[str, ...] | None = None,
+    class_path: tuple[str, ...] | None = None,
+    heading_offset: int = 0,
+    templates: tuple[Path, ...] | None = None,
+    *,
+    cache_dir: Path | None = None,
+    static: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    jobs: int = 1,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+    snapshot_files: tuple[Path, ...] | None = None,
+    profile: Profile | None = None,
+    isolation: Isolation | None = None,
+) -> list[Iterable[str]]:
+    """Same as `render()`, but renders several output formats with a single import and walk of the settings.
+
+    With `profile`, the phases of the rendering and the imports of the settings modules are recorded in it.
+
+    Returns:
+        Chunks of the document for each output format. Documents are rendered lazily while iterating
+        over the chunks, unless they need to be stored in the cache or profiled.
+    """
+    if not class_path and not module_path and not snapshot_files:
         raise ValueError("No sources of data were specified.")
 
-    if module_path is None:
-        module_path = tuple()
+    module_path = tuple(module_path or ())
+    class_path = tuple(class_path or ())
+    snapshot_files = tuple(snapshot_files or ())
+    templates = tuple(templates or ())
+
+    rendered_docs: dict[OutputFormat, Iterable[str]] = {}
+    cache_keys: dict[OutputFormat, str | None] = {}
+    cache = None if cache_dir is None else RenderCache(cache_dir)
+
+    if cache is not None:
+        template_folders = templates + (TEMPLATES_FOLDER,)
+        with _phase(profile, "cache"):
+            for output_format in output_formats:
+                cache_key = cache.key(
+                    output_format.value,
+                    heading_offset,
+                    module_path,
+                    class_path,
+                    template_folders=template_folders,
+                    snapshot_files=snapshot_files,
+                    max_depth=max_depth,
+                    fail_on_conflicts=fail_on_conflicts,
+                    static=static,
+                )
+                cached_doc = None if cache_key is None else cache.get(cache_key)
+                if cached_doc is None:
+                    cache_keys[output_format] = cache_key
+                else:
+                    rendered_docs[output_format] = (cached_doc,)
+
+    missing_formats = [output_format for output_format in output_formats if output_format not in rendered_docs]
+
+    if missing_formats:
+        walked_fields: dict[type[BaseSettings], list[SettingEntry]] = {}
+
+        with _phase(profile, "import"):
+            settings = _load_settings(
+                module_path,
+                class_path,
+                static=static,
+                jobs=jobs,
+                walked_fields=walked_fields,
+                max_depth=max_depth,
+                snapshot_files=snapshot_files,
+                profile=profile,
+                isolation=isolation,
+            )
+
+        if not settings:
+            raise ValueError("No sources of data were found.")
+
+        with _phase(profile, "walk"):
+            entries = collect_entries(settings, walked_fields, max_depth=max_depth, fail_on_conflicts=fail_on_conflicts)
+
+        with _phase(profile, "compile"):
+            env = create_environment(templates, bytecode_cache_dir)
+            for template_format in set(missing_formats) - {OutputFormat.JSON}:
+                get_template(env, template_format)
+
+        dependencies = () if cache is None else model_sources(settings)
+        for output_format in missing_formats:
+            chunks = stream_entries(
+                env, output_format, settings, entries, heading_offset=heading_offset, walked_fields=walked_fields
+            )
+            rendered_docs[output_format] = store_rendered(
+                output_format,
+                chunks,
+                cache=cache,
+                cache_key=cache_keys.get(output_format),
+                profile=profile,
+                dependencies=dependencies,
+            )
+
+    return [rendered_docs[output_format] for output_format in output_formats]
+
+
+def _targets(
+    output_formats: tuple[OutputFormat, ...],
+    update_files: tuple[str, ...],
+    update_between: tuple[tuple[str, str], ...],
+) -> list[tuple[OutputFormat, Path | None, tuple[str | None, str | None]]]:
+    """Pair each output format with the file it updates (if any) and the marks to update it between."""
+    if not output_formats:
+        raise click.UsageError("Missing option '--output-format' / '-f'.")
+
+    if update_files and len(update_files) != len(output_formats):
+        raise click.UsageError("Each '--output-format' needs its own '--update' file when '--update' is used.")
+
+    if update_files and len(update_between) > len(update_files):
+        raise click.UsageError("There are more '--between' options than '--update' files.")
+
+    return [
+        (
+            output_format,
+            Path(update_files[index]) if update_files else None,
+            update_between[index] if index < len(update_between) else (None, None),
+        )
+        for index, output_format in enumerate(output_formats)
+    ]
+
+
+def _update_file(
+    update_file: Path,
+    update_between: tuple[str | None, str | None],
+    rendered_doc: str | Iterable[str],
+    check: bool = False,
+) -> bool:
+    """Write the rendered documentation into the file, unless the content would not change.
 
-    if class_path is None:
-        class_path = tuple()
+    Returns:
+        `True` if the file was already up-to-date. In the `check` mode, the file is never written and
+        a unified diff of the expected changes is printed instead.
+    """
+    from settings_doc import updating  # pylint: disable=import-outside-toplevel
 
-    if templates is None:
-        templates = tuple()
+    return updating.update_regions(update_file, [(update_between, rendered_doc)], check)
 
-    settings: dict[type[BaseSettings], None] = importing.import_class_path(class_path)
-    settings.update(importing.import_module_path(module_path))
 
-    if not settings:
-        raise ValueError("No sources of data were found.")
+def _print_chunks(chunks: Iterable[str]) -> None:
+    """Print the document to STDOUT chunk by chunk, as `print()` would print it at once."""
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
 
-    fields = itertools.chain.from_iterable(_model_fields(cls) for cls in settings)
-    classes: dict[type[BaseSettings], list[FieldInfo]] = {cls: list(cls.model_fields.values()) for cls in settings}
 
-    env = Environment(
-        loader=FileSystemLoader(templates + (TEMPLATES_FOLDER,)),
-        autoescape=select_autoescape(),
-        trim_blocks=True,
-        lstrip_blocks=True,
-        keep_trailing_newline=True,
-    )
-    env.globals.update(JINJA_ENV_GLOBALS)
+def _write_outputs(
+    outputs: Sequence[tuple[Path | None, tuple[str | None, str | None], str | Iterable[str]]], check: bool = False
+) -> bool:
+    """Print outputs without a file to STDOUT in order and write the others, updating each file at once.
 
-    return get_template(env, output_format).render(
-        heading_offset=heading_offset,
-        fields=fields,
-        classes=classes,
+    Returns:
+        `True` if all updated files were already up-to-date.
+    """
+    from settings_doc import updating  # pylint: disable=import-outside-toplevel
+
+    updates: dict[Path, list[tuple[tuple[str | None, str | None], str | Iterable[str]]]] = {}
+
+    for update_file, update_between, rendered_doc in outputs:
+        if update_file is None:
+            _print_chunks((rendered_doc,) if isinstance(rendered_doc, str) else rendered_doc)
+        else:
+            updates.setdefault(Path(os.path.realpath(update_file)), []).append((update_between, rendered_doc))
+
+    up_to_date = True
+    for update_file, file_updates in updates.items():
+        up_to_date &= updating.update_regions(update_file, file_updates, check)
+
+    return up_to_date
+
+
+def _create_profile() -> Profile:
+    from settings_doc.profiling import Profile  # pylint: disable=import-outside-toplevel
+
+    return Profile()
+
+
+def _create_isolation(timeout: float, memory_limit: int | None) -> Isolation:
+    from settings_doc.isolated_importing import Isolation  # pylint: disable=import-outside-toplevel
+
+    return Isolation(timeout, memory_limit)
+
+
+def _discover_modules(  # pylint: disable=too-many-arguments
+    packages: tuple[str, ...],
+    *,
+    cache_dir: Path | None = None,
+    static: bool = False,
+    jobs: int = 1,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    isolation: Isolation | None = None,
+    profile: Profile | None = None,
+) -> tuple[str, ...]:
+    """Find modules of the packages defining settings classes, importing them the same way as their settings
+    later and indexing them in the cache folder. See `discovery.discover_modules()`."""
+    if not packages:
+        return ()
+
+    from settings_doc import discovery  # pylint: disable=import-outside-toplevel
+
+    with _phase(profile, "discover"):
+        return discovery.discover_modules(
+            packages, cache_dir, static=static, jobs=jobs, max_depth=max_depth, isolation=isolation
+        )
+
+
+def _render_job(
+    job: ManifestJob,
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]],
+    *,
+    cache: RenderCache | None = None,
+    bytecode_cache_dir: Path | None = None,
+    index: int = 1,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+) -> str:
+    """Render a single manifest job, sharing walked fields and Jinja environments with other jobs."""
+    try:
+        output_format = OutputFormat(job.output_format)
+    except ValueError as exc:
+        raise click.BadParameter(f"Job #{index}: unknown output format '{job.output_format}'.") from exc
+
+    cache_key = None
+
+    if cache is not None:
+        cache_key = cache.key(
+            output_format.value,
+            job.heading_offset,
+            job.module_path,
+            job.class_path,
+            template_folders=job.templates + (TEMPLATES_FOLDER,),
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+            static=job.static,
+        )
+        cached_doc = None if cache_key is None else cache.get(cache_key)
+        if cached_doc is not None:
+            return cached_doc
+
+    settings = _import_settings(job.module_path, job.class_path, job.static)
+    if not settings:
+        raise click.BadParameter(f"Job #{index}: no sources of data were found.")
+
+    rendered_doc = render_settings(
+        create_environment(job.templates, bytecode_cache_dir),
+        output_format,
+        settings,
+        job.heading_offset,
+        walked_fields=walked_fields,
+        max_depth=max_depth,
+        fail_on_conflicts=fail_on_conflicts,
     )
 
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, rendered_doc, model_sources(settings))
 
-@app.command()
-@click.option(
-    "--module",
-    "-m",
-    "module_path",
-    callback=importing.module_path_callback,
+    return rendered_doc
+
+
+def _run_manifest(
+    manifest_file: Path,
+    *,
+    cache_dir: Path | None = None,
+    check: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+) -> bool:
+    """Run all jobs from a manifest, sharing imports, walked fields and Jinja environments between them.
+
+    Jobs updating the same file are written into it at once, after all jobs are rendered.
+
+    Returns:
+        `True` if all updated files were already up-to-date.
+    """
+    jobs = load_manifest(manifest_file)
+    cache = None if cache_dir is None else RenderCache(cache_dir)
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]] = {}
+    outputs: list[tuple[Path | None, tuple[str | None, str | None], str]] = []
+
+    for index, job in enumerate(jobs, start=1):
+        if check and job.update_file is None:
+            continue
+
+        rendered_doc = _render_job(
+            job,
+            walked_fields,
+            cache=cache,
+            bytecode_cache_dir=bytecode_cache_dir,
+            index=index,
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+        )
+        outputs.append((job.update_file, job.update_between, rendered_doc))
+
+    return _write_outputs(outputs, check)
+
+
+_output_format_option = click.option(
+    "--output-format",
+    "-f",
+    "output_formats",
     multiple=True,
+    type=click.Choice([_.value for _ in OutputFormat.__members__.values()]),
+    callback=lambda ctx, param, value: tuple(OutputFormat[_.upper()] for _ in value),
+    help="Format of the output. Can be used more than once to render several formats from a single import "
+    "of the settings, each into its own '--update' file (in the same order) or one after another to STDOUT.",
+)
+
+
+@app.command(cls=options.ForwardableCommand)
+@options.module_option
+@options.package_option
+@options.class_option
+@_output_format_option
+@options.heading_offset_option
+@options.update_option
+@options.between_option
+@options.templates_option
+@click.option(
+    "--manifest",
+    "manifest_file",
     default=None,
-    help="Period-separated import path to a module that contains one or more subclasses"
-    "of `pydantic.BaseSettings`. All such sub-classes will be used to generate the output. "
-    "If that is undesirable, use the `--class` option to specify classes manually. "
-    "Must be importable from current working directory. Setting PYTHONPATH appropriately "
-    "may be required.",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True),
+    help="TOML file with a list of `[[job]]` tables, each describing one generation with the same keys "
+    "as the long options of this command. All jobs run in a single process, so each module is imported and "
+    "each settings class is walked only once. Cannot be combined with other options except '--cache-dir', "
+    "'--bytecode-cache-dir', '--check', '--max-depth' and '--fail-on-conflicts'.",
 )
 @click.option(
-    "--class",
-    "-c",
-    "class_path",
-    multiple=True,
+    "--cache-dir",
     default=None,
-    callback=importing.class_path_callback,
-    help="Period-separated import path to a subclass of `pydantic.BaseSettings`. "
-    "Must be importable from current working directory. Use `--module` instead to auto-discover "
-    "all such subclasses in a module. Setting PYTHONPATH appropriately may be required.",
+    is_flag=False,
+    flag_value=DEFAULT_CACHE_DIR,
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True, path_type=Path),
+    help=f"Cache rendered documents in this folder ('{DEFAULT_CACHE_DIR}' if no value is given). "
+    "Cached documents are reused without importing the settings modules until their source files, "
+    "the templates, the output format or the heading offset change.",
 )
 @click.option(
-    "--output-format",
-    "-f",
-    required=True,
-    type=click.Choice([_.value for _ in OutputFormat.__members__.values()]),
-    callback=lambda ctx, param, value: None if value is None else OutputFormat[value.upper()],
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Do not write the file given by '--update'. Instead, print a unified diff and exit with "
+    "a non-zero code if the file is not up-to-date. Useful in CI.",
 )
+@options.static_option
+@options.bytecode_cache_dir_option
 @click.option(
-    "--heading-offset",
-    type=int,
-    default=0,
-    callback=lambda ctx, param, value: (
-        value if value >= 0 else click.BadParameter("Value must be greater than or equal to 0.")
-    ),
-    help="How nested should be the top level heading generated.",
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Import modules given by '--module' in up to this many worker processes. Each worker sends back "
+    "only a description of the settings fields, so the modules are never imported by the main process. "
+    "With '--isolated-import', this many child processes run at once. Has no effect with '--static'.",
 )
+@options.isolated_import_option
+@options.import_timeout_option
+@options.import_memory_limit_option
+@options.max_depth_option
+@options.fail_on_conflicts_option
 @click.option(
-    "--update",
-    "-u",
-    "update_file",
-    default=None,
-    type=click.Path(exists=True, writable=True, file_okay=True, dir_okay=False, resolve_path=True),
-    help="Overwrite given file instead of writing to STDOUT. An error is raised if the "
-    "file doesn't exist or is not writable. Combine this flag with the '--between' "
-    "flag to update only a section of a file. ",
+    "--from-snapshot",
+    "snapshot_files",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True, path_type=Path),
+    help="JSON snapshot of settings classes, written by '--output-format json', to render without importing "
+    "any settings modules. Can be used more than once and combined with '--module' and '--class'.",
 )
 @click.option(
-    "--between",
-    "update_between",
-    default=(None, None),
-    type=(str, str),
-    help="Update file given by '--update' between these two strings. New line after "
-    "the start mark/before the end mark is considered part of the pattern (if present). "
-    "Without the '--update' flag, this has no effect. ",
+    "--profile",
+    "profile_run",
+    is_flag=True,
+    default=False,
+    help="Report the wall time and the peak memory of each phase of the generation and the import time of each "
+    "module given by '--module' and '--class' to STDERR.",
 )
 @click.option(
-    "--templates",
-    default=None,
-    type=click.Path(exists=True, writable=True, file_okay=False, dir_okay=True, resolve_path=True),
-    multiple=True,
-    help="Folder to use when looking up templates for generating output. Can be used "
-    "more than once, in a priority order. Built-in templates will be used last if no "
-    "matches found.",
+    "--profile-output",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Format of the '--profile' report. Without '--profile', this has no effect.",
 )
-def generate(
+@options.daemon_socket_option
+def generate(  # pylint: disable=too-many-arguments
+    *,
     module_path: tuple[str, ...] | None,
+    packages: tuple[str, ...],
     class_path: tuple[str, ...] | None,
-    output_format: OutputFormat,
+    output_formats: tuple[OutputFormat, ...],
     heading_offset: int,
-    update_file: Path | None,
-    update_between: tuple[str | None, str | None],
+    update_files: tuple[str, ...],
+    update_between: tuple[tuple[str, str], ...],
     templates: tuple[Path, ...] | None,
+    manifest_file: Path | None,
+    cache_dir: Path | None,
+    check: bool,
+    static: bool,
+    bytecode_cache_dir: Path | None,
+    jobs: int,
+    isolated_import: bool,
+    import_timeout: float,
+    import_memory_limit: int | None,
+    max_depth: int,
+    fail_on_conflicts: bool,
+    snapshot_files: tuple[Path, ...],
+    profile_run: bool,
+    profile_output: str,
 ):
     """Formats `pydantic.BaseSettings` into various formats. By default, the output is to STDOUT."""
+    if manifest_file is not None:
+        ctx = click.get_current_context()
+        conflicting = [
+            f"'{param.opts[0]}'"
+            for param in ctx.command.params
+            if param.name
+            not in (
+                None,
+                "manifest_file",
+                "cache_dir",
+                "check",
+                "bytecode_cache_dir",
+                "max_depth",
+                "fail_on_conflicts",
+                "daemon_socket",
+            )
+            and ctx.get_parameter_source(str(param.name)) is ParameterSource.COMMANDLINE
+        ]
+        if conflicting:
+            raise click.UsageError(f"The '--manifest' option cannot be combined with {', '.join(conflicting)}.")
+
+        up_to_date = _run_manifest(
+            manifest_file,
+            cache_dir=cache_dir,
+            check=check,
+            bytecode_cache_dir=bytecode_cache_dir,
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+        )
+        if not up_to_date and check:
+            ctx.exit(1)
+        return
+
+    targets = _targets(output_formats, update_files, update_between)
+
+    if check and not update_files:
+        raise click.UsageError("The '--check' option requires '--update'.")
+
+    profile = _create_profile() if profile_run else None
+    isolation = _create_isolation(import_timeout, import_memory_limit) if isolated_import else None
+    module_path = tuple(module_path or ()) + _discover_modules(
+        packages,
+        cache_dir=cache_dir,
+        static=static,
+        jobs=jobs,
+        max_depth=max_depth,
+        isolation=isolation,
+        profile=profile,
+    )
+
     try:
-        rendered_doc = render(output_format, module_path, class_path, heading_offset, templates)
+        rendered_docs = _stream_many(
+            output_formats,
+            module_path=module_path,
+            class_path=class_path,
+            heading_offset=heading_offset,
+            templates=templates,
+            cache_dir=cache_dir,
+            static=static,
+            bytecode_cache_dir=bytecode_cache_dir,
+            jobs=jobs,
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+            snapshot_files=snapshot_files,
+            profile=profile,
+            isolation=isolation,
+        )
     except ValueError as exc:
-        click.secho(str(exc) + " Check the '--module' or '--class' options.", fg="red", err=True)
+        click.secho(str(exc) + " Check the '--module', '--class' or '--from-snapshot' options.", fg="red", err=True)
         raise click.Abort() from exc
 
-    if update_file is None:
-        print(rendered_doc)
-        return
+    with _phase(profile, "write"):
+        up_to_date = _write_outputs(
+            [
+                (update_file, between, rendered_doc)
+                for (_, update_file, between), rendered_doc in zip(targets, rendered_docs)
+            ],
+            check,
+        )
 
-    with open(update_file, encoding="utf-8") as file:
-        content = file.read()
+    if profile is not None:
+        click.echo(profile.as_json() if profile_output == "json" else profile.as_text(), err=True)
 
-    with open(update_file, "w", encoding="utf-8") as file:
-        if update_between[0] and update_between[1]:
-            pattern = re.compile(f"({re.escape(update_between[0])}\n?).*(\n?{re.escape(update_between[1])})", re.DOTALL)
+    if not up_to_date and check:
+        click.get_current_context().exit(1)
 
-            if pattern.search(content) is None:
-                click.secho(
-                    f"Boundary marks '{update_between[0]}' and '{update_between[1]}' not found in '{update_file}'. "
-                    f"Cannot update the content.",
-                    fg="red",
-                    err=True,
-                )
-                raise click.Abort()
 
-            new_content = pattern.sub(f"\\1{rendered_doc}\\2", content, count=1)
+@app.command()
+@options.module_option
+@options.package_option
+@options.class_option
+@_output_format_option
+@options.heading_offset_option
+@options.update_option
+@options.between_option
+@options.templates_option
+@click.option(
+    "--manifest",
+    "manifest_file",
+    default=None,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True),
+    help="TOML file with a list of `[[job]]` tables, as accepted by 'generate --manifest'. Cannot be combined "
+    "with other options except '--interval', '--max-depth' and '--fail-on-conflicts'.",
+)
+@options.static_option
+@options.max_depth_option
+@options.fail_on_conflicts_option
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.1,
+    show_default=True,
+    help="How often to check the watched files for changes, in seconds.",
+)
+def watch(  # pylint: disable=too-many-arguments
+    *,
+    module_path: tuple[str, ...],
+    packages: tuple[str, ...],
+    class_path: tuple[str, ...],
+    output_formats: tuple[OutputFormat, ...],
+    heading_offset: int,
+    update_files: tuple[str, ...],
+    update_between: tuple[tuple[str, str], ...],
+    templates: tuple[str, ...],
+    manifest_file: Path | None,
+    static: bool,
+    max_depth: int,
+    fail_on_conflicts: bool,
+    interval: float,
+):
+    """Same as `generate`, but re-generates the output whenever the source files of the settings modules or
+    the templates change. Only the changed modules are reloaded and only the affected outputs re-generated."""
+    ctx = click.get_current_context()
+
+    if manifest_file is not None:
+        conflicting = [
+            f"'{param.opts[0]}'"
+            for param in ctx.command.params
+            if param.name not in (None, "manifest_file", "interval", "max_depth", "fail_on_conflicts")
+            and ctx.get_parameter_source(str(param.name)) is ParameterSource.COMMANDLINE
+        ]
+        if conflicting:
+            raise click.UsageError(f"The '--manifest' option cannot be combined with {', '.join(conflicting)}.")
+        jobs = load_manifest(manifest_file)
+    else:
+        targets = _targets(output_formats, update_files, update_between)
+        module_path += _discover_modules(packages, static=static, max_depth=max_depth)
+        if not module_path and not class_path:
+            raise click.UsageError("No sources of data were specified. Check the '--module' or '--class' options.")
+        jobs = [
+            ManifestJob(
+                output_format=output_format.value,
+                module_path=tuple(module_path),
+                class_path=tuple(class_path),
+                heading_offset=heading_offset,
+                update_file=update_file,
+                update_between=between,
+                templates=tuple(Path(template) for template in templates),
+                static=static,
+            )
+            for output_format, update_file, between in targets
+        ]
+
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]] = {}
+
+    def _output(job: ManifestJob) -> None:
+        rendered_doc = _render_job(
+            job, walked_fields, index=jobs.index(job) + 1, max_depth=max_depth, fail_on_conflicts=fail_on_conflicts
+        )
+        if job.update_file is None:
+            print(rendered_doc)
         else:
-            new_content = rendered_doc
+            _update_file(job.update_file, job.update_between, rendered_doc)
+
+    from settings_doc import watching  # pylint: disable=import-outside-toplevel
+
+    watching.watch(jobs, _output, interval)
+
+
+@app.command("daemon")
+@click.option(
+    "--socket",
+    "socket_path",
+    default=DEFAULT_DAEMON_SOCKET,
+    show_default=True,
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=Path),
+    help="Unix socket to listen on.",
+)
+def run_daemon(socket_path: Path):
+    """Serves 'generate --daemon-socket' requests from the current working directory, keeping the settings modules
+    imported and the templates compiled between them. Modules are reloaded when their source files change."""
+    if sys.platform == "win32":
+        raise click.UsageError("Unix sockets are not supported on Windows.")
+
+    from settings_doc.daemon import Daemon  # pylint: disable=import-outside-toplevel
 
-        file.write(new_content)
+    server = Daemon(app)
+    click.echo(f"Listening on '{socket_path}'. Press Ctrl+C to stop.", err=True)
+    try:
+        server.serve(socket_path)
+    except KeyboardInterrupt:
+        pass
 
 
 @app.command("templates")
@@ -233,10 +802,40 @@ def generate(
     type=click.Path(exists=True, writable=True, file_okay=False, dir_okay=True, resolve_path=True),
     help="Output folder. Any existing templates with the same names with be overwritten.",
 )
-def manipulate_templates(copy_to: Path):
-    """Copies built-in Jinja2 templates into a folder for modifying."""
-    for file in listdir(TEMPLATES_FOLDER):
-        shutil.copy2(TEMPLATES_FOLDER / file, copy_to)
+@click.option(
+    "--compile",
+    "compile_templates",
+    is_flag=True,
+    default=False,
+    help="Compile the built-in templates and templates in '--templates' folders into the bytecode cache, "
+    "so that the first 'generate' run with the same '--bytecode-cache-dir' doesn't have to.",
+)
+@click.option(
+    "--templates",
+    default=None,
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path),
+    multiple=True,
+    help="Folder with custom templates to compile together with the built-in ones. Can be used more than once.",
+)
+@options.bytecode_cache_dir_option
+def manipulate_templates(
+    copy_to: Path | None, compile_templates: bool, templates: tuple[Path, ...], bytecode_cache_dir: Path | None
+):
+    """Copies built-in Jinja2 templates into a folder for modifying or precompiles templates."""
+    if copy_to is not None:
+        for file in listdir(TEMPLATES_FOLDER):
+            shutil.copy2(TEMPLATES_FOLDER / file, copy_to)
+
+    if compile_templates:
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = Path(DEFAULT_BYTECODE_CACHE_DIR).resolve()
+
+        env = create_environment(tuple(templates), bytecode_cache_dir)
+        template_names = env.list_templates(extensions=["jinja"])
+        for template_name in template_names:
+            env.get_template(template_name)
+
+        click.echo(f"Compiled {len(template_names)} templates into '{bytecode_cache_dir}'.")
 
 
 if __name__ == "__main__":
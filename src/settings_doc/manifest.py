@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import click
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+_KNOWN_KEYS = frozenset(
+    {"module", "class", "output-format", "heading-offset", "update", "between", "templates", "static"}
+)
+
+
+@dataclass(frozen=True)
+class ManifestJob:
+    """A single `generate` invocation described in a manifest file."""
+
+    output_format: str
+    module_path: tuple[str, ...] = ()
+    class_path: tuple[str, ...] = ()
+    heading_offset: int = 0
+    update_file: Path | None = None
+    update_between: tuple[str | None, str | None] = (None, None)
+    templates: tuple[Path, ...] = ()
+    static: bool = False
+
+
+def _as_str_tuple(value: Any, key: str, index: int) -> tuple[str, ...]:
+    if isinstance(value, str):
+        return (value,)
+
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return tuple(value)
+
+    raise click.BadParameter(f"Job #{index}: '{key}' must be a string or a list of strings.")
+
+
+def _resolve_path(root: Path, value: str) -> Path:
+    path = Path(value)
+    return path if path.is_absolute() else (root / path).resolve()
+
+
+def _parse_job(raw_job: dict[str, Any], root: Path, index: int) -> ManifestJob:
+    unknown_keys = set(raw_job) - _KNOWN_KEYS
+    if unknown_keys:
+        raise click.BadParameter(f"Job #{index}: unknown keys {', '.join(sorted(unknown_keys))}.")
+
+    if "output-format" not in raw_job:
+        raise click.BadParameter(f"Job #{index}: 'output-format' is required.")
+
+    module_path = _as_str_tuple(raw_job.get("module", []), "module", index)
+    class_path = _as_str_tuple(raw_job.get("class", []), "class", index)
+
+    if not module_path and not class_path:
+        raise click.BadParameter(f"Job #{index}: at least one of 'module' or 'class' is required.")
+
+    heading_offset = raw_job.get("heading-offset", 0)
+    if not isinstance(heading_offset, int) or heading_offset < 0:
+        raise click.BadParameter(f"Job #{index}: 'heading-offset' must be an integer greater than or equal to 0.")
+
+    update_file = None
+    if "update" in raw_job:
+        update_file = _resolve_path(root, raw_job["update"])
+        if not update_file.is_file():
+            raise click.BadParameter(f"Job #{index}: file '{update_file}' does not exist.")
+
+    update_between: tuple[str | None, str | None] = (None, None)
+    if "between" in raw_job:
+        between = _as_str_tuple(raw_job["between"], "between", index)
+        if len(between) != 2:
+            raise click.BadParameter(f"Job #{index}: 'between' must be a list of exactly two strings.")
+        update_between = (between[0], between[1])
+
+    templates = _as_str_tuple(raw_job.get("templates", []), "templates", index)
+
+    static = raw_job.get("static", False)
+    if not isinstance(static, bool):
+        raise click.BadParameter(f"Job #{index}: 'static' must be a boolean.")
+
+    return ManifestJob(
+        output_format=raw_job["output-format"],
+        module_path=module_path,
+        class_path=class_path,
+        heading_offset=heading_offset,
+        update_file=update_file,
+        update_between=update_between,
+        templates=tuple(_resolve_path(root, template) for template in templates),
+        static=static,
+    )
+
+
+def load_manifest(manifest_file: Path) -> list[ManifestJob]:
+    """Load generation jobs from a TOML manifest file.
+
+    Each job is a `[[job]]` table using the same keys as the long `generate` command line options
+    (without the leading dashes). Relative paths are resolved against the folder of the manifest.
+    """
+    try:
+        with open(manifest_file, "rb") as file:
+            content = tomllib.load(file)
+    except tomllib.TOMLDecodeError as exc:
+        raise click.BadParameter(f"Cannot parse the manifest: {exc}") from exc
+
+    raw_jobs = content.get("job", [])
+    if not isinstance(raw_jobs, list) or not raw_jobs:
+        raise click.BadParameter("The manifest must contain at least one `[[job]]` table.")
+
+    root = Path(manifest_file).parent
+    return [_parse_job(raw_job, root, index) for index, raw_job in enumerate(raw_jobs, start=1)]
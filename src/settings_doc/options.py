@@ -0,0 +1,186 @@
+"""Options shared by the commands of the command-line interface."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Final
+
+import click
+
+from settings_doc.cache import DEFAULT_BYTECODE_CACHE_DIR, DEFAULT_CACHE_DIR, DEFAULT_DAEMON_SOCKET
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+
+RAW_ARGS_KEY: Final[str] = "settings_doc.raw_args"
+
+
+class ForwardableCommand(click.Command):
+    """A command keeping its raw command-line arguments in `ctx.meta`, so that '--daemon-socket' can forward them."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        ctx.meta[RAW_ARGS_KEY] = list(args)
+        return super().parse_args(ctx, args)
+
+
+module_option = click.option(
+    "--module",
+    "-m",
+    "module_path",
+    multiple=True,
+    default=None,
+    help="Period-separated import path to a module that contains one or more subclasses"
+    "of `pydantic.BaseSettings`. All such sub-classes will be used to generate the output. "
+    "If that is undesirable, use the `--class` option to specify classes manually. "
+    "Must be importable from current working directory. Setting PYTHONPATH appropriately "
+    "may be required.",
+)
+
+
+package_option = click.option(
+    "--package",
+    "packages",
+    multiple=True,
+    help="Period-separated import path to a package. All its (nested) modules defining subclasses of "
+    "`pydantic.BaseSettings` are used as if given by '--module'. Which modules define them is kept in an index "
+    f"in the '--cache-dir' folder ('{DEFAULT_CACHE_DIR}' by default), so that later runs import only those.",
+)
+
+
+class_option = click.option(
+    "--class",
+    "-c",
+    "class_path",
+    multiple=True,
+    default=None,
+    help="Period-separated import path to a subclass of `pydantic.BaseSettings`. "
+    "Must be importable from current working directory. Use `--module` instead to auto-discover "
+    "all such subclasses in a module. Setting PYTHONPATH appropriately may be required.",
+)
+
+
+heading_offset_option = click.option(
+    "--heading-offset",
+    type=int,
+    default=0,
+    callback=lambda ctx, param, value: (
+        value if value >= 0 else click.BadParameter("Value must be greater than or equal to 0.")
+    ),
+    help="How nested should be the top level heading generated.",
+)
+
+
+update_option = click.option(
+    "--update",
+    "-u",
+    "update_files",
+    multiple=True,
+    type=click.Path(exists=True, writable=True, file_okay=True, dir_okay=False, resolve_path=True),
+    help="Overwrite given file instead of writing to STDOUT. An error is raised if the "
+    "file doesn't exist or is not writable. Combine this flag with the '--between' "
+    "flag to update only a section of a file. With several '--output-format' options, "
+    "give one file for each of them. ",
+)
+
+
+between_option = click.option(
+    "--between",
+    "update_between",
+    multiple=True,
+    type=(str, str),
+    help="Update file given by '--update' between these two strings. New line after "
+    "the start mark/before the end mark is considered part of the pattern (if present). "
+    "Without the '--update' flag, this has no effect. With several '--update' files, the n-th "
+    "'--between' applies to the n-th file and files without one are overwritten entirely. ",
+)
+
+
+templates_option = click.option(
+    "--templates",
+    default=None,
+    type=click.Path(exists=True, writable=True, file_okay=False, dir_okay=True, resolve_path=True),
+    multiple=True,
+    help="Folder to use when looking up templates for generating output. Can be used "
+    "more than once, in a priority order. Built-in templates will be used last if no "
+    "matches found.",
+)
+
+
+static_option = click.option(
+    "--static",
+    is_flag=True,
+    default=False,
+    help="Re-create settings classes from the source code of '--module'/'--class' without importing it, "
+    "so that no application code runs. Classes that cannot be resolved statically are imported as usual.",
+)
+
+
+bytecode_cache_dir_option = click.option(
+    "--bytecode-cache-dir",
+    default=None,
+    is_flag=False,
+    flag_value=DEFAULT_BYTECODE_CACHE_DIR,
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True, path_type=Path),
+    help=f"Store compiled templates in this folder ('{DEFAULT_BYTECODE_CACHE_DIR}' if no value is given) "
+    "and reuse them in later runs. Templates are recompiled automatically when they change.",
+)
+max_depth_option = click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_DEPTH,
+    show_default=True,
+    help="Fail if nested models are nested deeper than this. Models containing themselves always fail.",
+)
+fail_on_conflicts_option = click.option(
+    "--fail-on-conflicts",
+    is_flag=True,
+    default=False,
+    help="Fail if several classes define the same environment variable differently, instead of documenting "
+    "all the definitions with a warning. Identical definitions are always documented only once.",
+)
+isolated_import_option = click.option(
+    "--isolated-import",
+    is_flag=True,
+    default=False,
+    help="Import each module given by '--module' and '--class' in its own child process, limited by "
+    "'--import-timeout' and '--import-memory-limit'. Only a description of the settings fields is sent back, "
+    "so the modules are never imported by the main process. Has no effect with '--static'.",
+)
+import_timeout_option = click.option(
+    "--import-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=60.0,
+    show_default=True,
+    help="Seconds after which an import with '--isolated-import' is aborted.",
+)
+import_memory_limit_option = click.option(
+    "--import-memory-limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Limit of the address space, in MiB, of each child process importing a module with '--isolated-import'. "
+    "Not supported on Windows.",
+)
+
+
+def _forward_to_daemon(ctx: click.Context, _: click.Parameter, value: Path | None) -> None:
+    if value is not None:
+        if sys.platform == "win32":
+            raise click.BadParameter("Unix sockets are not supported on Windows.")
+
+        from settings_doc import daemon  # pylint: disable=import-outside-toplevel,cyclic-import
+
+        daemon.forward_command(ctx, value)
+
+
+daemon_socket_option = click.option(
+    "--daemon-socket",
+    default=None,
+    is_flag=False,
+    flag_value=DEFAULT_DAEMON_SOCKET,
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=Path),
+    is_eager=True,
+    expose_value=False,
+    callback=_forward_to_daemon,
+    help=f"Forward the generation to 'settings-doc daemon' listening on this Unix socket ('{DEFAULT_DAEMON_SOCKET}' "
+    "if no value is given), which keeps the settings modules imported and the templates compiled between runs. "
+    "Without a daemon listening, the output is generated by this process.",
+)
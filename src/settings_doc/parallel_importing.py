@@ -0,0 +1,252 @@
+"""Import settings modules in a pool of worker processes.
+
+Each worker imports a module, walks its settings classes and sends back a description of the fields made only
+of plain Python values. The parent process re-creates stand-ins of the settings classes and their fields from
+these descriptions, so that the templates can render them without the settings modules ever being imported
+in the parent process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Iterable, Literal, Mapping, Sequence, cast
+
+import click
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+from pydantic_settings import BaseSettings
+
+from settings_doc import importing
+from settings_doc.template_functions import _fix_str_enum_value, _is_enum, _is_typing_literal
+
+_PLAIN_SCALARS = (type(None), bool, int, float, str)
+_PLAIN_COLLECTIONS = (list, tuple, set, frozenset)
+
+
+@dataclass(frozen=True)
+class FieldDescription:
+    """Everything the templates need to know about a field, as plain Python values."""
+
+    required: bool
+    has_default: bool
+    default: Any
+    description: str | None
+    examples: list[Any] | None
+    json_schema_extra: dict[str, Any] | None
+    possible_values: tuple[Any, ...] | None
+    annotation: type | None
+
+
+@dataclass(frozen=True)
+class ClassDescription:
+    module: str
+    qualname: str
+    doc: str | None
+    model_config: dict[str, Any]
+    model_fields: dict[str, int]
+    """Indexes into `ModuleDescription.fields` of the fields declared directly on the class."""
+    env_fields: list[tuple[str, int]]
+    """Environment variable names and indexes into `ModuleDescription.fields` of all (nested) fields."""
+
+
+@dataclass(frozen=True)
+class ModuleDescription:
+    fields: list[FieldDescription]
+    classes: list[ClassDescription]
+
+
+def _plain(value: Any) -> Any:
+    """Convert a value into one that can be unpickled without importing the module that defined it."""
+    value = _fix_str_enum_value(value)
+
+    if type(value) in _PLAIN_SCALARS:
+        return value
+
+    if type(value) in _PLAIN_COLLECTIONS:
+        return type(value)(_plain(item) for item in value)
+
+    if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {_plain(key): _plain(item) for key, item in value.items()}
+
+    return str(value)
+
+
+def _describe_field(field: FieldInfo) -> FieldDescription:
+    possible_values = None
+    if _is_typing_literal(field):
+        possible_values = tuple(_plain(value) for value in field.annotation.__args__)  # type: ignore[union-attr]
+    elif _is_enum(field):
+        possible_values = tuple(_plain(member.value) for member in field.annotation)  # type: ignore[union-attr]
+
+    annotation = field.annotation
+    if not isinstance(annotation, type) or annotation.__module__ != "builtins":
+        annotation = None
+
+    has_default = field.default is not PydanticUndefined
+
+    return FieldDescription(
+        required=field.is_required(),
+        has_default=has_default,
+        default=_plain(field.default) if has_default else None,
+        description=field.description,
+        examples=_plain(field.examples),
+        json_schema_extra=_plain(field.json_schema_extra) if isinstance(field.json_schema_extra, dict) else None,
+        possible_values=possible_values,
+        annotation=annotation,
+    )
+
+
+def describe_settings(settings: Mapping[type[BaseSettings], Iterable[tuple[str, FieldInfo]]]) -> ModuleDescription:
+    """Describe settings classes and their (nested) fields with environment variable names.
+
+    Fields shared by several classes, or under several names, are described only once.
+    """
+    fields: list[FieldDescription] = []
+    field_indexes: dict[int, int] = {}
+
+    def _index(field: FieldInfo) -> int:
+        if id(field) not in field_indexes:
+            field_indexes[id(field)] = len(fields)
+            fields.append(_describe_field(field))
+        return field_indexes[id(field)]
+
+    classes = [
+        ClassDescription(
+            module=cls.__module__,
+            qualname=cls.__qualname__,
+            doc=cls.__doc__,
+            model_config=_plain(dict(cls.model_config)),
+            model_fields={name: _index(field) for name, field in cls.model_fields.items()},
+            env_fields=[(env_name, _index(field)) for env_name, field in env_fields],
+        )
+        for cls, env_fields in settings.items()
+    ]
+
+    return ModuleDescription(fields=fields, classes=classes)
+
+
+def describe_module(module_path: str, max_depth: int) -> ModuleDescription | str:
+    """Import a module and describe its settings classes. Runs in a worker process.
+
+    Returns:
+        The description or an error message if the module cannot be imported or its classes walked.
+    """
+    from settings_doc.streaming import model_fields  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    try:
+        settings = importing.module_settings(importing.import_module(module_path), module_path)
+        return describe_settings({cls: model_fields(cls, max_depth) for cls in settings})
+    except click.BadParameter as exc:
+        return exc.message
+
+
+def _no_default() -> None:
+    """Stands in for a `default_factory` that was not called in the worker process."""
+
+
+def _create_field(description: FieldDescription) -> FieldInfo:
+    annotation: Any = description.annotation
+    if description.possible_values:
+        try:
+            annotation = Literal[description.possible_values]
+        except TypeError:  # Unhashable values
+            annotation = None
+
+    kwargs: dict[str, Any] = {}
+    if description.has_default:
+        kwargs["default"] = description.default
+    elif not description.required:
+        kwargs["default_factory"] = _no_default
+
+    return FieldInfo(
+        annotation=annotation,
+        description=description.description,
+        examples=description.examples,
+        json_schema_extra=description.json_schema_extra,
+        **kwargs,
+    )
+
+
+def create_classes(description: ModuleDescription) -> dict[type[BaseSettings], list[tuple[str, FieldInfo]]]:
+    """Re-create stand-ins of described settings classes.
+
+    Returns:
+        Stand-ins of the settings classes mapped to their (nested) fields with environment variable names.
+    """
+    fields = [_create_field(field) for field in description.fields]
+    classes: dict[type[BaseSettings], list[tuple[str, FieldInfo]]] = {}
+
+    for class_description in description.classes:
+        cls = type(
+            class_description.qualname.rsplit(".", maxsplit=1)[-1],
+            (),
+            {
+                "__module__": class_description.module,
+                "__qualname__": class_description.qualname,
+                "__doc__": class_description.doc,
+                "model_config": class_description.model_config,
+                "model_fields": {name: fields[index] for name, index in class_description.model_fields.items()},
+            },
+        )
+        classes[cast("type[BaseSettings]", cls)] = [
+            (env_name, fields[index]) for env_name, index in class_description.env_fields
+        ]
+
+    return classes
+
+
+@lru_cache
+def import_module_path(
+    module_paths: tuple[str, ...], jobs: int, max_depth: int
+) -> dict[type[BaseSettings], list[tuple[str, FieldInfo]]]:
+    """Import modules in up to `jobs` worker processes and re-create their settings classes.
+
+    Returns:
+        Stand-ins of the settings classes mapped to their (nested) fields with environment variable names.
+        The stand-ins carry `model_config` and `model_fields` but are not `BaseSettings` subclasses.
+    """
+    if not module_paths:
+        return {}
+
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(module_paths)), mp_context=context) as executor:
+        descriptions = list(executor.map(partial(describe_module, max_depth=max_depth), module_paths))
+
+    return create_module_settings(module_paths, descriptions)
+
+
+def create_module_settings(
+    module_paths: Sequence[str], descriptions: Sequence[ModuleDescription | str]
+) -> dict[type[BaseSettings], list[tuple[str, FieldInfo]]]:
+    """Re-create the settings classes of modules described by `describe_module()`, in the same order.
+
+    Raises:
+        click.BadParameter: If a module could not be described or none of them have any settings classes.
+    """
+    settings: dict[type[BaseSettings], list[tuple[str, FieldInfo]]] = {}
+
+    for module_path, description in zip(module_paths, descriptions):
+        if isinstance(description, str):
+            raise click.BadParameter(description, param_hint=importing.MODULE_PARAM_HINT)
+
+        if not description.classes:
+            if len(module_paths) > 1:
+                click.secho(importing.MODULE_ERROR_MSG.format(module_path=module_path), fg="yellow", err=True)
+        else:
+            settings.update(create_classes(description))
+
+    if not settings:
+        raise click.BadParameter(
+            (
+                importing.MODULE_ERROR_MSG.format(module_path=module_paths[0])
+                if len(module_paths) == 1
+                else "No `pydantic.BaseSettings` subclasses found in any of the modules."
+            ),
+            param_hint=importing.MODULE_PARAM_HINT,
+        )
+
+    return settings
@@ -0,0 +1,89 @@
+"""Wall time and peak memory of the phases of a `generate` run, reported by its `--profile` option."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, NamedTuple
+
+_MEBIBYTE = 1024 * 1024
+
+
+class PhaseRecord(NamedTuple):
+    name: str
+    seconds: float
+    peak_memory_bytes: int
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    seconds: float
+
+
+class Profile:
+    """Collects the wall time and the `tracemalloc` peak of each phase and the import time of each module.
+
+    Phases must not be nested. Memory allocations are traced only during a phase, so its peak memory is that
+    of the objects allocated in it. The tracing slows down allocations, which is included in the wall times.
+    """
+
+    def __init__(self) -> None:
+        self.phases: list[PhaseRecord] = []
+        self.imports: list[ImportRecord] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.phases.append(PhaseRecord(name, seconds, peak_memory))
+
+    def import_modules(self, module_paths: Iterable[str]) -> None:
+        """Import modules one by one, recording how long each took including the modules it imported first.
+
+        Modules imported already take no time. Modules failing to import are skipped, so that the error is
+        reported by the regular import.
+        """
+        for module_path in dict.fromkeys(module_paths):
+            started = time.perf_counter()
+            try:
+                importlib.import_module(module_path)
+            except Exception:  # pylint: disable=broad-exception-caught
+                sys.modules.pop(module_path, None)
+                continue
+            self.imports.append(ImportRecord(module_path, time.perf_counter() - started))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "phases": [phase._asdict() for phase in self.phases],
+            "imports": [record._asdict() for record in self.imports],
+        }
+
+    def as_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def as_text(self) -> str:
+        name_width = max([len("Phase")] + [len(record.module) for record in self.imports])
+        name_width = max([name_width] + [len(phase.name) for phase in self.phases])
+
+        lines = [f"{'Phase':<{name_width}}  {'Seconds':>9}  {'Peak MiB':>9}"]
+        lines.extend(
+            f"{phase.name:<{name_width}}  {phase.seconds:>9.4f}  {phase.peak_memory_bytes / _MEBIBYTE:>9.2f}"
+            for phase in self.phases
+        )
+
+        if self.imports:
+            lines.append("")
+            lines.append(f"{'Module':<{name_width}}  {'Seconds':>9}")
+            lines.extend(f"{record.module:<{name_width}}  {record.seconds:>9.4f}" for record in self.imports)
+
+        return "\n".join(lines)
@@ -0,0 +1,139 @@
+"""A reusable renderer for applications rendering documentation repeatedly, for example on request."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from settings_doc.streaming import OutputFormat, build_environment, collect_entries, stream_entries
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+
+if TYPE_CHECKING:
+    from pydantic_settings import BaseSettings
+
+    from settings_doc.entries import SettingEntry
+
+
+class Renderer:
+    """Renders the settings documentation, keeping compiled templates and walked settings classes between renders.
+
+    Settings classes can be given directly or as import paths. Each class is walked only once and each import path
+    resolved only once per renderer, until they are invalidated. Templates are compiled on first use and recompiled
+    when they change on disk or are invalidated.
+
+    A renderer can be used from several threads at once. Concurrent renders of a class that was not walked yet may
+    each walk it, but only one of the results is kept.
+
+    Args:
+        templates: Folders to look up templates in, in a priority order, before the built-in templates.
+        bytecode_cache_dir: Folder to store compiled templates in for reuse by other processes.
+        max_depth: How deep nested models are walked. See `settings_doc.render()`.
+        fail_on_conflicts: Whether differing definitions of the same environment variable raise
+            `click.BadParameter`. See `settings_doc.render()`.
+    """
+
+    def __init__(
+        self,
+        templates: Iterable[Path] = (),
+        bytecode_cache_dir: Path | None = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        fail_on_conflicts: bool = False,
+    ):
+        self.max_depth = max_depth
+        self.fail_on_conflicts = fail_on_conflicts
+        self._env = build_environment(tuple(Path(folder) for folder in templates), bytecode_cache_dir)
+        self._lock = threading.Lock()
+        self._walked_fields: dict[type[BaseSettings], list[SettingEntry]] = {}
+        self._imported_settings: dict[tuple[str, ...], dict[type[BaseSettings], None]] = {}
+
+    def _import_settings(self, path_type: str, paths: tuple[str, ...]) -> dict[type[BaseSettings], None]:
+        from settings_doc import importing  # pylint: disable=import-outside-toplevel
+
+        key = (path_type,) + paths
+        with self._lock:
+            imported_settings = self._imported_settings.get(key)
+
+        if imported_settings is None:
+            importer = importing.import_class_path if path_type == "class" else importing.import_module_path
+            imported_settings = importer(paths)
+
+            with self._lock:
+                imported_settings = self._imported_settings.setdefault(key, imported_settings)
+
+        return imported_settings
+
+    def stream(
+        self,
+        output_format: OutputFormat,
+        settings: Iterable[type[BaseSettings]] = (),
+        module_path: Iterable[str] = (),
+        class_path: Iterable[str] = (),
+        heading_offset: int = 0,
+    ) -> Iterator[str]:
+        """Render the documentation of settings classes chunk by chunk.
+
+        The settings classes are walked right away, only the template is evaluated lazily while iterating.
+
+        Raises:
+            ValueError: If no settings classes are given or found.
+        """
+        settings = dict.fromkeys(settings)
+        module_path = tuple(module_path)
+        class_path = tuple(class_path)
+
+        if not settings and not module_path and not class_path:
+            raise ValueError("No sources of data were specified.")
+
+        if class_path:
+            settings.update(self._import_settings("class", class_path))
+        if module_path:
+            settings.update(self._import_settings("module", module_path))
+
+        with self._lock:
+            walked_fields = {cls: self._walked_fields[cls] for cls in settings if cls in self._walked_fields}
+
+        entries = collect_entries(
+            settings, walked_fields, max_depth=self.max_depth, fail_on_conflicts=self.fail_on_conflicts
+        )
+
+        with self._lock:
+            for cls in settings:
+                self._walked_fields.setdefault(cls, walked_fields[cls])
+
+        return stream_entries(
+            self._env, output_format, settings, entries, heading_offset=heading_offset, walked_fields=walked_fields
+        )
+
+    def render(
+        self,
+        output_format: OutputFormat,
+        settings: Iterable[type[BaseSettings]] = (),
+        module_path: Iterable[str] = (),
+        class_path: Iterable[str] = (),
+        heading_offset: int = 0,
+    ) -> str:
+        """Render the documentation of settings classes. See `stream()`."""
+        return "".join(self.stream(output_format, settings, module_path, class_path, heading_offset))
+
+    def invalidate(self, *classes: type[BaseSettings]) -> None:
+        """Forget the walked fields of the given settings classes and their nested models, or of all classes and
+        import paths if none are given. Modules already imported are not reloaded, use `importlib.reload()` for that
+        before invalidating."""
+        from settings_doc import importing, walking  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            if not classes:
+                self._walked_fields.clear()
+                self._imported_settings.clear()
+                importing.clear_caches()
+
+            for cls in classes:
+                self._walked_fields.pop(cls, None)
+
+            walking.forget_expansions(walking.reached_classes(classes) if classes else ())
+
+    def invalidate_templates(self) -> None:
+        """Forget the compiled templates of this renderer, so that they are loaded and compiled again on next use."""
+        if self._env.cache is not None:
+            self._env.cache.clear()
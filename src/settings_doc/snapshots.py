@@ -0,0 +1,177 @@
+"""Versioned JSON snapshots of walked settings classes.
+
+A snapshot holds everything the templates need to know about the settings classes and their fields, so that
+the documentation can be rendered from it later without importing the settings modules (or installing their
+dependencies). It reuses the descriptions sent back by worker processes in `parallel_importing`.
+
+Values JSON cannot represent are stored as single-key objects: tuples as `{"$tuple": [...]}`, sets as
+`{"$set": [...]}`, frozen sets as `{"$frozenset": [...]}` and dictionaries with keys other than strings as
+`{"$dict": [[key, value], ...]}`.
+"""
+
+from __future__ import annotations
+
+import builtins
+import json
+from pathlib import Path
+from typing import Any, Final, Mapping
+
+import click
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings
+
+from settings_doc.parallel_importing import (
+    ClassDescription,
+    FieldDescription,
+    ModuleDescription,
+    create_classes,
+    describe_settings,
+)
+
+SNAPSHOT_VERSION: Final[int] = 1
+_COLLECTION_TAGS: Final[dict[type, str]] = {tuple: "$tuple", set: "$set", frozenset: "$frozenset"}
+_TAGGED_COLLECTIONS: Final[dict[str, type]] = {tag: collection for collection, tag in _COLLECTION_TAGS.items()}
+
+
+def _encode(value: Any) -> Any:
+    """Convert a plain value (see `parallel_importing._plain()`) into one JSON can represent."""
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+
+    if type(value) in _COLLECTION_TAGS:
+        return {_COLLECTION_TAGS[type(value)]: [_encode(item) for item in value]}
+
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        return {"$dict": [[_encode(key), _encode(item)] for key, item in value.items()]}
+
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Reverse `_encode()`."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+
+    if isinstance(value, dict):
+        if len(value) == 1:
+            ((tag, items),) = value.items()
+            if tag in _TAGGED_COLLECTIONS:
+                return _TAGGED_COLLECTIONS[tag](_decode(item) for item in items)
+            if tag == "$dict":
+                return {_decode(key): _decode(item) for key, item in items}
+        return {key: _decode(item) for key, item in value.items()}
+
+    return value
+
+
+def _encode_field(field: FieldDescription) -> dict[str, Any]:
+    return {
+        "required": field.required,
+        "has_default": field.has_default,
+        "default": _encode(field.default),
+        "description": field.description,
+        "examples": _encode(field.examples),
+        "json_schema_extra": _encode(field.json_schema_extra),
+        "possible_values": None if field.possible_values is None else _encode(list(field.possible_values)),
+        "annotation": None if field.annotation is None else field.annotation.__name__,
+    }
+
+
+def _encode_class(cls: ClassDescription) -> dict[str, Any]:
+    return {
+        "module": cls.module,
+        "qualname": cls.qualname,
+        "doc": cls.doc,
+        "model_config": _encode(cls.model_config),
+        "model_fields": cls.model_fields,
+        "env_fields": [{"env_name": env_name, "field": index} for env_name, index in cls.env_fields],
+    }
+
+
+def dump_snapshot(settings: Mapping[type[BaseSettings], list[tuple[str, FieldInfo]]]) -> str:
+    """Serialize settings classes mapped to their (nested) fields with environment variable names into JSON."""
+    description = describe_settings(settings)
+
+    return (
+        json.dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "classes": [_encode_class(cls) for cls in description.classes],
+                "fields": [_encode_field(field) for field in description.fields],
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        + "\n"
+    )
+
+
+def _decode_annotation(name: str | None) -> type | None:
+    if name is None:
+        return None
+
+    annotation = getattr(builtins, name, None)
+    if not isinstance(annotation, type):
+        raise ValueError(f"unknown annotation '{name}'")
+    return annotation
+
+
+def _decode_field(field: dict[str, Any]) -> FieldDescription:
+    possible_values = field["possible_values"]
+
+    return FieldDescription(
+        required=field["required"],
+        has_default=field["has_default"],
+        default=_decode(field["default"]),
+        description=field["description"],
+        examples=_decode(field["examples"]),
+        json_schema_extra=_decode(field["json_schema_extra"]),
+        possible_values=None if possible_values is None else tuple(_decode(possible_values)),
+        annotation=_decode_annotation(field["annotation"]),
+    )
+
+
+def _decode_class(cls: dict[str, Any]) -> ClassDescription:
+    return ClassDescription(
+        module=cls["module"],
+        qualname=cls["qualname"],
+        doc=cls["doc"],
+        model_config=_decode(cls["model_config"]),
+        model_fields=cls["model_fields"],
+        env_fields=[(env_field["env_name"], env_field["field"]) for env_field in cls["env_fields"]],
+    )
+
+
+def load_snapshot(snapshot_file: Path) -> dict[type[BaseSettings], list[tuple[str, FieldInfo]]]:
+    """Re-create settings classes from a snapshot written by `dump_snapshot()`.
+
+    Returns:
+        Stand-ins of the settings classes mapped to their (nested) fields with environment variable names.
+        The stand-ins carry `model_config` and `model_fields` but are not `BaseSettings` subclasses.
+
+    Raises:
+        click.BadParameter: If the file is not a snapshot of a supported version.
+    """
+    try:
+        data = json.loads(Path(snapshot_file).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise click.BadParameter(f"Cannot read the snapshot '{snapshot_file}': {exc}") from exc
+
+    version = data.get("version") if isinstance(data, dict) else None
+    if version != SNAPSHOT_VERSION:
+        raise click.BadParameter(
+            f"Snapshot '{snapshot_file}' has version {version}, but only version {SNAPSHOT_VERSION} is supported."
+        )
+
+    try:
+        description = ModuleDescription(
+            fields=[_decode_field(field) for field in data["fields"]],
+            classes=[_decode_class(cls) for cls in data["classes"]],
+        )
+        return create_classes(description)
+    except (KeyError, TypeError, ValueError, IndexError) as exc:
+        raise click.BadParameter(
+            f"Cannot read the snapshot '{snapshot_file}': malformed content ({type(exc).__name__}: {exc})."
+        ) from exc
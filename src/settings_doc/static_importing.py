@@ -0,0 +1,490 @@
+"""Discovery of settings classes from source code, without importing application modules.
+
+Class definitions are parsed with `ast` and re-created from the syntax tree. Only a safe subset of
+Python is evaluated: literals, names bound to classes, enums and constants in the parsed modules,
+attributes of standard library and pydantic modules and calls of `pydantic.Field` and similar
+helpers. Everything else makes the class unresolvable and it is imported the usual way instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import importlib
+import operator
+import sys
+import types
+from enum import Enum, auto
+from functools import lru_cache
+from inspect import isclass
+from pathlib import Path
+from typing import Any, Callable, Final, Union
+
+import click
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from settings_doc import importing
+from settings_doc.cache import find_module_source
+
+_SAFE_TOP_LEVEL_MODULES: Final[frozenset[str]] = frozenset(
+    {
+        "annotated_types",
+        "collections",
+        "datetime",
+        "decimal",
+        "enum",
+        "ipaddress",
+        "pathlib",
+        "pydantic",
+        "pydantic_core",
+        "pydantic_settings",
+        "re",
+        "typing",
+        "typing_extensions",
+        "uuid",
+    }
+)
+_SAFE_BUILTINS: Final[dict[str, Any]] = {
+    name: getattr(builtins, name)
+    for name in ("bool", "bytes", "dict", "float", "frozenset", "int", "list", "object", "set", "str", "tuple", "type")
+}
+_SAFE_CALLABLES: Final[tuple[Callable, ...]] = (
+    AliasChoices,
+    AliasPath,
+    ConfigDict,
+    Field,
+    SettingsConfigDict,
+    auto,
+    dict,
+    frozenset,
+    list,
+    set,
+    tuple,
+)
+_BINARY_OPERATORS: Final[dict[type[ast.operator], Callable[[Any, Any], Any]]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: Final[dict[type[ast.unaryop], Callable[[Any], Any]]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+}
+
+
+class Unresolvable(Exception):
+    """Raised when a piece of source code cannot be evaluated without importing it."""
+
+
+class _NotAModel(Unresolvable):
+    """Raised for names that are statically known not to be pydantic models nor enums."""
+
+
+class _ModuleReference:
+    """A module bound to a name by `import`, which is analyzed statically rather than imported."""
+
+    def __init__(self, module_path: str):
+        self.module_path = module_path
+
+
+def _is_safe_module(module_path: str) -> bool:
+    return module_path.split(".", maxsplit=1)[0] in _SAFE_TOP_LEVEL_MODULES
+
+
+class _StaticModule:
+    """Top-level bindings of a single parsed module and their lazily evaluated values."""
+
+    def __init__(self, analyzer: StaticAnalyzer, module_path: str, source: Path):
+        self.analyzer = analyzer
+        self.module_path = module_path
+        self.package = module_path if source.name == "__init__.py" else module_path.rpartition(".")[0]
+        self.bindings: dict[str, ast.AST | tuple[str, str | None]] = {}
+        self._source = source.read_text(encoding="utf-8")
+        self._values: dict[str, Any] = {}
+        self._evaluating: set[str] = set()
+
+        for statement in ast.parse(self._source, filename=str(source)).body:
+            self._bind(statement)
+
+    def _bind(self, statement: ast.stmt) -> None:  # pylint: disable=too-complex
+        if isinstance(statement, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            self.bindings[statement.name] = statement
+        elif isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    self.bindings[alias.asname] = (alias.name, None)
+                else:
+                    top_level = alias.name.split(".", maxsplit=1)[0]
+                    self.bindings[top_level] = (top_level, None)
+        elif isinstance(statement, ast.ImportFrom):
+            module_path = self._absolute_module_path(statement.module, statement.level)
+            for alias in statement.names:
+                self.bindings[alias.asname or alias.name] = (module_path, alias.name)
+        elif isinstance(statement, ast.Assign) and statement.value is not None:
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    self.bindings[target.id] = statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            if isinstance(statement.target, ast.Name):
+                self.bindings[statement.target.id] = statement.value
+
+    def _absolute_module_path(self, module: str | None, level: int) -> str:
+        if not level:
+            return module or ""
+
+        package = self.package
+        for _ in range(level - 1):
+            package = package.rpartition(".")[0]
+
+        return f"{package}.{module}" if module else package
+
+    def resolve(self, name: str) -> Any:
+        """Statically evaluate the value bound to a top-level name."""
+        if name in self._values:
+            return self._values[name]
+
+        if name not in self.bindings:
+            if name in _SAFE_BUILTINS:
+                return _SAFE_BUILTINS[name]
+            raise Unresolvable(f"Name '{name}' is not defined in '{self.module_path}'.")
+
+        if name in self._evaluating:
+            raise Unresolvable(f"Name '{name}' in '{self.module_path}' refers to itself.")
+
+        self._evaluating.add(name)
+        try:
+            binding = self.bindings[name]
+            if isinstance(binding, tuple):
+                value = self.analyzer.resolve_import(*binding)
+            elif isinstance(binding, ast.ClassDef):
+                value = self._create_class(binding)
+            elif isinstance(binding, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                raise _NotAModel(f"'{name}' in '{self.module_path}' is a function.")
+            else:
+                value = self.evaluate(binding)
+        finally:
+            self._evaluating.discard(name)
+
+        self._values[name] = value
+        return value
+
+    def evaluate(self, node: ast.AST) -> Any:
+        """Evaluate an expression using only the safe subset of Python."""
+        try:
+            return self._evaluate(node)
+        except (TypeError, ValueError, LookupError, ArithmeticError) as exc:
+            raise Unresolvable(f"Expression '{self._unparse(node)}' cannot be evaluated statically: {exc}") from exc
+
+    # pylint: disable-next=too-many-return-statements,too-many-branches,too-complex
+    def _evaluate(self, node: ast.AST) -> Any:
+        if sys.version_info < (3, 9) and isinstance(node, ast.Index):  # pragma: no cover
+            return self.evaluate(node.value)  # type: ignore[attr-defined]
+
+        if isinstance(node, ast.Constant):
+            return node.value
+
+        if isinstance(node, ast.Name):
+            return self.resolve(node.id)
+
+        if isinstance(node, ast.Attribute):
+            value = self.evaluate(node.value)
+            if isinstance(value, _ModuleReference):
+                return self.analyzer.resolve_import(value.module_path, node.attr)
+            try:
+                return getattr(value, node.attr)
+            except AttributeError as exc:
+                raise Unresolvable(str(exc)) from exc
+
+        if isinstance(node, ast.Subscript):
+            return self.evaluate(node.value)[self.evaluate(node.slice)]
+
+        if isinstance(node, ast.Tuple):
+            return tuple(self.evaluate(item) for item in node.elts)
+
+        if isinstance(node, ast.List):
+            return [self.evaluate(item) for item in node.elts]
+
+        if isinstance(node, ast.Set):
+            return {self.evaluate(item) for item in node.elts}
+
+        if isinstance(node, ast.Dict):
+            result = {}
+            for key, value in zip(node.keys, node.values):
+                if key is None:
+                    raise Unresolvable("Dictionary unpacking is not supported.")
+                result[self.evaluate(key)] = self.evaluate(value)
+            return result
+
+        if isinstance(node, ast.BinOp):
+            left, right = self.evaluate(node.left), self.evaluate(node.right)
+            if isinstance(node.op, ast.BitOr) and self._is_type_like(left) and self._is_type_like(right):
+                return Union[left, right]
+            if type(node.op) in _BINARY_OPERATORS:
+                return _BINARY_OPERATORS[type(node.op)](left, right)
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return _UNARY_OPERATORS[type(node.op)](self.evaluate(node.operand))
+
+        if isinstance(node, ast.Call):
+            function = self.evaluate(node.func)
+            if not any(function is safe_callable for safe_callable in _SAFE_CALLABLES) and not (
+                isclass(function) and function in self.analyzer.models
+            ):
+                raise Unresolvable(f"Calling '{self._unparse(node.func)}' requires importing the code.")
+            if any(isinstance(arg, ast.Starred) for arg in node.args) or any(kw.arg is None for kw in node.keywords):
+                raise Unresolvable("Argument unpacking is not supported.")
+            return function(
+                *(self.evaluate(arg) for arg in node.args),
+                **{str(keyword.arg): self.evaluate(keyword.value) for keyword in node.keywords},
+            )
+
+        raise Unresolvable(f"Expression '{self._unparse(node)}' cannot be evaluated statically.")
+
+    def _unparse(self, node: ast.AST) -> str:
+        return ast.get_source_segment(self._source, node) or type(node).__name__
+
+    @staticmethod
+    def _is_type_like(value: Any) -> bool:
+        return value is None or isclass(value) or hasattr(value, "__origin__")
+
+    def evaluate_annotation(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            # Forward reference
+            return self.evaluate(ast.parse(node.value, mode="eval").body)
+
+        return self.evaluate(node)
+
+    def _create_class(self, node: ast.ClassDef) -> type:
+        bases = tuple(self.evaluate(base) for base in node.bases)
+        if not any(isclass(base) and issubclass(base, (BaseModel, Enum)) for base in bases):
+            raise _NotAModel(f"Class '{node.name}' is not a pydantic model nor an enum.")
+
+        if node.decorator_list:
+            raise Unresolvable(f"Class '{node.name}' is decorated.")
+
+        if not all(isclass(base) and issubclass(base, (BaseModel, Enum, str, int)) for base in bases):
+            raise Unresolvable(f"Class '{node.name}' has unsupported base classes.")
+
+        keywords = {str(keyword.arg): self.evaluate(keyword.value) for keyword in node.keywords}
+        namespace = self._class_namespace(node)
+
+        def exec_body(class_namespace: dict[str, Any]) -> None:
+            for key, value in namespace.items():
+                class_namespace[key] = value
+
+        try:
+            cls = types.new_class(node.name, bases, keywords, exec_body)
+        except Exception as exc:  # pylint: disable=broad-except
+            raise Unresolvable(f"Class '{node.name}' cannot be re-created: {exc}") from exc
+
+        if issubclass(cls, BaseModel):
+            self.analyzer.models.add(cls)
+        return cls
+
+    def _config_class(self, node: ast.ClassDef) -> dict[str, Any]:
+        config: dict[str, Any] = {}
+
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+                if isinstance(statement.targets[0], ast.Name):
+                    config[statement.targets[0].id] = self.evaluate(statement.value)
+                    continue
+            if not isinstance(statement, ast.Pass):
+                raise Unresolvable(f"Statement '{self._unparse(statement)}' in '{node.name}' is not supported.")
+
+        return config
+
+    def _class_namespace(self, node: ast.ClassDef) -> dict[str, Any]:  # pylint: disable=too-complex
+        namespace: dict[str, Any] = {"__module__": self.module_path, "__qualname__": node.name}
+        annotations: dict[str, Any] = {}
+
+        for index, statement in enumerate(node.body):
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Pass)):
+                continue
+
+            if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant):
+                if index == 0 and isinstance(statement.value.value, str):
+                    namespace["__doc__"] = statement.value.value
+            elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                annotations[statement.target.id] = self.evaluate_annotation(statement.annotation)
+                if statement.value is not None:
+                    namespace[statement.target.id] = self.evaluate(statement.value)
+            elif isinstance(statement, ast.Assign) and all(
+                isinstance(target, ast.Name) for target in statement.targets
+            ):
+                value = self.evaluate(statement.value)
+                for target in statement.targets:
+                    namespace[target.id] = value  # type: ignore[attr-defined]
+            elif isinstance(statement, ast.ClassDef) and statement.name == "Config":
+                namespace["model_config"] = self._config_class(statement)
+            else:
+                raise Unresolvable(f"Statement '{self._unparse(statement)}' in '{node.name}' is not supported.")
+
+        if annotations:
+            namespace["__annotations__"] = annotations
+
+        return namespace
+
+
+class StaticAnalyzer:
+    """Re-creates settings classes from the source code of modules within a single top-level package.
+
+    Modules of the same top-level package are parsed rather than imported. Standard library and pydantic
+    modules are imported normally, any other module makes the referencing class unresolvable.
+    """
+
+    def __init__(self, top_level_package: str):
+        self.top_level_package = top_level_package
+        self._modules: dict[str, _StaticModule | None] = {}
+        # Models re-created from the source code, which can be called safely as none of their methods are kept
+        self.models: set[type[BaseModel]] = set()
+
+    def module(self, module_path: str) -> _StaticModule | None:
+        """Parse a module or return `None` if its source code cannot be found."""
+        if module_path not in self._modules:
+            source = find_module_source(module_path)
+            if source is None or source.suffix != ".py" or not source.is_file():
+                self._modules[module_path] = None
+            else:
+                try:
+                    self._modules[module_path] = _StaticModule(self, module_path, source)
+                except SyntaxError:
+                    self._modules[module_path] = None
+
+        return self._modules[module_path]
+
+    def resolve_import(self, module_path: str, name: str | None) -> Any:
+        if _is_safe_module(module_path):
+            safe_module = importlib.import_module(module_path)
+            if name is None:
+                return safe_module
+            try:
+                return getattr(safe_module, name)
+            except AttributeError:
+                return importlib.import_module(f"{module_path}.{name}")
+
+        if module_path.split(".", maxsplit=1)[0] != self.top_level_package:
+            raise Unresolvable(f"Module '{module_path}' is outside of package '{self.top_level_package}'.")
+
+        if name is None:
+            return _ModuleReference(module_path)
+
+        module = self.module(module_path)
+        if module is None:
+            raise Unresolvable(f"Source code of module '{module_path}' cannot be found.")
+
+        if name in module.bindings:
+            return module.resolve(name)
+
+        if self.module(f"{module_path}.{name}") is not None:
+            return _ModuleReference(f"{module_path}.{name}")
+
+        raise Unresolvable(f"Name '{name}' is not defined in '{module_path}'.")
+
+
+def _analyzer(module_path: str) -> StaticAnalyzer:
+    return StaticAnalyzer(module_path.split(".", maxsplit=1)[0])
+
+
+def module_settings(module_path: str) -> dict[type[BaseSettings], None]:  # pylint: disable=too-complex
+    """Like `importing.module_settings`, but imports the module only if some of its classes cannot be resolved
+    statically."""
+    static_module = _analyzer(module_path).module(module_path)
+    if static_module is None:
+        return importing.module_settings(importing.import_module(module_path), module_path)
+
+    # Settings classes by name in the order of their definition, `None` for those to import
+    resolved: dict[str, type[BaseSettings] | None] = {}
+
+    for name, binding in static_module.bindings.items():
+        if isinstance(binding, tuple):
+            if binding[1] is None or not binding[0].startswith(module_path):
+                continue  # Classes from other modules would be filtered out by their `__module__`
+        elif not isinstance(binding, (ast.ClassDef, ast.Name, ast.Attribute)):
+            continue  # Other expressions are assumed not to create settings classes
+
+        try:
+            value = static_module.resolve(name)
+        except _NotAModel:
+            continue
+        except Unresolvable:
+            resolved[name] = None
+            continue
+
+        if isclass(value) and issubclass(value, BaseSettings) and value.__module__.startswith(module_path):
+            resolved[name] = value
+
+    if None in resolved.values():
+        imported_settings = importing.module_settings(importing.import_module(module_path), module_path)
+        imported_by_name = {cls.__name__: cls for cls in imported_settings}
+        resolved = {name: imported_by_name.get(name) if cls is None else cls for name, cls in resolved.items()}
+
+    return {cls: None for cls in resolved.values() if cls is not None}
+
+
+@lru_cache
+def import_module_path(module_paths: tuple[str, ...]) -> dict[type[BaseSettings], None]:
+    """Like `importing.import_module_path`, but imports only modules with statically unresolvable classes."""
+    if not module_paths:
+        return {}
+
+    settings: dict[type[BaseSettings], None] = {}
+
+    for module_path in module_paths:
+        new_classes = module_settings(module_path)
+
+        if not new_classes:
+            if len(module_paths) > 1:
+                click.secho(importing.MODULE_ERROR_MSG.format(module_path=module_path), fg="yellow", err=True)
+        else:
+            settings.update(new_classes)
+
+    if not settings:
+        raise click.BadParameter(
+            (
+                importing.MODULE_ERROR_MSG.format(module_path=module_paths[0])
+                if len(module_paths) == 1
+                else "No `pydantic.BaseSettings` subclasses found in any of the modules."
+            ),
+            param_hint=importing.MODULE_PARAM_HINT,
+        )
+
+    return settings
+
+
+@lru_cache
+def import_class_path(class_paths: tuple[str, ...]) -> dict[type[BaseSettings], None]:
+    """Like `importing.import_class_path`, but imports only classes that cannot be resolved statically."""
+    settings: dict[type[BaseSettings], None] = {}
+
+    for class_path in class_paths:
+        module_path, class_name = class_path.rsplit(".", maxsplit=1)
+        module = _analyzer(module_path).module(module_path)
+
+        try:
+            if module is None or class_name not in module.bindings:
+                raise Unresolvable(f"Class '{class_path}' cannot be found statically.")
+            new_class = module.resolve(class_name)
+        except Unresolvable:
+            settings.update(importing.import_class_path((class_path,)))
+            continue
+
+        if not isclass(new_class) or not issubclass(new_class, BaseSettings):
+            settings.update(importing.import_class_path((class_path,)))  # Raises a consistent error
+            continue
+
+        settings[new_class] = None
+
+    return settings
+
+
+def clear_caches() -> None:
+    """Forget the settings classes of all import paths, so that they are resolved again on next use."""
+    import_module_path.cache_clear()
+    import_class_path.cache_clear()
@@ -0,0 +1,261 @@
+"""Walking imported settings classes and rendering their documentation through the templates chunk by chunk."""
+
+from __future__ import annotations
+
+import logging
+from contextlib import nullcontext
+from enum import Enum, auto
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Iterable, Iterator
+
+import click
+
+from settings_doc.cache import create_cache_folder
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+
+if TYPE_CHECKING:
+    # Imported lazily, so that commands not rendering anything (and `--help`) start quickly.
+    from jinja2 import Environment, Template
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+    from pydantic_settings import BaseSettings
+
+    from settings_doc.cache import RenderCache
+    from settings_doc.entries import SettingEntry
+    from settings_doc.profiling import Profile
+
+TEMPLATES_FOLDER: Final[Path] = Path(__file__).parent / "templates"
+LOGGER = logging.getLogger(__name__)
+
+
+class OutputFormat(Enum):
+    # noinspection PyMethodParameters
+    def _generate_next_value_(name, start, count, last_values):  # pylint: disable=no-self-argument
+        del start, count, last_values
+        return name.lower()  # pylint: disable=no-member
+
+    DOTENV = auto()
+    MARKDOWN = auto()
+    DEBUG = auto()
+    JSON = auto()
+
+
+def get_template(env: Environment, output_format: OutputFormat) -> Template:
+    return env.get_template(f"{output_format.value}.jinja")
+
+
+def _model_fields_recursive(
+    cls: type[BaseModel], prefix: str, env_nested_delimiter: str | None, max_depth: int = DEFAULT_MAX_DEPTH
+) -> Iterator[tuple[str, FieldInfo]]:
+    from settings_doc import walking  # pylint: disable=import-outside-toplevel
+
+    expansion = walking.expand_model(cls, env_nested_delimiter or "", max_depth, [(cls, "")])
+
+    for error in expansion.errors:
+        LOGGER.error(error)
+
+    for name, field, absolute in expansion.fields:
+        yield name if absolute else prefix + name, field
+
+
+def model_fields(cls: type[BaseSettings], max_depth: int = DEFAULT_MAX_DEPTH) -> Iterator[tuple[str, FieldInfo]]:
+    yield from _model_fields_recursive(
+        cls, cls.model_config["env_prefix"], cls.model_config["env_nested_delimiter"], max_depth
+    )
+
+
+def build_environment(templates: tuple[Path, ...], bytecode_cache_dir: Path | None = None) -> Environment:
+    """Build a Jinja environment looking up templates in the folders before the built-in ones.
+
+    Templates are compiled on first use and recompiled when their source changes. With `bytecode_cache_dir`,
+    compiled templates are also stored on disk and reused by later processes.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    from settings_doc.template_functions import JINJA_ENV_GLOBALS  # pylint: disable=import-outside-toplevel
+
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        create_cache_folder(bytecode_cache_dir)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+    env = Environment(
+        loader=FileSystemLoader(templates + (TEMPLATES_FOLDER,)),
+        autoescape=select_autoescape(),
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    env.globals.update(JINJA_ENV_GLOBALS)
+    return env
+
+
+@lru_cache
+def create_environment(templates: tuple[Path, ...], bytecode_cache_dir: Path | None = None) -> Environment:
+    """Get a Jinja environment shared by all renders with the same template folders, so that templates are
+    compiled only once per process. See `build_environment()`."""
+    return build_environment(templates, bytecode_cache_dir)
+
+
+def walk_settings(cls: type[BaseSettings], max_depth: int = DEFAULT_MAX_DEPTH) -> list[SettingEntry]:
+    from settings_doc.entries import create_entries  # pylint: disable=import-outside-toplevel
+
+    return create_entries(model_fields(cls, max_depth))
+
+
+def collect_entries(
+    settings: dict[type[BaseSettings], None],
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]] | None = None,
+    *,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+) -> list[SettingEntry]:
+    """Walk settings classes and index their entries by environment variable name.
+
+    A variable defined identically by several classes (for example through a shared base class) is kept only
+    once. Differing definitions of the same variable are all kept and reported with the classes defining them,
+    or raise `click.BadParameter` if `fail_on_conflicts` is set.
+
+    When `walked_fields` is given, it is used as a cache of walked classes, so that each class is walked
+    and each of its fields prepared for the templates only once across several renders.
+    """
+    if walked_fields is None:
+        walked_fields = {}
+
+    entries: list[SettingEntry] = []
+    index: dict[str, list[tuple[SettingEntry, type[BaseSettings]]]] = {}
+
+    for cls in settings:
+        if cls not in walked_fields:
+            walked_fields[cls] = walk_settings(cls, max_depth)
+
+        case_sensitive = cls.model_config.get("case_sensitive", False)
+
+        for entry in walked_fields[cls]:
+            definitions = index.setdefault(entry.raw_env_name if case_sensitive else entry.env_name, [])
+
+            if any(entry.describes_same(defined_entry) for defined_entry, _ in definitions):
+                continue
+
+            if definitions:
+                message = (
+                    f"Environment variable '{entry.env_name}' is defined differently in "
+                    f"'{definitions[0][1].__module__}.{definitions[0][1].__qualname__}' and "
+                    f"'{cls.__module__}.{cls.__qualname__}'."
+                )
+                if fail_on_conflicts:
+                    raise click.BadParameter(message)
+                click.secho(message, fg="yellow", err=True)
+
+            definitions.append((entry, cls))
+            entries.append(entry)
+
+    return entries
+
+
+def _stream_snapshot(
+    settings: dict[type[BaseSettings], None], walked_fields: dict[type[BaseSettings], list[SettingEntry]]
+) -> Iterator[str]:
+    from settings_doc import snapshots  # pylint: disable=import-outside-toplevel
+
+    yield snapshots.dump_snapshot({cls: [(_.raw_env_name, _.field) for _ in walked_fields[cls]] for cls in settings})
+
+
+def stream_entries(
+    env: Environment,
+    output_format: OutputFormat,
+    settings: dict[type[BaseSettings], None],
+    entries: list[SettingEntry],
+    *,
+    heading_offset: int,
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]],
+) -> Iterator[str]:
+    """Render entries collected by `collect_entries()` chunk by chunk, as produced by the template."""
+    if output_format is OutputFormat.JSON:
+        return _stream_snapshot(settings, walked_fields)
+
+    # pylint: disable-next=import-outside-toplevel
+    from settings_doc.template_context import ClassesMapping, LazySequence
+
+    classes = ClassesMapping(settings, walked_fields)
+
+    return get_template(env, output_format).generate(
+        heading_offset=heading_offset,
+        entries=entries,
+        fields=LazySequence(lambda: [(entry.raw_env_name, entry.field) for entry in entries]),
+        classes=classes,
+        fields_by_class=classes.fields_by_class,
+    )
+
+
+def stream_settings(
+    env: Environment,
+    output_format: OutputFormat,
+    settings: dict[type[BaseSettings], None],
+    heading_offset: int,
+    *,
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]] | None = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+) -> Iterator[str]:
+    """Render already imported settings classes chunk by chunk, as produced by the template.
+
+    Settings classes are walked right away (see `collect_entries()`), only the template is evaluated lazily
+    while iterating.
+    """
+    if walked_fields is None:
+        walked_fields = {}
+
+    entries = collect_entries(settings, walked_fields, max_depth=max_depth, fail_on_conflicts=fail_on_conflicts)
+    return stream_entries(
+        env, output_format, settings, entries, heading_offset=heading_offset, walked_fields=walked_fields
+    )
+
+
+def render_settings(
+    env: Environment,
+    output_format: OutputFormat,
+    settings: dict[type[BaseSettings], None],
+    heading_offset: int,
+    *,
+    walked_fields: dict[type[BaseSettings], list[SettingEntry]] | None = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    fail_on_conflicts: bool = False,
+) -> str:
+    """Render already imported settings classes. See `stream_settings()`."""
+    return "".join(
+        stream_settings(
+            env,
+            output_format,
+            settings,
+            heading_offset,
+            walked_fields=walked_fields,
+            max_depth=max_depth,
+            fail_on_conflicts=fail_on_conflicts,
+        )
+    )
+
+
+def store_rendered(
+    output_format: OutputFormat,
+    chunks: Iterator[str],
+    *,
+    cache: RenderCache | None,
+    cache_key: str | None,
+    profile: Profile | None,
+    dependencies: Iterable[Path] = (),
+) -> Iterable[str]:
+    """Render the document into memory and cache it, if it needs to be cached or profiled."""
+    if profile is None and (cache is None or cache_key is None):
+        return chunks
+
+    with nullcontext() if profile is None else profile.phase(f"render_{output_format.value}"):
+        rendered_doc = "".join(chunks)
+
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, rendered_doc, dependencies)
+
+    return (rendered_doc,)
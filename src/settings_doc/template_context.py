@@ -0,0 +1,93 @@
+"""Variables passed to the templates, built only as far as the templates read them."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Mapping, Sequence, Tuple, TypeVar, overload
+
+if TYPE_CHECKING:
+    from pydantic.fields import FieldInfo
+    from pydantic_settings import BaseSettings
+
+    from settings_doc.entries import SettingEntry
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LazyMapping(Mapping[K, V]):
+    """A mapping with known keys, computing the value of each key on first access."""
+
+    def __init__(self, keys: Iterable[K], compute: Callable[[K], V]):
+        self._keys = dict.fromkeys(keys)
+        self._compute = compute
+        self._values: dict[K, V] = {}
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self._values:
+            if key not in self._keys:
+                raise KeyError(key)
+            self._values[key] = self._compute(key)
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._keys)!r})"
+
+
+class LazySequence(Sequence[V]):
+    """A sequence materialized on first use, which can then be iterated many times, indexed and sliced."""
+
+    def __init__(self, items: Callable[[], Iterable[V]]):
+        self._create_items = items
+        self._items: list[V] | None = None
+
+    def _materialize(self) -> list[V]:
+        if self._items is None:
+            self._items = list(self._create_items())
+        return self._items
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[V]: ...
+
+    def __getitem__(self, index: int | slice) -> V | list[V]:
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[V]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._materialize()!r})"
+
+
+class ClassesMapping(LazyMapping["type[BaseSettings]", List["FieldInfo"]]):
+    """Settings classes mapped to the fields declared on them, as the `classes` template variable.
+
+    Attributes:
+        fields_by_class: Settings classes mapped to their (nested) fields with environment variable names, the same
+            pairs as in the `fields` template variable, grouped by the class defining them.
+    """
+
+    def __init__(
+        self,
+        settings: Iterable[type[BaseSettings]],
+        walked_fields: Mapping[type[BaseSettings], list[SettingEntry]],
+    ):
+        settings = list(settings)
+        super().__init__(settings, lambda cls: list(cls.model_fields.values()))
+        self.fields_by_class: LazyMapping[type[BaseSettings], list[Tuple[str, FieldInfo]]] = LazyMapping(
+            settings, lambda cls: [(entry.raw_env_name, entry.field) for entry in walked_fields[cls]]
+        )
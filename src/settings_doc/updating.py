@@ -0,0 +1,235 @@
+"""Splicing generated documentation into existing files without loading them into memory.
+
+Files are memory-mapped and scanned for the boundary marks once. The new content is written into
+a temporary file next to the original, which atomically replaces it, so an interrupted update never
+leaves a truncated file behind.
+"""
+
+from __future__ import annotations
+
+import difflib
+import filecmp
+import mmap
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Iterable, Iterator, Sequence, Union
+
+import click
+
+Content = Union[mmap.mmap, bytes]
+
+_COPY_BLOCK_SIZE = 1024 * 1024
+
+
+@contextmanager
+def map_file(file: BinaryIO) -> Iterator[Content]:
+    """Memory-map a file opened for reading. Empty files, which cannot be mapped, are given as `b""`."""
+    if os.fstat(file.fileno()).st_size == 0:
+        yield b""
+        return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+def _newline_length(content: Content, position: int) -> int:
+    """Length of the line ending at `position`, if there is one."""
+    for newline in (b"\r\n", b"\n"):
+        if content[position : position + len(newline)] == newline:
+            return len(newline)
+    return 0
+
+
+def find_between(content: Content, start_mark: str, end_mark: str, greedy: bool = True) -> tuple[int, int] | None:
+    """Find the region between the first start mark and the last end mark after it, or the first one without
+    `greedy`, so that regions sharing an end mark do not overlap.
+
+    A line ending right after the start mark is considered part of it and is kept.
+    Each mark is searched for only once, so the time is linear in the size of the content.
+
+    Returns:
+        Byte offsets of the start and the end of the region, or `None` if either mark is missing.
+    """
+    start_bytes = start_mark.encode("utf-8")
+    start = content.find(start_bytes)
+    if start < 0:
+        return None
+
+    region_start = start + len(start_bytes)
+    end_bytes = end_mark.encode("utf-8")
+    region_end = content.rfind(end_bytes, region_start) if greedy else content.find(end_bytes, region_start)
+    if region_end < 0:
+        return None
+
+    newline = _newline_length(content, region_start)
+    if region_start + newline <= region_end:
+        region_start += newline
+
+    return region_start, region_end
+
+
+def encode(text: str) -> bytes:
+    """Encode text the same way it is written by `write_spliced()`."""
+    return text.replace("\n", os.linesep).encode("utf-8")
+
+
+def _copy(content: Content, start: int, end: int, file: BinaryIO) -> None:
+    with memoryview(content) as view:
+        for offset in range(start, end, _COPY_BLOCK_SIZE):
+            with view[offset : min(offset + _COPY_BLOCK_SIZE, end)] as block:
+                file.write(block)
+
+
+def write_spliced(path: Path, content: Content, replacements: Sequence[tuple[tuple[int, int], Iterable[str]]]) -> Path:
+    """Write `content` with each region replaced by its chunks into a temporary file next to `path`.
+
+    Regions must be sorted and must not overlap. Only the chunks are encoded (and their line endings
+    translated as in text mode), the rest of the content is copied byte by byte. The temporary file is
+    flushed to disk and given the permissions of `path`. It is removed if writing fails.
+
+    Returns:
+        Path to the temporary file.
+    """
+    # pylint: disable-next=consider-using-with
+    temporary = NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    temporary_file = Path(temporary.name)
+
+    try:
+        with temporary:
+            position = 0
+            for (region_start, region_end), chunks in replacements:
+                _copy(content, position, region_start, temporary.buffer)
+                temporary.writelines(chunks)
+                temporary.flush()
+                position = region_end
+            _copy(content, position, len(content), temporary.buffer)
+            temporary.flush()
+            os.fsync(temporary.fileno())
+
+        shutil.copymode(path, temporary_file)
+    except BaseException:
+        temporary_file.unlink(missing_ok=True)
+        raise
+
+    return temporary_file
+
+
+def replace(temporary_file: Path, path: Path) -> None:
+    """Atomically replace `path` with `temporary_file`, which is removed if that fails."""
+    try:
+        os.replace(temporary_file, path)
+    except BaseException:
+        temporary_file.unlink(missing_ok=True)
+        raise
+
+
+def _describe_region(update_between: tuple[str | None, str | None]) -> str:
+    if update_between[0] and update_between[1]:
+        return f"'{update_between[0]}' and '{update_between[1]}'"
+    return "the whole file"
+
+
+def update_regions(
+    update_file: Path,
+    updates: Sequence[tuple[tuple[str | None, str | None], str | Iterable[str]]],
+    check: bool = False,
+) -> bool:
+    """Write several rendered documents into regions of the same file, reading and writing it only once.
+
+    Each document replaces the content between its boundary marks, or the whole file if it has none. With several
+    regions, each ends at the first end mark after its start mark, so regions may share an end mark.
+    The file is memory-mapped and scanned for the boundary marks once. The documentation can be given as
+    chunks, which are written into a temporary file next to `update_file` as they come, so neither the
+    file nor the new documents are held in memory. The temporary file then atomically replaces `update_file`
+    only if it differs.
+
+    Returns:
+        `True` if the file was already up-to-date. In the `check` mode, the file is never written and
+        a unified diff of the expected changes is printed instead.
+    """
+    update_file = Path(os.path.realpath(update_file))
+    # A single region ends at the last end mark, as it always did. Several regions end at the first one after
+    # their start, so they can share an end mark.
+    greedy = sum(1 for update_between, _ in updates if update_between[0] and update_between[1]) <= 1
+
+    with open(update_file, "rb") as file, map_file(file) as content:
+        replacements: list[tuple[tuple[int, int], Iterable[str]]] = []
+        descriptions: dict[tuple[int, int], str] = {}
+
+        for update_between, rendered_doc in updates:
+            if update_between[0] and update_between[1]:
+                found_region = find_between(content, update_between[0], update_between[1], greedy)
+
+                if found_region is None:
+                    click.secho(
+                        f"Boundary marks {_describe_region(update_between)} not found in '{update_file}'. "
+                        f"Cannot update the content.",
+                        fg="red",
+                        err=True,
+                    )
+                    raise click.Abort()
+
+                region = found_region
+            else:
+                region = (0, len(content))
+
+            replacements.append((region, (rendered_doc,) if isinstance(rendered_doc, str) else rendered_doc))
+            descriptions.setdefault(region, _describe_region(update_between))
+
+        replacements.sort(key=lambda replacement: replacement[0])
+
+        for previous, current in zip(replacements, replacements[1:]):
+            if current[0][0] < previous[0][1] or current[0] == previous[0]:
+                click.secho(
+                    f"Regions between {descriptions[previous[0]]} and {descriptions[current[0]]} "
+                    f"in '{update_file}' overlap. Cannot update the content.",
+                    fg="red",
+                    err=True,
+                )
+                raise click.Abort()
+
+        if check:
+            return _check_file(update_file, content, [(region, "".join(chunks)) for region, chunks in replacements])
+
+        temporary_file = write_spliced(update_file, content, replacements)
+
+    if filecmp.cmp(temporary_file, update_file, shallow=False):
+        temporary_file.unlink()
+        return True
+
+    replace(temporary_file, update_file)
+    return False
+
+
+def _check_file(update_file: Path, content: Content, replacements: list[tuple[tuple[int, int], str]]) -> bool:
+    """Print a unified diff of the changes `update_regions()` would make, if any.
+
+    Returns:
+        `True` if the file is up-to-date.
+    """
+    encoded_docs = [encode(rendered_doc) for _, rendered_doc in replacements]
+
+    if all(content[start:end] == encoded_doc for ((start, end), _), encoded_doc in zip(replacements, encoded_docs)):
+        return True
+
+    new_content = bytearray()
+    position = 0
+    for ((start, end), _), encoded_doc in zip(replacements, encoded_docs):
+        new_content += content[position:start] + encoded_doc
+        position = end
+    new_content += content[position:]
+
+    for line in difflib.unified_diff(
+        content[:].decode("utf-8").splitlines(keepends=True),
+        new_content.decode("utf-8").splitlines(keepends=True),
+        fromfile=str(update_file),
+        tofile=f"{update_file} (generated)",
+    ):
+        click.echo(line, nl=not line.endswith("\n"))
+    click.secho(f"File '{update_file}' is not up-to-date.", fg="red", err=True)
+    return False
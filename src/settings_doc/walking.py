@@ -0,0 +1,161 @@
+"""Expanding fields of settings classes and their nested models into environment variable names."""
+
+from __future__ import annotations
+
+from enum import Enum
+from inspect import isclass
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator, NamedTuple, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+import click
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+
+DEFAULT_MAX_DEPTH: Final[int] = 32
+
+
+class Expansion(NamedTuple):
+    """Fields of a (nested) model, see `expand_model()`."""
+
+    fields: tuple[tuple[str, FieldInfo, bool], ...]
+    """Fields with their environment variable names and whether the name is absolute (not prefixed)."""
+    height: int
+    """Number of nested model levels below the model."""
+    deepest_path: tuple[str, ...]
+    """Names of the fields leading to the most deeply nested model."""
+    errors: tuple[str, ...]
+    """Errors to log whenever the model is walked."""
+
+
+# Expansions of (nested) models per delimiter.
+_EXPANSIONS: WeakKeyDictionary[type[BaseModel], dict[str, Expansion]] = WeakKeyDictionary()
+
+
+def forget_expansions(models: Iterable[type[BaseModel]] = ()) -> None:
+    """Forget the cached expansions of the models, or of all models if none are given, so that they are walked
+    again on next use."""
+    models = list(models)
+    if not models:
+        _EXPANSIONS.clear()
+
+    for model in models:
+        _EXPANSIONS.pop(model, None)
+
+
+def _walk_error(
+    stack: list[tuple[type[BaseModel], str]], problem: str, path: tuple[str, ...] = ()
+) -> click.BadParameter:
+    path = tuple(field_name for _, field_name in stack[1:]) + path
+    return click.BadParameter(
+        f"Cannot walk settings class '{stack[0][0].__qualname__}': {problem} at '{'.'.join(path)}'."
+    )
+
+
+def expand_model(
+    cls: type[BaseModel], delimiter: str, max_depth: int, stack: list[tuple[type[BaseModel], str]]
+) -> Expansion:
+    """Expand (nested) fields of a model into environment variable names relative to the model's prefix.
+
+    Expansions are cached per model and delimiter, so models shared by many settings classes are walked
+    only once. `stack` holds the models being walked, starting with the settings class and ending with
+    `cls`, and the names of the fields leading to them.
+    """
+    level = len(stack) - 1
+
+    if any(model is cls for model, _ in stack[:-1]):
+        raise _walk_error(stack, f"model '{cls.__qualname__}' contains itself")
+    if level > max_depth:
+        raise _walk_error(stack, f"models are nested deeper than {max_depth} levels")
+
+    expansions = _EXPANSIONS.setdefault(cls, {})
+    if delimiter not in expansions:
+        expansions[delimiter] = _walk_model(cls, delimiter, max_depth, stack)
+
+    expansion = expansions[delimiter]
+    if level + expansion.height > max_depth:
+        # Only possible for cached expansions, as the deepest models would have failed above otherwise
+        raise _walk_error(
+            stack, f"models are nested deeper than {max_depth} levels", expansion.deepest_path[: max_depth + 1 - level]
+        )
+
+    return expansion
+
+
+def _walk_model(
+    cls: type[BaseModel], delimiter: str, max_depth: int, stack: list[tuple[type[BaseModel], str]]
+) -> Expansion:
+    from pydantic import BaseModel  # pylint: disable=import-outside-toplevel
+    from pydantic_settings import BaseSettings  # pylint: disable=import-outside-toplevel
+
+    fields: list[tuple[str, FieldInfo, bool]] = []
+    errors: list[str] = []
+    height = 0
+    deepest_path: tuple[str, ...] = ()
+
+    for field_name, model_field in cls.model_fields.items():
+        if model_field.validation_alias is not None:
+            if isinstance(model_field.validation_alias, str):
+                fields.append((model_field.validation_alias, model_field, True))
+            else:
+                errors.append(f"Unsupported validation alias type '{type(model_field.validation_alias)}'.")
+        elif isclass(model_field.annotation) and issubclass(model_field.annotation, BaseModel):
+            # There are nested fields and they can be joined by a delimiter. Generate variable names recursively.
+            nested = model_field.annotation
+            nested_stack = stack + [(nested, field_name)]
+
+            if issubclass(nested, BaseSettings):
+                expansion = expand_model(
+                    nested, nested.model_config["env_nested_delimiter"] or "", max_depth, nested_stack
+                )
+                nested_prefix, nested_absolute = nested.model_config["env_prefix"], True
+            else:  # BaseModel
+                expansion = expand_model(nested, delimiter, max_depth, nested_stack)
+                nested_prefix, nested_absolute = field_name + delimiter, False
+
+            fields.extend(
+                (name, field, True) if absolute else (nested_prefix + name, field, nested_absolute)
+                for name, field, absolute in expansion.fields
+            )
+            errors.extend(expansion.errors)
+
+            if expansion.height + 1 > height:
+                height = expansion.height + 1
+                deepest_path = (field_name,) + expansion.deepest_path
+        else:
+            fields.append((field_name, model_field, False))
+
+    return Expansion(tuple(fields), height, deepest_path, tuple(errors))
+
+
+def _annotation_classes(annotation: Any) -> Iterator[type]:
+    """Classes in an annotation, including those nested in `Optional`, `list`, `Union` and similar."""
+    if isclass(annotation) and get_origin(annotation) is None:
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _annotation_classes(arg)
+
+
+def reached_classes(models: Iterable[type]) -> dict[type, None]:
+    """Classes and enums reached when walking models: the models, their nested models and enums of their fields,
+    each with its base classes."""
+    classes: dict[type, None] = {}
+    visited: set[type] = set()
+    pending = list(models)
+
+    while pending:
+        model = pending.pop()
+        if model in visited:
+            continue
+
+        visited.add(model)
+        classes.update(dict.fromkeys(base for base in model.__mro__ if base is not object))
+        for field in getattr(model, "model_fields", {}).values():
+            for cls in _annotation_classes(field.annotation):
+                if issubclass(cls, Enum):
+                    classes.update(dict.fromkeys(base for base in cls.__mro__ if base is not object))
+                elif hasattr(cls, "model_fields"):
+                    pending.append(cls)
+
+    return classes
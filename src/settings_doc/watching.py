@@ -0,0 +1,176 @@
+"""Re-render documentation when the settings modules or templates change."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+import click
+
+from settings_doc import importing, static_importing
+from settings_doc.cache import find_module_source
+from settings_doc.manifest import ManifestJob
+from settings_doc.walking import reached_classes
+
+_FileState = Optional[Tuple[int, int]]
+
+
+def _job_module_paths(job: ManifestJob) -> list[str]:
+    return list(job.module_path) + [path.rsplit(".", maxsplit=1)[0] for path in job.class_path]
+
+
+def _job_classes(job: ManifestJob) -> dict[type, None]:
+    """Classes reached when walking the settings of the job, imported already when the job was rendered."""
+    importer = static_importing if job.static else importing
+    settings = list(importer.import_class_path(job.class_path)) + list(importer.import_module_path(job.module_path))
+    return reached_classes(settings)
+
+
+def _file_state(path: Path) -> _FileState:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _imports_from(module: ModuleType, module_paths: set[str]) -> bool:
+    """Whether the module holds any of the modules, their submodules or objects defined in them."""
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            if any(path == value.__name__ or path.startswith(f"{value.__name__}.") for path in module_paths):
+                return True
+        elif getattr(value, "__module__", None) in module_paths:
+            return True
+    return False
+
+
+def forget_modules(module_paths: Iterable[str], candidates: Iterable[str] = ()) -> list[str]:
+    """Remove imported modules from `sys.modules`, so they are imported again on next use, together with
+    the candidate modules importing from them, directly or through other candidates. The settings classes resolved
+    from import paths are forgotten too.
+
+    Reloading the modules in place is not enough, as modules importing from them would keep the old classes.
+
+    Returns:
+        Import paths of the removed modules.
+    """
+    forgotten = {module_path for module_path in module_paths if module_path in sys.modules}
+    remaining = {module_path for module_path in candidates if module_path in sys.modules} - forgotten
+
+    while True:
+        dependents = {module_path for module_path in remaining if _imports_from(sys.modules[module_path], forgotten)}
+        if not dependents:
+            break
+        forgotten |= dependents
+        remaining -= dependents
+
+    for module_path in forgotten:
+        del sys.modules[module_path]
+
+    importing.clear_caches()
+    static_importing.clear_caches()
+    return sorted(forgotten)
+
+
+class Watcher:
+    """Tracks the files each job depends on and re-renders only the jobs affected by a change.
+
+    The watched files are the source files of the modules given in `module` and `class`, of the modules defining
+    the walked settings classes, their nested models, enums and base classes, and all files in the `templates` folders
+    of each job. Files are polled, as the number of them is small.
+    """
+
+    def __init__(self, jobs: Sequence[ManifestJob], render_job: Callable[[ManifestJob], object]):
+        self.jobs = list(jobs)
+        self.render_job = render_job
+        self._modules: dict[Path, set[str]] = {}
+        self._job_files: list[set[Path]] = []
+        self._states: dict[Path, _FileState] = {}
+
+    def _collect_files(self) -> None:
+        self._modules.clear()
+        self._job_files.clear()
+
+        for job in self.jobs:
+            files: set[Path] = set()
+
+            module_paths = _job_module_paths(job) + [cls.__module__ for cls in _job_classes(job)]
+            for module_path in dict.fromkeys(module_paths):
+                source = find_module_source(module_path)
+                if source is not None:
+                    files.add(source)
+                    self._modules.setdefault(source, set()).add(module_path)
+
+            for folder in job.templates:
+                files.update(path for path in Path(folder).rglob("*") if path.is_file())
+
+            self._job_files.append(files)
+
+        all_files = set().union(*self._job_files)
+        self._states = {path: self._states.get(path, _file_state(path)) for path in all_files}
+
+    def start(self) -> None:
+        """Render all jobs and start tracking their files."""
+        for job in self.jobs:
+            self.render_job(job)
+        self._collect_files()
+
+    def changed_files(self) -> set[Path]:
+        changed = set()
+        for path, state in self._states.items():
+            new_state = _file_state(path)
+            if new_state != state:
+                self._states[path] = new_state
+                changed.add(path)
+        return changed
+
+    def check(self) -> list[ManifestJob]:
+        """Re-render jobs affected by files changed since the last check.
+
+        Returns:
+            Jobs that were re-rendered.
+        """
+        changed = self.changed_files()
+        if not changed:
+            return []
+
+        forget_modules(
+            set().union(*(self._modules.get(path, set()) for path in changed)), set().union(*self._modules.values())
+        )
+
+        affected = [job for job, files in zip(self.jobs, self._job_files) if files & changed]
+        for job in affected:
+            self.render_job(job)
+
+        self._collect_files()  # Template folders may have gained or lost files
+        return affected
+
+
+def watch(jobs: Sequence[ManifestJob], render_job: Callable[[ManifestJob], object], interval: float) -> None:
+    """Render all jobs and keep re-rendering the affected ones on file changes until interrupted."""
+    watcher = Watcher(jobs, render_job)
+    watcher.start()
+    click.echo("Watching for changes. Press Ctrl+C to stop.", err=True)
+
+    try:
+        while True:
+            time.sleep(interval)
+            started = time.perf_counter()
+            try:
+                affected = watcher.check()
+            except click.Abort:  # The reason was already printed
+                continue
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                click.secho(f"Cannot re-generate the output: {exc}", fg="red", err=True)
+                continue
+
+            if affected:
+                elapsed = (time.perf_counter() - started) * 1000
+                click.echo(f"Re-generated {len(affected)} output(s) in {elapsed:.0f} ms.", err=True)
+    except KeyboardInterrupt:
+        pass
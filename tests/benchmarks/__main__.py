@@ -0,0 +1,88 @@
+"""Run the benchmarks: `PYTHONPATH=src python -m tests.benchmarks --help`.
+
+Results of the default scale are compared with the committed `baseline.json`. After an intended change of
+performance, store a new baseline with `--output tests/benchmarks/baseline.json`.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import click
+
+from tests.benchmarks.suite import BASELINE_FILE, find_regressions, run_benchmarks
+from tests.benchmarks.synthetic import Scale
+
+_DEFAULT_SCALE = Scale()
+
+
+@click.command()
+@click.option("--fields", type=click.IntRange(min=1), default=_DEFAULT_SCALE.fields, show_default=True)
+@click.option("--depth", type=click.IntRange(min=0), default=_DEFAULT_SCALE.depth, show_default=True)
+@click.option(
+    "--fields-per-class", type=click.IntRange(min=1), default=_DEFAULT_SCALE.fields_per_class, show_default=True
+)
+@click.option("--enum-size", type=click.IntRange(min=1), default=_DEFAULT_SCALE.enum_size, show_default=True)
+@click.option("--literal-size", type=click.IntRange(min=1), default=_DEFAULT_SCALE.literal_size, show_default=True)
+@click.option("--dict-size", type=click.IntRange(min=0), default=_DEFAULT_SCALE.dict_size, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True, help="Best of how many runs.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write the results as JSON into this file, for example to store a new baseline.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help=(
+        "Fail if any phase is slower or uses more memory than in these results by more than '--tolerance'. "
+        f"Defaults to '{BASELINE_FILE.name}' next to the benchmarks, if the scale matches it."
+    ),
+)
+@click.option("--tolerance", type=click.FloatRange(min=0), default=0.25, show_default=True)
+def benchmark(  # pylint: disable=too-many-arguments
+    fields: int,
+    depth: int,
+    fields_per_class: int,
+    enum_size: int,
+    literal_size: int,
+    dict_size: int,
+    repeat: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+):
+    """Benchmarks generating documentation for synthetic settings classes."""
+    scale = Scale(fields, depth, fields_per_class, enum_size, literal_size, dict_size)
+
+    with TemporaryDirectory() as folder:
+        results = run_benchmarks(scale, Path(folder), repeat)
+
+    click.echo(f"{results['environment_variables']} environment variables, best of {repeat} runs:")
+    for name, phase in results["phases"].items():
+        click.echo(f"  {name:<16} {phase['seconds'] * 1000:10.1f} ms {phase['peak_memory_bytes'] / 2**20:10.1f} MiB")
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    baseline_results = json.loads((baseline or BASELINE_FILE).read_text(encoding="utf-8"))
+    if baseline is None and baseline_results["scale"] != results["scale"]:
+        click.echo(f"Not compared with '{BASELINE_FILE.name}', it was recorded with a different scale.")
+        return
+
+    try:
+        regressions = find_regressions(results, baseline_results, tolerance)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+    for regression in regressions:
+        click.secho(regression, fg="red", err=True)
+
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    benchmark()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,180 @@
+"""Timing and peak memory of each phase of generating the documentation."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from subprocess import run
+from typing import Any, Callable
+
+from pydantic_settings import BaseSettings
+
+import settings_doc
+from settings_doc import importing, walking
+from settings_doc.entries import SettingEntry
+from settings_doc.main import _update_file
+from settings_doc.streaming import (
+    OutputFormat,
+    create_environment,
+    render_settings,
+    stream_settings,
+    walk_settings,
+)
+from tests.benchmarks.synthetic import Scale, settings_module_source
+
+RESULTS_VERSION = 1
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+MODULE_NAME = "settings_doc_benchmark_settings"
+_START_MARK = "<!-- start -->"
+_END_MARK = "<!-- end -->"
+_SURROUNDING_TEXT = "Lorem ipsum dolor sit amet.\n" * 20_000
+_OUTPUT_FORMATS = (OutputFormat.DOTENV, OutputFormat.MARKDOWN)  # The debug format is not meant to be fast
+_STARTUP_SCRIPT = """
+import json, sys, time, tracemalloc
+if sys.argv[1] == "trace":
+    tracemalloc.start()
+started = time.perf_counter()
+import settings_doc.main
+print(json.dumps([time.perf_counter() - started, tracemalloc.get_traced_memory()[1]]))
+"""
+
+
+def _measure(function: Callable[[], Any], prepare: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """Run `function` `repeat` times, each time after `prepare`.
+
+    Returns:
+        The shortest run time in seconds and the peak memory allocated by `function` in bytes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        prepare()
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+
+    prepare()
+    tracemalloc.start()
+    try:
+        function()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return best, peak_memory
+
+
+def _measure_startup(repeat: int) -> tuple[float, int]:
+    """Import the CLI `repeat` times, each in a fresh interpreter, as on each run of the command.
+
+    Returns:
+        The shortest import time in seconds and the peak memory allocated by the import in bytes.
+    """
+    env = dict(os.environ, PYTHONPATH=str(Path(settings_doc.__file__).parent.parent))
+
+    def _start(trace: bool) -> tuple[float, int]:
+        mode = "trace" if trace else "time"
+        result = run([sys.executable, "-c", _STARTUP_SCRIPT, mode], capture_output=True, text=True, env=env, check=True)
+        seconds, peak_memory = json.loads(result.stdout)
+        return seconds, peak_memory
+
+    return min(_start(trace=False)[0] for _ in range(repeat)), _start(trace=True)[1]
+
+
+def run_benchmarks(scale: Scale, folder: Path, repeat: int = 3) -> dict[str, Any]:
+    """Generate a settings module of the given scale in `folder` and benchmark all phases on it."""
+    (folder / f"{MODULE_NAME}.py").write_text(settings_module_source(scale), encoding="utf-8")
+    sys.path.insert(0, str(folder))
+
+    def _forget_module() -> None:
+        sys.modules.pop(MODULE_NAME, None)
+        importing.import_module_path.cache_clear()
+
+    try:
+        phases: dict[str, tuple[float, int]] = {"startup": _measure_startup(repeat)}
+        phases["import"] = _measure(lambda: importing.import_module_path((MODULE_NAME,)), _forget_module, repeat)
+        settings = importing.import_module_path((MODULE_NAME,))
+
+        walked_fields: dict[type[BaseSettings], list[SettingEntry]] = {}
+
+        def _walk() -> None:
+            walked_fields.update((cls, walk_settings(cls)) for cls in settings)
+
+        def _forget_walks() -> None:
+            walked_fields.clear()
+            walking._EXPANSIONS.clear()  # pylint: disable=protected-access
+
+        phases["walk"] = _measure(_walk, _forget_walks, repeat)
+        env = create_environment(())
+        rendered_docs: dict[OutputFormat, str] = {}
+
+        for output_format in _OUTPUT_FORMATS:
+            env.get_template(f"{output_format.value}.jinja")  # Compile outside of the measurement
+
+            def _render(fmt: OutputFormat = output_format) -> None:
+                rendered_docs[fmt] = render_settings(env, fmt, settings, 0, walked_fields=walked_fields)
+
+            phases[f"render_{output_format.value}"] = _measure(_render, lambda: None, repeat)
+
+        update_file = folder / "README.md"
+
+        def _reset_update_file() -> None:
+            update_file.write_text(f"{_SURROUNDING_TEXT}{_START_MARK}\n{_END_MARK}\n{_SURROUNDING_TEXT}", "utf-8")
+
+        phases["update"] = _measure(
+            lambda: _update_file(update_file, (_START_MARK, _END_MARK), rendered_docs[OutputFormat.MARKDOWN]),
+            _reset_update_file,
+            repeat,
+        )
+        phases["update_streamed"] = _measure(
+            lambda: _update_file(
+                update_file,
+                (_START_MARK, _END_MARK),
+                stream_settings(env, OutputFormat.MARKDOWN, settings, 0, walked_fields=walked_fields),
+            ),
+            _reset_update_file,
+            repeat,
+        )
+    finally:
+        sys.path.remove(str(folder))
+        _forget_module()
+
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "scale": scale.as_dict(),
+        "environment_variables": sum(len(fields) for fields in walked_fields.values()),
+        "phases": {
+            name: {"seconds": seconds, "peak_memory_bytes": peak_memory}
+            for name, (seconds, peak_memory) in phases.items()
+        },
+    }
+
+
+def find_regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Compare results with a baseline.
+
+    Returns:
+        Descriptions of phases slower or using more memory than the baseline by more than `tolerance` (a ratio).
+    """
+    if results["scale"] != baseline["scale"]:
+        raise ValueError(f"The baseline was recorded with a different scale: {baseline['scale']}.")
+
+    regressions = []
+    for name, baseline_phase in baseline["phases"].items():
+        phase = results["phases"].get(name)
+        if phase is None:
+            continue
+
+        for metric in ("seconds", "peak_memory_bytes"):
+            if phase[metric] > baseline_phase[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} increased from {baseline_phase[metric]:.6g} to {phase[metric]:.6g} "
+                    f"({phase[metric] / baseline_phase[metric] - 1:+.0%})."
+                )
+
+    return regressions
@@ -0,0 +1,86 @@
+"""Source code generator of synthetic settings modules for benchmarks."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class Scale:
+    fields: int = 1000
+    """Total number of fields across all settings classes, not counting the nested models."""
+    depth: int = 3
+    """Depth of the nested `BaseModel` chain added to each settings class."""
+    fields_per_class: int = 500
+    enum_size: int = 50
+    literal_size: int = 20
+    dict_size: int = 20
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+_HEADER = """\
+from enum import Enum
+from typing import Literal
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+"""
+
+
+def _enum(scale: Scale) -> str:
+    members = "\n".join(f'    MEMBER_{index} = "member_{index}"' for index in range(scale.enum_size))
+    return f"\n\nclass LargeEnum(str, Enum):\n{members}\n"
+
+
+def _nested_models(scale: Scale) -> str:
+    code = []
+    for level in range(scale.depth, 0, -1):
+        child = f"    child: Level{level + 1} = Level{level + 1}()\n" if level < scale.depth else ""
+        code.append(f'\n\nclass Level{level}(BaseModel):\n    leaf_{level}: str = "leaf"\n{child}')
+    return "".join(code)
+
+
+def _field(index: int, scale: Scale) -> str:
+    kind = index % 6
+    if kind == 0:
+        return f'    field_{index}: str = Field("value", description="Description of field {index}.")'
+    if kind == 1:
+        return f"    field_{index}: int = Field({index}, examples=[1, 2, 3])"
+    if kind == 2:
+        values = ", ".join(f'"value_{value}"' for value in range(scale.literal_size))
+        return f'    field_{index}: Literal[{values}] = "value_0"'
+    if kind == 3:
+        return f"    field_{index}: LargeEnum = LargeEnum.MEMBER_0"
+    if kind == 4:
+        items = ", ".join(f'"key_{key}": {key}' for key in range(scale.dict_size))
+        return f"    field_{index}: dict = {{{items}}}"
+    return (
+        f"    field_{index}: str = Field(..., json_schema_extra="
+        f'{{"possible_values": [["a", "First."], ["b", "Second."]], "examples": ["a", "b"]}})'
+    )
+
+
+def settings_module_source(scale: Scale) -> str:
+    """Source code of a module with `BaseSettings` classes having `scale.fields` fields in total.
+
+    Each settings class also has a chain of `scale.depth` nested models with one field on each level.
+    """
+    code = [_HEADER, _enum(scale), _nested_models(scale)]
+
+    for class_index, start in enumerate(range(0, scale.fields, scale.fields_per_class)):
+        class_fields = [
+            _field(index, scale) for index in range(start, min(start + scale.fields_per_class, scale.fields))
+        ]
+        if scale.depth:
+            class_fields.insert(0, "    nested: Level1 = Level1()")
+
+        code.append(
+            f"\n\nclass Settings{class_index}(BaseSettings):\n"
+            f'    model_config = SettingsConfigDict(env_prefix="APP{class_index}_", env_nested_delimiter="__")\n\n'
+            + "\n".join(class_fields)
+            + "\n"
+        )
+
+    return "".join(code)
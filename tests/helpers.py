@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import importlib
+import sys
 from collections.abc import Iterable as IterableCollection
-from typing import Iterable, Literal
+from contextlib import contextmanager
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterable, Iterator, Literal, Mapping
 
+import pytest
 from click.testing import CliRunner, Result
 from jinja2 import Environment, Template
 from pydantic_settings import BaseSettings
 from pytest_mock import MockerFixture
 
+from settings_doc import OutputFormat, importing, parallel_importing, render, static_importing
 from settings_doc.main import app
 
+OUTPUT_FORMATS = pytest.mark.parametrize(
+    "output_format",
+    [pytest.param(OutputFormat.MARKDOWN, id="markdown"), pytest.param(OutputFormat.DOTENV, id="dotenv")],
+)
+
 
 def _mock_import_path(
     path_type: Literal["class", "module"],
@@ -59,7 +71,7 @@ def run_app_with_settings(
         assert fmt == "markdown", "The `fmt` argument is ignored when `template` is used."
         if isinstance(template, str):
             template = Environment().from_string(template)
-        mocker.patch("settings_doc.main.get_template", return_value=template)
+        mocker.patch("settings_doc.streaming.get_template", return_value=template)
 
     if args is None:
         args = []
@@ -74,3 +86,52 @@ def run_app_with_settings(
 
 def copy_templates(runner: CliRunner, folder: str) -> Result:
     return runner.invoke(app, ["templates", "--copy-to", folder], catch_exceptions=False)
+
+
+def _clear_import_caches() -> None:
+    importing.clear_caches()
+    static_importing.clear_caches()
+    parallel_importing.import_module_path.cache_clear()
+
+
+@contextmanager
+def importable_modules(folder: Path, sources: Mapping[str, str]) -> Iterator[Path]:
+    """Write modules into a folder and make them importable until the context exits.
+
+    Args:
+        folder: Folder to write the modules into, usually ``tmp_path``.
+        sources: Source code of the modules, dedented before writing, by their paths relative to ``folder``,
+            e.g. ``"settings.py"`` or ``"package/__init__.py"``.
+
+    Yields:
+        The folder. Imported settings are forgotten when entering and exiting the context, and the written
+        modules, including any imported in the meantime from the same top-level packages, are removed
+        from ``sys.modules`` on exit.
+    """
+    for name, source in sources.items():
+        path = folder / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dedent(source), encoding="utf-8")
+
+    top_level_names = {Path(name).parts[0].split(".")[0] for name in sources}
+    sys.path.insert(0, str(folder))
+    importlib.invalidate_caches()
+    _clear_import_caches()
+
+    try:
+        yield folder
+    finally:
+        sys.path.remove(str(folder))
+        for module_path in [_ for _ in sys.modules if _.split(".")[0] in top_level_names]:
+            del sys.modules[module_path]
+        _clear_import_caches()
+
+
+def assert_same_output_as_import(
+    output_format: OutputFormat,
+    output: str,
+    module_path: tuple[str, ...] = (),
+    class_path: tuple[str, ...] = (),
+) -> None:
+    """Assert that the output rendered another way is the same as when importing the settings in this process."""
+    assert output == render(output_format, module_path=module_path, class_path=class_path)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from click.testing import CliRunner
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pytest_mock import MockerFixture
+
+from settings_doc.main import app
+from tests.helpers import mock_import_class_path, run_app_with_settings
+
+
+class BaseAppSettings(BaseSettings):
+    shared: str = Field("value", description="Shared by all settings classes.")
+
+
+class FirstSettings(BaseAppSettings):
+    first: str
+
+
+class SecondSettings(BaseAppSettings):
+    second: str
+
+
+class ConflictingSettings(BaseSettings):
+    shared: int = 1
+
+
+class CaseSensitiveSettings(BaseSettings):
+    model_config = SettingsConfigDict(case_sensitive=True)
+
+    SHARED: int = 1
+
+
+def _invoke(runner: CliRunner, mocker: MockerFixture, settings: list[type[BaseSettings]], *args: str):
+    mock_import_class_path(mocker, settings)
+    return runner.invoke(app, ["generate", "--class", "THIS_SHOULD_NOT_BE_USED", "-f", "dotenv", *args])
+
+
+class TestDuplicateEnvironmentVariables:
+    @staticmethod
+    def should_document_identical_definitions_once(runner: CliRunner, mocker: MockerFixture):
+        stdout = run_app_with_settings(mocker, runner, [FirstSettings, SecondSettings], fmt="dotenv")
+
+        assert stdout.count("shared=value") == 1
+        assert "first=" in stdout
+        assert "second=" in stdout
+
+    @staticmethod
+    def should_document_and_report_conflicting_definitions(runner: CliRunner, mocker: MockerFixture):
+        result = _invoke(runner, mocker, [FirstSettings, ConflictingSettings])
+
+        assert result.exit_code == 0, result.output
+        assert "SHARED=value" in result.output
+        assert "SHARED=1" in result.output
+        assert (
+            "Environment variable 'SHARED' is defined differently in "
+            f"'{__name__}.FirstSettings' and '{__name__}.ConflictingSettings'."
+        ) in result.output
+
+    @staticmethod
+    def should_report_conflict_with_case_sensitive_class(runner: CliRunner, mocker: MockerFixture):
+        result = _invoke(runner, mocker, [FirstSettings, CaseSensitiveSettings])
+
+        assert result.exit_code == 0, result.output
+        assert "is defined differently" in result.output
+
+    @staticmethod
+    def should_fail_on_conflicts_when_requested(runner: CliRunner, mocker: MockerFixture):
+        result = _invoke(runner, mocker, [FirstSettings, ConflictingSettings], "--fail-on-conflicts")
+
+        assert result.exit_code == 2
+        assert "Environment variable 'SHARED' is defined differently" in result.output
+        assert "SHARED=" not in result.output
+
+    @staticmethod
+    def should_not_fail_on_identical_definitions(runner: CliRunner, mocker: MockerFixture):
+        result = _invoke(runner, mocker, [FirstSettings, SecondSettings], "--fail-on-conflicts")
+
+        assert result.exit_code == 0, result.output
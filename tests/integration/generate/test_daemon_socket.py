@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc import main
+from settings_doc.main import app
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not available on Windows.")
+
+_ARGS = ["--class", "tests.fixtures.valid_settings.EmptySettings", "--output-format", "dotenv"]
+
+
+@pytest.fixture()
+def daemon_socket(tmp_path: Path) -> Iterator[Path]:
+    # Imported here, as the module cannot be imported on Windows
+    from settings_doc.daemon import Daemon, _is_listening  # pylint: disable=import-outside-toplevel
+
+    socket_path = tmp_path / "daemon.sock"
+    server = Daemon(app)
+    thread = threading.Thread(target=server.serve, args=(socket_path,), daemon=True)
+    thread.start()
+    while not _is_listening(socket_path):
+        time.sleep(0.01)
+
+    yield socket_path
+
+    server.shutdown()
+    thread.join()
+
+
+class TestDaemon:
+    @staticmethod
+    def should_generate_the_same_output_as_generate(runner: CliRunner):
+        from settings_doc.daemon import Daemon  # pylint: disable=import-outside-toplevel
+
+        response = Daemon(app).handle({"version": 1, "cwd": os.getcwd(), "args": _ARGS})
+
+        assert response.exit_code == 0
+        assert response.stdout == runner.invoke(app, ["generate", *_ARGS]).stdout
+
+
+class TestDaemonSocketOption:
+    @staticmethod
+    def should_forward_generate_to_the_daemon(runner: CliRunner, daemon_socket: Path, mocker: MockerFixture):
+        load_settings = mocker.spy(main, "_load_settings")
+
+        result = runner.invoke(app, ["generate", *_ARGS, "--daemon-socket", str(daemon_socket)])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout == runner.invoke(app, ["generate", *_ARGS]).stdout
+        assert load_settings.call_count == 2  # Once in the daemon thread, once by the direct invocation
+
+    @staticmethod
+    def should_forward_the_exit_code(runner: CliRunner, daemon_socket: Path):
+        result = runner.invoke(
+            app, ["generate", "--class", "not_a_module.Class", "--daemon-socket", str(daemon_socket)]
+        )
+
+        assert result.exit_code == 2
+        assert "Missing option '--output-format'" in result.output
+
+    @staticmethod
+    def should_generate_in_this_process_without_daemon(runner: CliRunner, tmp_path: Path):
+        result = runner.invoke(app, ["generate", *_ARGS, "--daemon-socket", str(tmp_path / "missing.sock")])
+
+        assert result.exit_code == 0, result.output
+        assert "No daemon is listening" in result.output
+        assert "LOGGING_LEVEL=\n" in result.output
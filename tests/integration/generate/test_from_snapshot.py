@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+_SOURCE = """
+    from typing import Tuple
+
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(env_prefix="APP_")
+
+        hosts: Tuple[str, ...] = ("a", "b")
+    """
+
+
+class TestFromSnapshotOption:
+    @staticmethod
+    def should_render_snapshot_without_importing_settings(runner: CliRunner, tmp_path: Path):
+        snapshot_file = tmp_path / "settings.json"
+        snapshot_file.touch()
+        with importable_modules(tmp_path, {"snapshot_settings.py": _SOURCE}):
+            result = runner.invoke(
+                app, ["generate", "-m", "snapshot_settings", "-f", "json", "--update", str(snapshot_file)]
+            )
+            assert result.exit_code == 0, result.output
+
+        result = runner.invoke(app, ["generate", "--from-snapshot", str(snapshot_file), "-f", "dotenv"])
+
+        assert result.exit_code == 0, result.output
+        assert "# APP_HOSTS=('a', 'b')\n" in result.stdout
+        assert "snapshot_settings" not in sys.modules
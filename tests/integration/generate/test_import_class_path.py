@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import pytest
 from click import BadParameter
+from click.testing import CliRunner
 from pydantic_settings import BaseSettings
 
 from settings_doc.importing import import_class_path
+from settings_doc.main import app
 from tests.fixtures.valid_settings import EmptySettings, FullSettings
 
 _PREFIX = "Cannot read the settings class: "
@@ -61,3 +63,10 @@ class TestImportClassPath:
     def should_fail_with_bad_parameter_when(class_path, error_message):
         with pytest.raises(BadParameter, match=error_message):
             import_class_path((class_path,))
+
+    @staticmethod
+    def should_name_the_option_in_the_error(runner: CliRunner):
+        result = runner.invoke(app, ["generate", "--class", "not_a_module.Settings", "--output-format", "dotenv"])
+
+        assert result.exit_code != 0
+        assert f"Invalid value for '--class' / '-c': {_PREFIX}No module named 'not_a_module'" in result.output
@@ -3,9 +3,11 @@ from __future__ import annotations
 import pytest
 from _pytest.capture import CaptureFixture
 from click import BadParameter
+from click.testing import CliRunner
 from pydantic_settings import BaseSettings
 
 from settings_doc.importing import import_module_path
+from settings_doc.main import app
 from tests.fixtures.module_with_single_settings_class import SingleSettingsInModule
 from tests.fixtures.valid_settings import (
     EmptySettings,
@@ -138,3 +140,10 @@ class TestImportModulePath:
         classes = import_module_path(class_paths)
         assert classes == {SingleSettingsInModule: None}
         assert error_msg in capsys.readouterr().err
+
+    @staticmethod
+    def should_name_the_option_in_the_error(runner: CliRunner):
+        result = runner.invoke(app, ["generate", "--module", "not_a_module", "--output-format", "dotenv"])
+
+        assert result.exit_code != 0
+        assert f"Invalid value for '--module' / '-m': {_PREFIX}No module named 'not_a_module'" in result.output
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+_SOURCES = {
+    "isolated_settings.py": """
+        from pydantic import Field
+        from pydantic_settings import BaseSettings
+
+        class IsolatedSettings(BaseSettings):
+            level: str = Field("info", description="Log level.")
+        """,
+    "greedy_settings.py": """
+        data = bytearray(4 * 1024 * 1024 * 1024)
+        """,
+}
+
+
+@pytest.fixture()
+def isolated_modules(tmp_path: Path) -> Iterator[None]:
+    with importable_modules(tmp_path, _SOURCES):
+        yield
+
+
+class TestIsolatedImportOption:
+    @staticmethod
+    def should_generate_with_child_processes(runner: CliRunner, isolated_modules: None):
+        result = runner.invoke(app, ["generate", "--module", "isolated_settings", "-f", "dotenv", "--isolated-import"])
+
+        assert result.exit_code == 0, result.output
+        assert "# Log level.\n# LEVEL=info\n" in result.stdout
+        assert "isolated_settings" not in sys.modules
+
+    @staticmethod
+    @pytest.mark.skipif(sys.platform == "win32", reason="RLIMIT_AS is not available on Windows.")
+    def should_name_the_module_exceeding_the_memory_limit(runner: CliRunner, isolated_modules: None):
+        result = runner.invoke(
+            app,
+            [
+                "generate",
+                "--module",
+                "greedy_settings",
+                "-f",
+                "dotenv",
+                "--isolated-import",
+                "--import-memory-limit",
+                "512",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Importing 'greedy_settings' exceeded the memory limit of 512 MiB." in result.output
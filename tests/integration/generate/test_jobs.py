@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+_SOURCE = """
+    from enum import Enum
+
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    class Color(str, Enum):
+        RED = "red"
+        GREEN = "green"
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(env_prefix="APP_")
+
+        color: Color = Color.RED
+    """
+
+
+class TestJobsOption:
+    @staticmethod
+    def should_generate_with_worker_processes(runner: CliRunner, tmp_path: Path):
+        with importable_modules(tmp_path, {"worker_settings.py": _SOURCE}):
+            result = runner.invoke(app, ["generate", "--module", "worker_settings", "-f", "dotenv", "--jobs", "2"])
+
+            assert result.exit_code == 0, result.output
+            assert "# APP_COLOR=red\n" in result.stdout
+            assert "worker_settings" not in sys.modules
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc import updating
+from settings_doc.main import app
+from tests.fixtures.valid_settings import SETTINGS_MARKDOWN_FIRST_LINE
+
+_START_MARK = "<!-- settings-doc START -->"
+_END_MARK = "<!-- settings-doc END -->"
+
+
+def _write_manifest(folder: Path, content: str) -> Path:
+    manifest_file = folder / "settings-doc.toml"
+    manifest_file.write_text(content, encoding="utf-8")
+    return manifest_file
+
+
+def _run_manifest(runner: CliRunner, manifest_file: Path, *args: str):
+    return runner.invoke(app, ["generate", "--manifest", str(manifest_file), *args])
+
+
+class TestManifestOption:
+    @staticmethod
+    def should_run_all_jobs(runner: CliRunner, tmp_path: Path):
+        (tmp_path / "README.md").write_text(f"{_START_MARK}\n{_END_MARK}\n", encoding="utf-8")
+        (tmp_path / ".env.example").write_text("", encoding="utf-8")
+        manifest_file = _write_manifest(
+            tmp_path,
+            f"""
+[[job]]
+class = "tests.fixtures.valid_settings.EmptySettings"
+output-format = "markdown"
+update = "README.md"
+between = ["{_START_MARK}", "{_END_MARK}"]
+
+[[job]]
+class = ["tests.fixtures.valid_settings.EmptySettings"]
+output-format = "dotenv"
+update = ".env.example"
+""",
+        )
+
+        result = _run_manifest(runner, manifest_file)
+
+        assert result.exit_code == 0, result.output
+        readme = (tmp_path / "README.md").read_text(encoding="utf-8").lower()
+        assert f"{_START_MARK}\n{SETTINGS_MARKDOWN_FIRST_LINE}".lower() in readme
+        assert "logging_level=\n" in (tmp_path / ".env.example").read_text(encoding="utf-8").lower()
+
+    @staticmethod
+    def should_update_regions_of_the_same_file_at_once(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        (tmp_path / "README.md").write_text(
+            f"intro\n{_START_MARK}\n{_END_MARK}\nmiddle\n<!-- env START -->\n<!-- env END -->\noutro\n",
+            encoding="utf-8",
+        )
+        manifest_file = _write_manifest(
+            tmp_path,
+            f"""
+[[job]]
+class = "tests.fixtures.valid_settings.EmptySettings"
+output-format = "dotenv"
+update = "README.md"
+between = ["<!-- env START -->", "<!-- env END -->"]
+
+[[job]]
+class = "tests.fixtures.valid_settings.FullSettings"
+output-format = "markdown"
+update = "README.md"
+between = ["{_START_MARK}", "{_END_MARK}"]
+""",
+        )
+        write_spliced = mocker.spy(updating, "write_spliced")
+
+        result = _run_manifest(runner, manifest_file)
+
+        assert result.exit_code == 0, result.output
+        write_spliced.assert_called_once()
+        readme = (tmp_path / "README.md").read_text(encoding="utf-8")
+        assert readme.startswith(f"intro\n{_START_MARK}\n# `LOGGING_LEVEL`\n")
+        assert readme.endswith(f"{_END_MARK}\nmiddle\n<!-- env START -->\nLOGGING_LEVEL=\n\n<!-- env END -->\noutro\n")
+
+    @staticmethod
+    def should_walk_each_settings_class_only_once(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        manifest_file = _write_manifest(
+            tmp_path,
+            """
+[[job]]
+class = "tests.fixtures.valid_settings.EmptySettings"
+output-format = "markdown"
+
+[[job]]
+class = "tests.fixtures.valid_settings.EmptySettings"
+output-format = "dotenv"
+""",
+        )
+        model_fields = mocker.patch("settings_doc.streaming.model_fields", return_value=iter([]))
+
+        result = _run_manifest(runner, manifest_file)
+
+        assert result.exit_code == 0, result.output
+        model_fields.assert_called_once()
+
+    @staticmethod
+    def should_fail_in_check_mode_when_any_file_is_not_up_to_date(runner: CliRunner, tmp_path: Path):
+        (tmp_path / "README.md").write_text("old content", encoding="utf-8")
+        manifest_file = _write_manifest(
+            tmp_path,
+            """
+[[job]]
+class = "tests.fixtures.valid_settings.EmptySettings"
+output-format = "markdown"
+update = "README.md"
+""",
+        )
+
+        result = _run_manifest(runner, manifest_file, "--check")
+
+        assert result.exit_code == 1
+        assert "-old content" in result.stdout
+        assert (tmp_path / "README.md").read_text(encoding="utf-8") == "old content"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content, error_message",
+        [
+            pytest.param("", "at least one `[[job]]` table", id="no jobs"),
+            pytest.param("[[job]]\nmodule = 'a'\n", "'output-format' is required", id="missing output format"),
+            pytest.param(
+                "[[job]]\noutput-format = 'markdown'\n", "at least one of 'module' or 'class'", id="missing sources"
+            ),
+            pytest.param(
+                "[[job]]\nclass = 'a.B'\noutput-format = 'markdown'\nfoo = 1\n", "unknown keys foo", id="unknown key"
+            ),
+            pytest.param(
+                "[[job]]\nclass = 'tests.fixtures.valid_settings.EmptySettings'\noutput-format = 'pdf'\n",
+                "unknown output format 'pdf'",
+                id="unknown output format",
+            ),
+            pytest.param("[[job]\n", "Cannot parse the manifest", id="invalid TOML"),
+        ],
+    )
+    def should_fail_when_manifest_is_invalid(runner: CliRunner, tmp_path: Path, content: str, error_message: str):
+        result = _run_manifest(runner, _write_manifest(tmp_path, content))
+
+        assert result.exit_code != 0
+        assert error_message in result.output
+
+    @staticmethod
+    def should_not_be_combined_with_other_options(runner: CliRunner, tmp_path: Path):
+        manifest_file = _write_manifest(tmp_path, "")
+
+        result = _run_manifest(runner, manifest_file, "--output-format", "markdown")
+
+        assert result.exit_code != 0
+        assert "cannot be combined with '--output-format'" in result.output
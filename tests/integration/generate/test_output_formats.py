@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc import importing, streaming, updating
+from settings_doc.main import app
+from tests.fixtures.valid_settings import EmptySettings
+from tests.helpers import mock_import_class_path
+
+_START_MARK = "<!-- settings-doc START -->"
+_END_MARK = "<!-- settings-doc END -->"
+_MARKDOWN_FIRST_LINE = "# `LOGGING_LEVEL`\n"
+
+
+def _invoke(runner: CliRunner, *args: str):
+    return runner.invoke(app, ["generate", "--class", "THIS_SHOULD_NOT_BE_USED", *args])
+
+
+class TestMultipleOutputFormats:
+    @staticmethod
+    def should_write_each_format_into_its_own_file(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, EmptySettings)
+        dotenv_file = tmp_path / ".env.example"
+        markdown_file = tmp_path / "README.md"
+        dotenv_file.write_text("old", encoding="utf-8")
+        markdown_file.write_text(f"prefix\n{_START_MARK}\nold\n{_END_MARK}\nsuffix", encoding="utf-8")
+
+        result = _invoke(
+            runner,
+            *("--output-format", "markdown", "--update", str(markdown_file), "--between", _START_MARK, _END_MARK),
+            *("--output-format", "dotenv", "--update", str(dotenv_file)),
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout == ""
+        assert dotenv_file.read_text(encoding="utf-8") == "LOGGING_LEVEL=\n\n"
+        assert markdown_file.read_text(encoding="utf-8").startswith(f"prefix\n{_START_MARK}\n{_MARKDOWN_FIRST_LINE}")
+        assert markdown_file.read_text(encoding="utf-8").endswith(f"{_END_MARK}\nsuffix")
+
+    @staticmethod
+    def should_update_regions_of_the_same_file_at_once(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, EmptySettings)
+        update_file = tmp_path / "README.md"
+        update_file.write_text(f"{_START_MARK}\n{_END_MARK}\n<!-- env START -->\n<!-- env END -->", encoding="utf-8")
+        write_spliced = mocker.spy(updating, "write_spliced")
+
+        result = _invoke(
+            runner,
+            *("-f", "markdown", "--update", str(update_file), "--between", _START_MARK, _END_MARK),
+            *("-f", "dotenv", "--update", str(update_file), "--between", "<!-- env START -->", "<!-- env END -->"),
+        )
+
+        assert result.exit_code == 0, result.output
+        write_spliced.assert_called_once()
+        content = update_file.read_text(encoding="utf-8")
+        assert content.startswith(f"{_START_MARK}\n{_MARKDOWN_FIRST_LINE}")
+        assert content.endswith(f"{_END_MARK}\n<!-- env START -->\nLOGGING_LEVEL=\n\n<!-- env END -->")
+
+    @staticmethod
+    def should_update_regions_sharing_an_end_mark(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, EmptySettings)
+        update_file = tmp_path / "README.md"
+        update_file.write_text(f"{_START_MARK}\n{_END_MARK}\n<!-- env START -->\n{_END_MARK}", encoding="utf-8")
+
+        result = _invoke(
+            runner,
+            *("-f", "markdown", "--update", str(update_file), "--between", _START_MARK, _END_MARK),
+            *("-f", "dotenv", "--update", str(update_file), "--between", "<!-- env START -->", _END_MARK),
+        )
+
+        assert result.exit_code == 0, result.output
+        content = update_file.read_text(encoding="utf-8")
+        assert content.startswith(f"{_START_MARK}\n{_MARKDOWN_FIRST_LINE}")
+        assert content.endswith(f"{_END_MARK}\n<!-- env START -->\nLOGGING_LEVEL=\n\n{_END_MARK}")
+
+    @staticmethod
+    def should_fail_when_regions_of_the_same_file_overlap(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, EmptySettings)
+        update_file = tmp_path / "README.md"
+        update_file.write_text(f"{_START_MARK}\nold\n{_END_MARK}", encoding="utf-8")
+
+        result = _invoke(
+            runner,
+            *("-f", "markdown", "--update", str(update_file), "--between", _START_MARK, _END_MARK),
+            *("-f", "dotenv", "--update", str(update_file)),
+        )
+
+        assert result.exit_code == 1
+        assert "overlap. Cannot update the content." in result.output
+        assert update_file.read_text(encoding="utf-8") == f"{_START_MARK}\nold\n{_END_MARK}"
+
+    @staticmethod
+    def should_print_each_format_in_order_without_update(runner: CliRunner, mocker: MockerFixture):
+        mock_import_class_path(mocker, EmptySettings)
+
+        result = _invoke(runner, "--output-format", "dotenv", "--output-format", "markdown")
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.startswith("LOGGING_LEVEL=\n")
+        assert _MARKDOWN_FIRST_LINE in result.stdout
+
+    @staticmethod
+    def should_import_and_walk_settings_once(runner: CliRunner, mocker: MockerFixture):
+        mock_import_class_path(mocker, EmptySettings)
+        walk = mocker.spy(streaming, "walk_settings")
+
+        result = _invoke(runner, "--output-format", "dotenv", "--output-format", "markdown")
+
+        assert result.exit_code == 0, result.output
+        assert importing.import_class_path.call_count == 1  # type: ignore[attr-defined]
+        assert walk.call_count == 1
+
+    @staticmethod
+    def should_fail_when_number_of_update_files_does_not_match(
+        runner: CliRunner, mocker: MockerFixture, tmp_path: Path
+    ):
+        mock_import_class_path(mocker, EmptySettings)
+        update_file = tmp_path / "README.md"
+        update_file.write_text("old", encoding="utf-8")
+
+        result = _invoke(runner, "-f", "dotenv", "-f", "markdown", "--update", str(update_file))
+
+        assert result.exit_code == 2
+        assert "Each '--output-format' needs its own '--update' file" in result.output
+        assert update_file.read_text(encoding="utf-8") == "old"
+
+    @staticmethod
+    def should_fail_when_there_are_more_betweens_than_update_files(
+        runner: CliRunner, mocker: MockerFixture, tmp_path: Path
+    ):
+        mock_import_class_path(mocker, EmptySettings)
+        update_file = tmp_path / "README.md"
+        update_file.write_text("old", encoding="utf-8")
+
+        result = _invoke(
+            runner,
+            *("-f", "markdown", "--update", str(update_file)),
+            *("--between", _START_MARK, _END_MARK, "--between", _START_MARK, _END_MARK),
+        )
+
+        assert result.exit_code == 2
+        assert "more '--between' options than '--update' files" in result.output
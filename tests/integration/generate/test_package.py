@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from settings_doc.discovery import INDEX_FILE_NAME
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+_PACKAGE = "discovered_package"
+_SOURCES = {
+    f"{_PACKAGE}/__init__.py": "",
+    f"{_PACKAGE}/base.py": """
+        from pydantic_settings import BaseSettings
+
+        class AppSettings(BaseSettings):
+            debug: bool = False
+        """,
+    f"{_PACKAGE}/utils.py": """
+        raise RuntimeError("Modules without settings must not be imported.")
+        """,
+    f"{_PACKAGE}/services/__init__.py": "",
+    f"{_PACKAGE}/services/billing.py": """
+        from discovered_package.base import AppSettings
+
+        class BillingSettings(AppSettings):
+            currency: str = "EUR"
+        """,
+}
+
+
+class TestPackageOption:
+    @staticmethod
+    def should_generate_from_discovered_modules(runner: CliRunner, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+
+        with importable_modules(tmp_path, _SOURCES):
+            result = runner.invoke(
+                app, ["generate", "--package", _PACKAGE, "-f", "dotenv", "--cache-dir", str(cache_dir)]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "DEBUG=False\n" in result.stdout
+        assert "CURRENCY=EUR\n" in result.stdout
+        assert (cache_dir / INDEX_FILE_NAME).is_file()
+
+    @staticmethod
+    def should_discover_modules_in_child_processes_with_isolated_import(runner: CliRunner, tmp_path: Path):
+        with importable_modules(tmp_path, _SOURCES):
+            result = runner.invoke(
+                app,
+                ["generate", "--package", _PACKAGE, "-f", "dotenv", "--cache-dir", str(tmp_path), "--isolated-import"],
+            )
+
+            assert result.exit_code == 0, result.output
+            assert "CURRENCY=EUR\n" in result.stdout
+            assert f"{_PACKAGE}.base" not in sys.modules
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from settings_doc.main import app
+
+_MODULE_PATH = "tests.fixtures.valid_settings"
+_CLASS_PATH = f"{_MODULE_PATH}.EmptySettings"
+
+
+def _invoke(*args: str):
+    return CliRunner(mix_stderr=False).invoke(app, ["generate", "--class", _CLASS_PATH, *args])
+
+
+class TestProfileOption:
+    @staticmethod
+    def should_report_phases_and_imports_as_json(tmp_path: Path):
+        update_file = tmp_path / ".env.example"
+        update_file.touch()
+
+        result = _invoke("-f", "dotenv", "--update", str(update_file), "--profile", "--profile-output", "json")
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.stderr)
+        assert [phase["name"] for phase in report["phases"]] == ["import", "walk", "compile", "render_dotenv", "write"]
+        assert all(phase["seconds"] >= 0 and phase["peak_memory_bytes"] >= 0 for phase in report["phases"])
+        assert [record["module"] for record in report["imports"]] == [_MODULE_PATH]
+
+    @staticmethod
+    def should_report_cache_phase_when_caching(tmp_path: Path):
+        result = _invoke("-f", "dotenv", "--cache-dir", str(tmp_path), "--profile", "--profile-output", "json")
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stderr)["phases"][0]["name"] == "cache"
+
+    @staticmethod
+    def should_report_text_to_stderr_only():
+        result = _invoke("-f", "dotenv", "-f", "markdown", "--profile")
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout == _invoke("-f", "dotenv", "-f", "markdown").stdout
+        lines = result.stderr.splitlines()
+        assert lines[0].split() == ["Phase", "Seconds", "Peak", "MiB"]
+        assert [line.split()[0] for line in lines[1:7]] == [
+            "import",
+            "walk",
+            "compile",
+            "render_dotenv",
+            "render_markdown",
+            "write",
+        ]
+        assert lines[-1].startswith(_MODULE_PATH)
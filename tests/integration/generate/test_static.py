@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+_SIDE_EFFECT = "raise RuntimeError('Application code must not run.')\n"
+_SOURCE = f"""
+    from pydantic_settings import BaseSettings
+
+    class Settings(BaseSettings):
+        a: int
+
+    {_SIDE_EFFECT}
+    """
+
+
+class TestStaticOption:
+    @staticmethod
+    def should_generate_without_importing(runner: CliRunner, tmp_path: Path):
+        with importable_modules(tmp_path, {"static_package/__init__.py": "", "static_package/settings.py": _SOURCE}):
+            result = runner.invoke(app, ["generate", "--module", "static_package.settings", "-f", "dotenv", "--static"])
+
+            assert result.exit_code == 0, result.output
+            assert result.stdout == "A=\n\n\n"
+            assert "static_package.settings" not in sys.modules
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
 
+from settings_doc.main import _update_file, app
 from tests.fixtures.valid_settings import SETTINGS_MARKDOWN_FIRST_LINE, EmptySettings
-from tests.helpers import run_app_with_settings
+from tests.helpers import mock_import_class_path, run_app_with_settings
 
 _OLD_CONTENT = "this is an old content"
 _START_MARK = "<!-- settings-doc START -->"
@@ -78,3 +80,101 @@ class TestUpdateFileOption:
             )
 
         assert expected_output.lower() in stdout
+
+    @staticmethod
+    def should_not_write_the_file_when_content_is_unchanged(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text("\n".join([_START_MARK, _END_MARK]), encoding="utf-8")
+        args = ["--update", str(update_file), "--between", _START_MARK, _END_MARK]
+        run_app_with_settings(mocker, runner, EmptySettings, args)
+        os.utime(update_file, (0, 0))
+
+        run_app_with_settings(mocker, runner, EmptySettings, args)
+
+        assert update_file.stat().st_mtime == 0
+
+    @staticmethod
+    def should_keep_file_permissions(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text(_OLD_CONTENT, encoding="utf-8")
+        update_file.chmod(0o640)
+
+        run_app_with_settings(mocker, runner, EmptySettings, ["--update", str(update_file)])
+
+        assert update_file.stat().st_mode & 0o777 == 0o640
+
+    @staticmethod
+    def should_not_leave_temporary_files_behind(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text(_OLD_CONTENT, encoding="utf-8")
+
+        for _ in range(2):  # Changed and unchanged content
+            run_app_with_settings(mocker, runner, EmptySettings, ["--update", str(update_file)])
+
+        assert os.listdir(tmp_path) == ["README.md"]
+
+
+class TestUpdateFileStreaming:
+    @staticmethod
+    def should_splice_chunks_between_marks(tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text("\n".join([_PREFIX, _START_MARK, _OLD_CONTENT, _END_MARK, _SUFFIX]), encoding="utf-8")
+
+        up_to_date = _update_file(update_file, (_START_MARK, _END_MARK), iter(["first ", "second", "\n"]))
+
+        assert not up_to_date
+        assert update_file.read_text(encoding="utf-8") == "\n".join(
+            [_PREFIX, _START_MARK, "first second", _END_MARK, _SUFFIX]
+        )
+
+    @staticmethod
+    def should_keep_original_file_when_rendering_fails(tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text(_OLD_CONTENT, encoding="utf-8")
+
+        def _failing_chunks():
+            yield "partial"
+            raise RuntimeError("Rendering failed.")
+
+        with pytest.raises(RuntimeError):
+            _update_file(update_file, (None, None), _failing_chunks())
+
+        assert update_file.read_text(encoding="utf-8") == _OLD_CONTENT
+        assert os.listdir(tmp_path) == ["README.md"]
+
+
+class TestCheckOption:
+    @staticmethod
+    def should_fail_with_diff_when_file_is_not_up_to_date(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text(_OLD_CONTENT, encoding="utf-8")
+        mock_import_class_path(mocker, EmptySettings)
+
+        result = runner.invoke(
+            app, ["generate", "--class", "MockSettings", "-f", "markdown", "--update", str(update_file), "--check"]
+        )
+
+        assert result.exit_code == 1
+        assert f"-{_OLD_CONTENT}\n" in result.stdout
+        assert f"+{SETTINGS_MARKDOWN_FIRST_LINE}".lower() in result.stdout.lower()
+        assert update_file.read_text(encoding="utf-8") == _OLD_CONTENT
+
+    @staticmethod
+    def should_succeed_when_file_is_up_to_date(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        update_file = tmp_path / "README.md"
+        update_file.write_text(_OLD_CONTENT, encoding="utf-8")
+        run_app_with_settings(mocker, runner, EmptySettings, ["--update", str(update_file)])
+
+        result = runner.invoke(
+            app, ["generate", "--class", "MockSettings", "-f", "markdown", "--update", str(update_file), "--check"]
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+
+    @staticmethod
+    def should_require_update_option(runner: CliRunner):
+        result = runner.invoke(app, ["generate", "--class", "MockSettings", "-f", "markdown", "--check"])
+
+        assert result.exit_code != 0
+        assert "The '--check' option requires '--update'." in result.output
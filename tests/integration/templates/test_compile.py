@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc.main import app
+from settings_doc.streaming import TEMPLATES_FOLDER, create_environment
+
+
+def _compile_templates(runner: CliRunner, *args: str):
+    return runner.invoke(app, ["templates", "--compile", *args])
+
+
+def _cached_templates(folder: Path) -> list[Path]:
+    return list(folder.glob("__jinja2_*.cache"))
+
+
+class TestTemplatesCompile:
+    @staticmethod
+    def should_compile_built_in_templates(runner: CliRunner, tmp_path: Path):
+        cache_dir = tmp_path / "bytecode"
+
+        result = _compile_templates(runner, "--bytecode-cache-dir", str(cache_dir))
+
+        assert result.exit_code == 0, result.output
+        assert len(_cached_templates(cache_dir)) == len(list(TEMPLATES_FOLDER.glob("*.jinja")))
+        assert (cache_dir / ".gitignore").is_file()
+
+    @staticmethod
+    def should_compile_user_templates(runner: CliRunner, tmp_path: Path):
+        cache_dir = tmp_path / "bytecode"
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "custom.jinja").write_text("{{ fields }}", encoding="utf-8")
+
+        result = _compile_templates(runner, "--templates", str(templates), "--bytecode-cache-dir", str(cache_dir))
+
+        assert result.exit_code == 0, result.output
+        assert len(_cached_templates(cache_dir)) == len(list(TEMPLATES_FOLDER.glob("*.jinja"))) + 1
+
+    @staticmethod
+    def should_reuse_compiled_templates_in_generate(runner: CliRunner, mocker: MockerFixture, tmp_path: Path):
+        cache_dir = tmp_path / "bytecode"
+        _compile_templates(runner, "--bytecode-cache-dir", str(cache_dir))
+        create_environment.cache_clear()
+        compile_template = mocker.patch("jinja2.Environment.compile", side_effect=AssertionError("Compiled again"))
+
+        result = runner.invoke(
+            app,
+            [
+                "generate",
+                "--class",
+                "tests.fixtures.valid_settings.EmptySettings",
+                "-f",
+                "dotenv",
+                "--bytecode-cache-dir",
+                str(cache_dir),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        compile_template.assert_not_called()
+
+
+class TestEnvironmentReuse:
+    @staticmethod
+    def should_share_environment_between_renders(tmp_path: Path):
+        assert create_environment((tmp_path,)) is create_environment((tmp_path,))
+        assert create_environment((tmp_path,)) is not create_environment(())
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from subprocess import run
+
+import pytest
+
+import settings_doc
+
+_HEAVY_MODULES = ("jinja2", "pydantic", "pydantic_settings", "pydantic_core")
+_SCRIPT = """
+import json, sys
+from settings_doc.main import app
+try:
+    app({args!r})
+except SystemExit:
+    pass
+print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}})))
+"""
+
+
+def _run_cli(args: list[str]) -> set[str]:
+    """Run the CLI in a fresh interpreter.
+
+    Returns:
+        Top-level names of all imported modules. The import time is measured by the benchmarks (`startup`).
+    """
+    env = dict(os.environ, PYTHONPATH=str(Path(settings_doc.__file__).parent.parent))
+    result = run(
+        [sys.executable, "-c", _SCRIPT.format(args=args)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class TestStartup:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "args",
+        [
+            pytest.param(["--help"], id="--help"),
+            pytest.param(["generate", "--help"], id="generate --help"),
+            pytest.param(["templates", "--copy-to", "{tmp_path}"], id="templates --copy-to"),
+        ],
+    )
+    def should_not_import_rendering_dependencies(args: list[str], tmp_path: Path):
+        modules = _run_cli([arg.format(tmp_path=tmp_path) for arg in args])
+
+        assert not modules.intersection(_HEAVY_MODULES)
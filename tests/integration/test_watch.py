@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc.main import app
+from settings_doc.manifest import ManifestJob
+
+
+class TestWatchCommand:
+    @staticmethod
+    def should_watch_a_job_built_from_options(runner: CliRunner, mocker: MockerFixture):
+        watch = mocker.patch("settings_doc.watching.watch")
+
+        result = runner.invoke(app, ["watch", "--module", "tests.fixtures.valid_settings", "-f", "markdown"])
+
+        assert result.exit_code == 0, result.output
+        jobs = watch.call_args.args[0]
+        assert jobs == [ManifestJob(output_format="markdown", module_path=("tests.fixtures.valid_settings",))]
+
+    @staticmethod
+    def should_require_output_format(runner: CliRunner):
+        result = runner.invoke(app, ["watch", "--module", "tests.fixtures.valid_settings"])
+
+        assert result.exit_code != 0
+        assert "Missing option '--output-format'" in result.output
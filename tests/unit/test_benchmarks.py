@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.suite import BASELINE_FILE, RESULTS_VERSION, find_regressions, run_benchmarks
+from tests.benchmarks.synthetic import Scale
+
+_SCALE = Scale(fields=12, depth=2, fields_per_class=6, enum_size=3, literal_size=3, dict_size=2)
+
+
+def _results(seconds: float, peak_memory_bytes: int, scale: Scale = _SCALE) -> dict:
+    return {"scale": scale.as_dict(), "phases": {"walk": {"seconds": seconds, "peak_memory_bytes": peak_memory_bytes}}}
+
+
+class TestRunBenchmarks:
+    @staticmethod
+    def should_measure_all_phases(tmp_path: Path):
+        results = run_benchmarks(_SCALE, tmp_path, repeat=1)
+
+        assert set(results["phases"]) == {
+            "startup",
+            "import",
+            "walk",
+            "render_dotenv",
+            "render_markdown",
+            "update",
+            "update_streamed",
+        }
+        assert results["environment_variables"] == _SCALE.fields + 2 * _SCALE.depth
+
+    @staticmethod
+    def should_have_a_baseline_of_the_default_scale(tmp_path: Path):
+        baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+
+        assert baseline["version"] == RESULTS_VERSION
+        assert baseline["scale"] == Scale().as_dict()
+        assert set(baseline["phases"]) == set(run_benchmarks(_SCALE, tmp_path, repeat=1)["phases"])
+
+
+class TestFindRegressions:
+    @staticmethod
+    def should_report_phases_over_tolerance():
+        regressions = find_regressions(_results(1.3, 100), _results(1.0, 100), tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("walk: seconds increased from 1 to 1.3")
+
+    @staticmethod
+    def should_accept_phases_within_tolerance():
+        assert not find_regressions(_results(1.2, 120), _results(1.0, 100), tolerance=0.25)
+
+    @staticmethod
+    def should_fail_on_different_scale():
+        with pytest.raises(ValueError, match="different scale"):
+            find_regressions(_results(1.0, 100), _results(1.0, 100, Scale(fields=1)), tolerance=0.25)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from settings_doc import OutputFormat, render
+from settings_doc.cache import RenderCache, find_module_source, model_sources
+from tests.fixtures.valid_settings import FullSettings
+from tests.helpers import importable_modules, mock_import_class_path
+
+_CLASS_PATH = ("tests.fixtures.valid_settings.FullSettings",)
+
+
+@pytest.fixture()
+def settings_module(tmp_path: Path) -> Iterator[Path]:
+    sources = {
+        "cached_package/__init__.py": "raise RuntimeError('Must not be imported')\n",
+        "cached_package/settings.py": "VALUE = 1\n",
+    }
+    with importable_modules(tmp_path, sources):
+        yield tmp_path / "cached_package" / "settings.py"
+
+
+def _key(cache: RenderCache, template_folder: Path, module_path: str = "cached_package.settings") -> str | None:
+    return cache.key("markdown", 0, (module_path,), (), template_folders=(template_folder,))
+
+
+class TestFindModuleSource:
+    @staticmethod
+    def should_find_source_without_importing_parent_packages(settings_module: Path):
+        assert find_module_source("cached_package.settings") == settings_module
+        assert "cached_package" not in sys.modules
+
+    @staticmethod
+    def should_return_none_for_unknown_modules():
+        assert find_module_source("not_a_module.settings") is None
+
+
+class TestRenderCacheKey:
+    @staticmethod
+    def should_be_stable(tmp_path: Path, settings_module: Path):
+        del settings_module
+        cache = RenderCache(tmp_path / "cache")
+        assert _key(cache, tmp_path) == _key(cache, tmp_path)
+
+    @staticmethod
+    def should_change_with_module_source(tmp_path: Path, settings_module: Path):
+        cache = RenderCache(tmp_path / "cache")
+        old_key = _key(cache, tmp_path)
+        settings_module.write_text("VALUE = 2\n", encoding="utf-8")
+        assert _key(cache, tmp_path) != old_key
+
+    @staticmethod
+    def should_change_with_templates(tmp_path: Path, settings_module: Path):
+        del settings_module
+        cache = RenderCache(tmp_path / "cache")
+        template_folder = tmp_path / "templates"
+        template_folder.mkdir()
+        old_key = _key(cache, template_folder)
+        (template_folder / "markdown.jinja").write_text("{{ fields }}", encoding="utf-8")
+        assert _key(cache, template_folder) != old_key
+
+    @staticmethod
+    def should_change_with_validation_options(tmp_path: Path, settings_module: Path):
+        del settings_module
+        cache = RenderCache(tmp_path / "cache")
+        keys = {
+            _key(cache, tmp_path),
+            cache.key("markdown", 0, ("cached_package.settings",), (), template_folders=(tmp_path,), max_depth=1),
+            cache.key(
+                "markdown", 0, ("cached_package.settings",), (), template_folders=(tmp_path,), fail_on_conflicts=True
+            ),
+            cache.key("markdown", 0, ("cached_package.settings",), (), template_folders=(tmp_path,), static=True),
+        }
+        assert len(keys) == 4
+
+    @staticmethod
+    def should_be_none_when_source_cannot_be_found(tmp_path: Path):
+        assert _key(RenderCache(tmp_path / "cache"), tmp_path, "not_a_module") is None
+
+
+class TestRenderCacheEviction:
+    @staticmethod
+    def should_evict_expired_entries(tmp_path: Path):
+        cache = RenderCache(tmp_path, max_age=60)
+        cache.set("old", "old content")
+        expired = time.time() - 120
+        os.utime(tmp_path / "old.json", (expired, expired))
+
+        cache.set("new", "new content")
+
+        assert cache.get("old") is None
+        assert cache.get("new") == "new content"
+
+    @staticmethod
+    def should_evict_least_recently_used_entries_over_size_limit(tmp_path: Path):
+        cache = RenderCache(tmp_path, max_size=60)  # Fits a single entry
+        cache.set("first", "12345")
+        older = time.time() - 10
+        os.utime(tmp_path / "first.json", (older, older))
+
+        cache.set("second", "1234567890")
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "1234567890"
+
+
+class TestRenderCacheGet:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            pytest.param('{"content": "content"}', id="without dependencies"),
+            pytest.param('{"dependencies": [["README.md"]], "content": "content"}', id="malformed dependencies"),
+            pytest.param('{"dependencies": []}', id="without content"),
+            pytest.param('{"dependenc', id="truncated"),
+        ],
+    )
+    def should_miss_unreadable_entries(tmp_path: Path, stored: str):
+        (tmp_path / "key.json").write_text(stored, encoding="utf-8")
+
+        assert RenderCache(tmp_path).get("key") is None
+        assert not (tmp_path / "key.json").exists()
+
+
+class TestRenderWithCache:
+    @staticmethod
+    def should_not_import_settings_on_cache_hit(mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, FullSettings)
+        first = render(OutputFormat.DOTENV, class_path=_CLASS_PATH, cache_dir=tmp_path)
+
+        import_class_path = mocker.patch("settings_doc.importing.import_class_path")
+        second = render(OutputFormat.DOTENV, class_path=_CLASS_PATH, cache_dir=tmp_path)
+
+        assert first == second
+        import_class_path.assert_not_called()
+
+    @staticmethod
+    def should_create_gitignore_in_cache_folder(mocker: MockerFixture, tmp_path: Path):
+        mock_import_class_path(mocker, FullSettings)
+        cache_dir = tmp_path / "cache"
+
+        render(OutputFormat.DOTENV, class_path=_CLASS_PATH, cache_dir=cache_dir)
+
+        assert (cache_dir / ".gitignore").read_text(encoding="utf-8").endswith("*\n")
+
+    @staticmethod
+    def should_render_again_when_nested_model_in_other_module_changes(tmp_path: Path):
+        sources = {
+            "nested_package/__init__.py": "",
+            "nested_package/settings.py": """
+                from pydantic_settings import BaseSettings, SettingsConfigDict
+
+                from nested_package.models import Db
+
+                class AppSettings(BaseSettings):
+                    model_config = SettingsConfigDict(env_nested_delimiter="__")
+
+                    db: Db
+                """,
+            "nested_package/models.py": "from pydantic import BaseModel\n\nclass Db(BaseModel):\n    host: str\n",
+        }
+        module_path = ("nested_package.settings",)
+
+        with importable_modules(tmp_path, sources):
+            first = render(OutputFormat.DOTENV, module_path=module_path, cache_dir=tmp_path / "cache")
+
+        sources["nested_package/models.py"] += "    port: int\n"
+        with importable_modules(tmp_path, sources):
+            second = render(OutputFormat.DOTENV, module_path=module_path, cache_dir=tmp_path / "cache")
+
+        assert "DB__PORT" not in first
+        assert "DB__HOST" in second and "DB__PORT" in second
+
+    @staticmethod
+    def should_render_again_when_imported_constant_changes(tmp_path: Path):
+        sources = {
+            "constants_package/__init__.py": "",
+            "constants_package/settings.py": """
+                from pydantic_settings import BaseSettings
+
+                from .consts import DEFAULT_PORT
+
+                class AppSettings(BaseSettings):
+                    port: int = DEFAULT_PORT
+                """,
+            "constants_package/consts.py": "DEFAULT_PORT = 8000\n",
+        }
+        module_path = ("constants_package.settings",)
+
+        with importable_modules(tmp_path, sources):
+            first = render(OutputFormat.DOTENV, module_path=module_path, cache_dir=tmp_path / "cache")
+
+        sources["constants_package/consts.py"] = "DEFAULT_PORT = 8080\n"
+        with importable_modules(tmp_path, sources):
+            second = render(OutputFormat.DOTENV, module_path=module_path, cache_dir=tmp_path / "cache")
+
+        assert "PORT=8000" in first
+        assert "PORT=8080" in second
+
+
+class TestModelSources:
+    @staticmethod
+    def should_include_modules_of_nested_models_enums_and_base_classes():
+        sources = model_sources([FullSettings])
+
+        assert find_module_source("tests.fixtures.valid_settings") in sources
+        assert find_module_source("pydantic_settings.main") in sources
+
+    @staticmethod
+    def should_include_modules_of_the_project_imported_by_settings_modules(tmp_path: Path):
+        sources = {
+            "project_settings.py": """
+                import json
+
+                from pydantic_settings import BaseSettings
+
+                from project_package.consts import DEFAULT_PORT
+
+                class AppSettings(BaseSettings):
+                    port: int = DEFAULT_PORT
+                """,
+            "project_package/__init__.py": "",
+            "project_package/consts.py": "from . import defaults\n\nDEFAULT_PORT = defaults.PORT\n",
+            "project_package/defaults.py": "PORT = 8000\n",
+        }
+
+        with importable_modules(tmp_path, sources):
+            module_sources = model_sources([importlib.import_module("project_settings").AppSettings])
+
+        assert {path.relative_to(tmp_path) for path in module_sources if tmp_path in path.parents} == {
+            Path("project_settings.py"),
+            Path("project_package/__init__.py"),
+            Path("project_package/consts.py"),
+            Path("project_package/defaults.py"),
+        }
+        assert find_module_source("json") not in module_sources
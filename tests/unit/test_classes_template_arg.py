@@ -1,7 +1,9 @@
+import pytest
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
 
-from tests.fixtures.valid_settings import EmptySettings, FullSettings, RequiredSettings
+from settings_doc.template_context import ClassesMapping
+from tests.fixtures.valid_settings import EmptySettings, FullSettings, MultipleSettings, RequiredSettings
 from tests.helpers import run_app_with_settings
 
 _TEMPLATE = """
@@ -9,6 +11,11 @@ _TEMPLATE = """
 # {{ cls.__name__ }}
 {% endfor %}
 """
+_FIELDS_BY_CLASS_TEMPLATE = """
+{% for cls, fields in fields_by_class.items() %}
+# {{ cls.__name__ }}: {% for env_name, field in fields %}{{ env_name }} {% endfor %}
+{% endfor %}
+"""
 
 
 class TestClassesTemplateArg:
@@ -20,3 +27,30 @@ class TestClassesTemplateArg:
 
         for cls in classes:
             assert f"# {cls.__name__.lower()}\n" in result
+
+    @staticmethod
+    def should_group_fields_by_class(runner: CliRunner, mocker: MockerFixture):
+        result = run_app_with_settings(
+            mocker, runner, [EmptySettings, MultipleSettings], template=_FIELDS_BY_CLASS_TEMPLATE
+        )
+
+        assert "# emptysettings: logging_level \n" in result
+        assert "# multiplesettings: username password \n" in result
+
+
+class TestClassesMapping:
+    @staticmethod
+    def should_list_fields_of_classes_only_when_read():
+        classes = ClassesMapping([EmptySettings, FullSettings], {})
+
+        assert list(classes) == [EmptySettings, FullSettings]
+        assert len(classes) == 2
+        assert not classes._values  # pylint: disable=protected-access
+        assert classes[FullSettings] == list(FullSettings.model_fields.values())
+        assert classes[FullSettings] is classes[FullSettings]
+        assert list(classes._values) == [FullSettings]  # pylint: disable=protected-access
+
+    @staticmethod
+    def should_fail_for_unknown_classes():
+        with pytest.raises(KeyError):
+            ClassesMapping([EmptySettings], {})[FullSettings]  # pylint: disable=expression-not-assigned
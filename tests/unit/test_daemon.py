@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterator
+
+import pytest
+
+from settings_doc.main import app
+from tests.helpers import importable_modules
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not available on Windows.")
+
+_CLASS_PATH = "tests.fixtures.valid_settings.EmptySettings"
+_MODULE = "daemon_settings"
+_SOURCE = """
+    from pydantic_settings import BaseSettings
+
+    class DaemonSettings(BaseSettings):
+        level: str = "{level}"
+    """
+_MODELS_SOURCE = """
+    from pydantic import BaseModel
+
+    class Db(BaseModel):
+        host: str
+    """
+_APP_SOURCE = """
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    from daemon_models import Db
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(env_nested_delimiter="__")
+
+        db: Db
+    """
+
+
+@pytest.fixture()
+def settings_module(tmp_path: Path) -> Iterator[Path]:
+    with importable_modules(tmp_path, {f"{_MODULE}.py": _SOURCE.format(level="info")}):
+        yield tmp_path / f"{_MODULE}.py"
+
+
+def _request(args: list[str]) -> dict:
+    return {"version": 1, "cwd": os.getcwd(), "args": args}
+
+
+def _daemon():
+    # Imported here, as the module cannot be imported on Windows
+    from settings_doc.daemon import Daemon  # pylint: disable=import-outside-toplevel
+
+    return Daemon(app)
+
+
+class TestDaemon:
+    @staticmethod
+    def should_report_errors_with_exit_code():
+        response = _daemon().handle(_request(["--class", _CLASS_PATH]))
+
+        assert response.exit_code == 2
+        assert "Missing option '--output-format'" in response.stderr
+
+    @staticmethod
+    def should_refuse_requests_from_other_directories(tmp_path: Path):
+        response = _daemon().handle({"version": 1, "cwd": str(tmp_path), "args": []})
+
+        assert response.exit_code == 2
+        assert f"not '{tmp_path}'" in response.stderr
+
+    @staticmethod
+    def should_reload_changed_modules(settings_module: Path):
+        server = _daemon()
+        args = ["--module", _MODULE, "--output-format", "dotenv"]
+        assert "LEVEL=info\n" in server.handle(_request(args)).stdout
+
+        settings_module.write_text(dedent(_SOURCE.format(level="debug")), encoding="utf-8")
+
+        assert "LEVEL=debug\n" in server.handle(_request(args)).stdout
+
+    @staticmethod
+    def should_reload_modules_importing_from_changed_modules(tmp_path: Path):
+        server = _daemon()
+        args = ["--module", "daemon_app", "--output-format", "dotenv"]
+
+        with importable_modules(tmp_path, {"daemon_models.py": _MODELS_SOURCE, "daemon_app.py": _APP_SOURCE}):
+            assert "DB__PORT" not in server.handle(_request(args)).stdout
+
+            models = tmp_path / "daemon_models.py"
+            models.write_text(models.read_text(encoding="utf-8") + "    port: int\n", encoding="utf-8")
+
+            assert "DB__PORT=\n" in server.handle(_request(args)).stdout
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterator
+
+import pytest
+from click import BadParameter
+from pytest_mock import MockerFixture
+
+from settings_doc import importing
+from settings_doc.discovery import INDEX_FILE_NAME, discover_modules
+from tests.helpers import importable_modules
+
+_PACKAGE = "discovered_package"
+_SOURCES = {
+    "__init__.py": "",
+    "base.py": """
+        from pydantic_settings import BaseSettings
+
+        class AppSettings(BaseSettings):
+            debug: bool = False
+        """,
+    "utils.py": """
+        raise RuntimeError("Modules without settings must not be imported.")
+        """,
+    "mentions.py": """
+        # Settings are defined elsewhere.
+        """,
+    "broken.py": """
+        from pydantic_settings import BaseSettings
+
+        raise RuntimeError("Broken settings.")
+        """,
+    "__main__.py": """
+        raise RuntimeError("Settings of __main__ modules must not be imported.")
+        """,
+    "services/__init__.py": "",
+    "services/billing.py": """
+        from discovered_package.base import AppSettings
+
+        class BillingSettings(AppSettings):
+            currency: str = "EUR"
+        """,
+}
+
+
+@pytest.fixture()
+def package_root(tmp_path: Path) -> Iterator[Path]:
+    with importable_modules(tmp_path, {f"{_PACKAGE}/{name}": source for name, source in _SOURCES.items()}):
+        yield tmp_path / _PACKAGE
+
+
+class TestDiscoverModules:
+    @staticmethod
+    def should_find_modules_defining_settings_recursively(package_root: Path, tmp_path: Path):
+        modules = discover_modules((_PACKAGE,), tmp_path)
+
+        assert modules == (f"{_PACKAGE}.base", f"{_PACKAGE}.services.billing")
+        assert f"{_PACKAGE}.utils" not in sys.modules
+
+    @staticmethod
+    def should_not_import_anything_when_indexed(package_root: Path, tmp_path: Path, mocker: MockerFixture):
+        modules = discover_modules((_PACKAGE,), tmp_path)
+        import_module = mocker.spy(importing, "import_module")
+
+        assert discover_modules((_PACKAGE,), tmp_path) == modules
+        assert import_module.call_count == 0
+
+    @staticmethod
+    def should_scan_changed_modules_again(package_root: Path, tmp_path: Path, mocker: MockerFixture):
+        discover_modules((_PACKAGE,), tmp_path)
+        sys.modules.pop(f"{_PACKAGE}.mentions")  # As if run again in a new process
+        (package_root / "mentions.py").write_text(dedent(_SOURCES["base.py"]).replace("App", "Other"), "utf-8")
+        import_module = mocker.spy(importing, "import_module")
+
+        modules = discover_modules((_PACKAGE,), tmp_path)
+
+        assert f"{_PACKAGE}.mentions" in modules
+        assert [call.args[0] for call in import_module.call_args_list] == [f"{_PACKAGE}.mentions"]
+
+    @staticmethod
+    def should_forget_removed_modules(package_root: Path, tmp_path: Path):
+        discover_modules((_PACKAGE,), tmp_path)
+        (package_root / "services" / "billing.py").unlink()
+
+        assert discover_modules((_PACKAGE,), tmp_path) == (f"{_PACKAGE}.base",)
+        index = json.loads((tmp_path / INDEX_FILE_NAME).read_text("utf-8"))
+        assert f"{_PACKAGE}.services.billing" not in index["modules"]
+
+    @staticmethod
+    def should_skip_modules_failing_to_import(package_root: Path, tmp_path: Path, capsys: pytest.CaptureFixture):
+        modules = discover_modules((_PACKAGE,), tmp_path)
+        index = json.loads((tmp_path / INDEX_FILE_NAME).read_text("utf-8"))
+
+        assert f"{_PACKAGE}.broken" not in modules
+        assert f"Importing '{_PACKAGE}.broken' failed with RuntimeError: Broken settings." in capsys.readouterr().err
+        assert index["modules"][f"{_PACKAGE}.broken"]["settings"] is False
+
+    @staticmethod
+    def should_not_import_main_modules(package_root: Path, tmp_path: Path):
+        discover_modules((_PACKAGE,), tmp_path)
+        index = json.loads((tmp_path / INDEX_FILE_NAME).read_text("utf-8"))
+
+        assert f"{_PACKAGE}.__main__" not in index["modules"]
+
+    @staticmethod
+    def should_not_import_modules_in_static_mode(package_root: Path, tmp_path: Path):
+        modules = discover_modules((_PACKAGE,), tmp_path, static=True)
+
+        assert modules == (f"{_PACKAGE}.base", f"{_PACKAGE}.services.billing")
+        assert f"{_PACKAGE}.base" not in sys.modules
+
+    @staticmethod
+    def should_fail_for_unknown_package(tmp_path: Path):
+        with pytest.raises(BadParameter, match="Cannot find the package 'not_a_package'"):
+            discover_modules(("not_a_package",), tmp_path)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gc
+from enum import Enum
+from typing import Literal, Optional
+
+import pytest
+from click import Abort
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+from settings_doc import entries
+from settings_doc.entries import SettingEntry, create_entries
+
+
+class _Color(str, Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class _Settings(BaseSettings):
+    color: _Color = _Color.RED
+    level: Literal["debug", "info"] = Field(
+        "info", json_schema_extra={"possible_values": [["debug", "Verbose."], ["info"]]}
+    )
+    mapping: dict = {"a": 1}
+    optional: Optional[str] = None
+    required: str
+    invalid: str = Field("", json_schema_extra={"examples": 1})
+    other_color: _Color = _Color.GREEN
+    flag: Literal[1, 2] = 1
+    other_flag: Literal[True, 2] = True
+    long: Literal["aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "bbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"] = (
+        "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+    )
+
+
+def _entry(name: str) -> SettingEntry:
+    return SettingEntry(name, _Settings.model_fields[name])
+
+
+class TestSettingEntry:
+    @staticmethod
+    def should_prepare_default_values():
+        assert (_entry("color").default, _entry("color").env_default) == ("red", "red")
+        assert (_entry("mapping").default, _entry("mapping").env_default) == ("{'a': 1}", '{"a": 1}')
+        assert (_entry("optional").default, _entry("optional").env_default) == ("None", "")
+        assert (_entry("required").default, _entry("required").env_default) == (None, "")
+
+    @staticmethod
+    def should_prefer_annotation_values_only_in_env_possible_values():
+        entry = _entry("level")
+
+        assert entry.possible_values is not None
+        assert entry.possible_values.described
+        assert entry.possible_values.items == (("debug", "Verbose."), ("info",))
+        assert entry.env_possible_values is not None
+        assert entry.env_possible_values.joined == "debug`, `info"
+
+    @staticmethod
+    def should_share_annotation_values_between_formats():
+        entry = _entry("color")
+
+        assert entry.possible_values is entry.env_possible_values
+        assert entry.possible_values is not None
+        assert entry.possible_values.items == ("red", "green")
+
+    @staticmethod
+    def should_share_annotation_values_between_fields():
+        assert _entry("color").possible_values is _entry("other_color").possible_values
+        assert _entry("color").possible_values is _entry("color").possible_values
+
+    @staticmethod
+    def should_not_keep_enums_alive():
+        color = Enum("Color", {"RED": "red"})  # type: ignore[misc]
+        assert entries._enum_values(color).items == ("red",)  # pylint: disable=protected-access
+
+        del color
+        gc.collect()
+
+        assert not any(enum.__name__ == "Color" for enum in entries._ENUM_VALUES)  # pylint: disable=protected-access
+
+    @staticmethod
+    def should_not_share_values_of_equal_literals_of_different_types():
+        assert _entry("flag").possible_values.items == (1, 2)
+        assert _entry("other_flag").possible_values.items == (True, 2)
+
+    @staticmethod
+    def should_decide_the_layout_of_values_once():
+        short = _entry("color").possible_values
+        long = _entry("long").possible_values
+
+        assert short is not None and short.markdown_inline and short.env_inline
+        assert long is not None and long.markdown_inline and not long.env_inline
+
+    @staticmethod
+    def should_validate_examples_only_when_used():
+        entry = _entry("invalid")
+
+        with pytest.raises(Abort):
+            _ = entry.examples
+
+
+class TestCreateEntries:
+    @staticmethod
+    def should_keep_the_original_env_name():
+        entries = create_entries([("app_required", _Settings.model_fields["required"])])
+
+        assert [(entry.raw_env_name, entry.env_name, entry.required) for entry in entries] == [
+            ("app_required", "APP_REQUIRED", True)
+        ]
@@ -0,0 +1,45 @@
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from settings_doc.template_context import LazySequence
+from tests.fixtures.valid_settings import EmptySettings, MultipleSettings
+from tests.helpers import run_app_with_settings
+
+_TEMPLATE = """
+count: {{ fields|length }}
+toc: {% for env_name, _ in fields %}{{ env_name }} {% endfor %}
+details: {% for env_name, field in fields %}{{ env_name }}={{ field.annotation.__name__ }} {% endfor %}
+first: {{ fields[0][0] }}
+rest: {% for env_name, _ in fields[1:] %}{{ env_name }} {% endfor %}
+"""
+
+
+class TestFieldsTemplateArg:
+    @staticmethod
+    def should_iterate_fields_many_times(runner: CliRunner, mocker: MockerFixture):
+        result = run_app_with_settings(mocker, runner, [EmptySettings, MultipleSettings], template=_TEMPLATE)
+
+        assert "count: 3\n" in result
+        assert "toc: logging_level username password \n" in result
+        assert "details: logging_level=str username=str password=str \n" in result
+        assert "first: logging_level\n" in result
+        assert "rest: username password \n" in result
+
+
+class TestLazySequence:
+    @staticmethod
+    def should_materialize_items_once_on_first_use():
+        calls = []
+
+        def _items():
+            calls.append(None)
+            return iter(["a", "b", "c"])
+
+        sequence = LazySequence(_items)
+        assert not calls
+
+        assert list(sequence) == list(sequence) == ["a", "b", "c"]
+        assert len(sequence) == 3
+        assert sequence[-1] == "c"
+        assert sequence[:2] == ["a", "b"]
+        assert len(calls) == 1
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click import BadParameter
+
+from settings_doc import OutputFormat, render
+from settings_doc.isolated_importing import Isolation, import_paths
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+from tests.helpers import OUTPUT_FORMATS, assert_same_output_as_import, importable_modules
+
+_MODULE_PATH = "tests.fixtures.valid_settings"
+_SOURCES = {
+    "isolated_settings": """
+        from pydantic import Field
+        from pydantic_settings import BaseSettings
+
+        class IsolatedSettings(BaseSettings):
+            level: str = Field("info", description="Log level.")
+        """,
+    "blocking_settings": """
+        import time
+
+        time.sleep(60)
+        """,
+    "greedy_settings": """
+        data = bytearray(4 * 1024 * 1024 * 1024)
+        """,
+}
+
+
+@pytest.fixture()
+def isolated_modules(tmp_path: Path) -> Iterator[None]:
+    with importable_modules(tmp_path, {f"{name}.py": source for name, source in _SOURCES.items()}):
+        yield
+
+
+class TestIsolatedImportPaths:
+    @staticmethod
+    @OUTPUT_FORMATS
+    def should_render_the_same_output_as_import(output_format: OutputFormat, isolated_modules: None):
+        module_path = (_MODULE_PATH, "isolated_settings")
+        class_path = (f"{_MODULE_PATH}.FullSettings",)
+        isolated_output = render(output_format, module_path, class_path, jobs=2, isolation=Isolation())
+
+        assert "isolated_settings" not in sys.modules
+        assert_same_output_as_import(output_format, isolated_output, module_path, class_path)
+
+    @staticmethod
+    def should_report_the_module_exceeding_the_timeout(isolated_modules: None):
+        with pytest.raises(BadParameter, match="Importing 'blocking_settings' took longer than 5 seconds."):
+            import_paths(("isolated_settings", "blocking_settings"), (), 2, DEFAULT_MAX_DEPTH, Isolation(timeout=5))
+
+    @staticmethod
+    @pytest.mark.skipif(sys.platform == "win32", reason="RLIMIT_AS is not available on Windows.")
+    def should_report_the_module_exceeding_the_memory_limit(isolated_modules: None):
+        with pytest.raises(BadParameter, match="Importing 'greedy_settings' exceeded the memory limit of 512 MiB."):
+            import_paths(("greedy_settings",), (), 1, DEFAULT_MAX_DEPTH, Isolation(memory_limit=512))
+
+    @staticmethod
+    def should_fail_when_class_cannot_be_imported():
+        with pytest.raises(BadParameter, match="Cannot read the settings class: .*NotAClass"):
+            import_paths((), (f"{_MODULE_PATH}.NotAClass",), 1, DEFAULT_MAX_DEPTH, Isolation())
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from click import BadParameter
+from click.testing import CliRunner
+from pydantic import BaseModel, create_model
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pytest_mock import MockerFixture
+
+from settings_doc import walking
+from settings_doc.main import app
+from settings_doc.streaming import model_fields
+from tests.fixtures.valid_settings import EnvPrefixAndNestedDelimiterSettings, SubModel
+from tests.helpers import mock_import_class_path
+
+
+class CyclicModel(BaseModel):
+    name: str
+    child: CyclicModel
+
+
+class CyclicSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_nested_delimiter="__")
+
+    root: CyclicModel
+
+
+class SharedModelSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="OTHER_", env_nested_delimiter="__")
+
+    first: SubModel
+    second: SubModel
+
+
+def _nested_settings(depth: int) -> type[BaseSettings]:
+    """Settings with `depth` levels of nested models."""
+    model: Any = create_model(f"Level{depth}", leaf=(str, ...))
+    for level in range(depth - 1, 0, -1):
+        model = create_model(f"Level{level}", child=(model, ...))
+    return create_model("DeepSettings", __base__=BaseSettings, root=(model, ...))
+
+
+class TestNestedModels:
+    @staticmethod
+    def should_prefix_shared_model_for_each_field():
+        assert [name for name, _ in model_fields(SharedModelSettings)] == [
+            "OTHER_first__nested",
+            "OTHER_first__deep__leaf",
+            "OTHER_second__nested",
+            "OTHER_second__deep__leaf",
+        ]
+
+    @staticmethod
+    def should_walk_shared_model_only_once(mocker: MockerFixture):
+        walking._EXPANSIONS.clear()  # pylint: disable=protected-access
+        walk_model = mocker.spy(walking, "_walk_model")
+
+        list(model_fields(SharedModelSettings))
+        list(model_fields(EnvPrefixAndNestedDelimiterSettings))
+
+        walked_models = [call.args[0] for call in walk_model.call_args_list]
+        assert walked_models.count(SubModel) == 1
+
+    @staticmethod
+    def should_fail_for_model_containing_itself():
+        with pytest.raises(BadParameter, match="model 'CyclicModel' contains itself at 'root.child'"):
+            list(model_fields(CyclicSettings))
+
+    @staticmethod
+    def should_fail_for_models_nested_deeper_than_max_depth():
+        with pytest.raises(BadParameter, match="models are nested deeper than 3 levels at 'root.child.child.child'\\."):
+            list(model_fields(_nested_settings(4), max_depth=3))
+
+    @staticmethod
+    def should_fail_for_cached_models_nested_deeper_than_max_depth():
+        settings = _nested_settings(4)
+        list(model_fields(settings))
+
+        with pytest.raises(BadParameter, match="nested deeper than 3 levels at 'root.child.child.child'\\."):
+            list(model_fields(settings, max_depth=3))
+
+    @staticmethod
+    def should_accept_models_nested_up_to_max_depth():
+        assert [name for name, _ in model_fields(_nested_settings(4), max_depth=4)] == ["rootchildchildchildleaf"]
+
+
+class TestMaxDepthOption:
+    @staticmethod
+    def should_fail_with_clear_error(runner: CliRunner, mocker: MockerFixture):
+        mock_import_class_path(mocker, _nested_settings(2))
+
+        result = runner.invoke(app, ["generate", "--class", "MockSettings", "-f", "dotenv", "--max-depth", "1"])
+
+        assert result.exit_code == 2
+        assert "Cannot walk settings class 'DeepSettings': models are nested deeper than 1 levels" in result.output
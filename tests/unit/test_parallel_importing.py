@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click import BadParameter
+
+from settings_doc import OutputFormat, parallel_importing, render
+from settings_doc.walking import DEFAULT_MAX_DEPTH
+from tests.helpers import OUTPUT_FORMATS, assert_same_output_as_import, importable_modules
+
+_MODULE_PATH = "tests.fixtures.valid_settings"
+_SOURCE = """
+    from enum import Enum, IntEnum
+    from typing import Literal, Optional
+
+    from pydantic import BaseModel, Field
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+    class Color(str, Enum):
+        RED = "red"
+        GREEN = "green"
+
+
+    class Priority(IntEnum):
+        LOW = 1
+        HIGH = 2
+
+
+    class Database(BaseModel):
+        host: str = "localhost"
+
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(env_prefix="APP_", env_nested_delimiter="__")
+
+        level: Literal["debug", "info"] = Field("info", description="Log level.", examples=["debug"])
+        color: Color = Color.RED
+        priority: Priority = Priority.HIGH
+        tags: list = Field(default_factory=list)
+        limits: dict = {"a": 1}
+        database: Database
+        optional: Optional[int] = None
+    """
+
+
+@pytest.fixture()
+def worker_module(tmp_path: Path) -> Iterator[str]:
+    with importable_modules(tmp_path, {"worker_settings.py": _SOURCE}):
+        yield "worker_settings"
+
+
+class TestParallelImportModulePath:
+    @staticmethod
+    @OUTPUT_FORMATS
+    def should_render_the_same_output_as_import(output_format: OutputFormat, worker_module: str):
+        module_path = (_MODULE_PATH, worker_module)
+        parallel_output = render(output_format, module_path=module_path, jobs=2)
+
+        assert worker_module not in sys.modules
+        assert_same_output_as_import(output_format, parallel_output, module_path)
+
+    @staticmethod
+    def should_fail_when_module_cannot_be_imported():
+        parallel_importing.import_module_path.cache_clear()
+
+        with pytest.raises(BadParameter, match="Cannot read the module: No module named 'not_a_module'"):
+            parallel_importing.import_module_path(("not_a_module", _MODULE_PATH), 2, DEFAULT_MAX_DEPTH)
+
+    @staticmethod
+    def should_fail_when_no_settings_are_found():
+        parallel_importing.import_module_path.cache_clear()
+
+        with pytest.raises(BadParameter, match="found in any of the modules"):
+            parallel_importing.import_module_path(
+                ("tests.fixtures.module_without_settings", "tests.fixtures.module_without_settings_2"),
+                2,
+                DEFAULT_MAX_DEPTH,
+            )
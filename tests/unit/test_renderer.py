@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from settings_doc import OutputFormat, Renderer, importing, render, streaming, walking
+from tests.fixtures.valid_settings import EmptySettings, ExamplesSettings, FullSettings
+
+_MODULE_PATH = "tests.fixtures.valid_settings"
+
+
+class TestRenderer:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "output_format",
+        [pytest.param(OutputFormat.MARKDOWN, id="markdown"), pytest.param(OutputFormat.DOTENV, id="dotenv")],
+    )
+    def should_render_the_same_output_as_render(output_format: OutputFormat):
+        renderer = Renderer()
+
+        assert renderer.render(output_format, module_path=(_MODULE_PATH,)) == render(
+            output_format, module_path=(_MODULE_PATH,)
+        )
+        assert renderer.render(output_format, class_path=(f"{_MODULE_PATH}.FullSettings",)) == render(
+            output_format, class_path=(f"{_MODULE_PATH}.FullSettings",)
+        )
+
+    @staticmethod
+    def should_render_classes_given_directly():
+        assert Renderer().render(OutputFormat.DOTENV, [EmptySettings]) == "LOGGING_LEVEL=\n\n"
+
+    @staticmethod
+    def should_fail_without_sources_of_data():
+        with pytest.raises(ValueError, match="No sources of data were specified."):
+            Renderer().render(OutputFormat.DOTENV)
+
+    @staticmethod
+    def should_walk_each_class_only_once(mocker: MockerFixture):
+        renderer = Renderer()
+        walk = mocker.spy(streaming, "walk_settings")
+
+        renderer.render(OutputFormat.DOTENV, [FullSettings, ExamplesSettings])
+        renderer.render(OutputFormat.MARKDOWN, [FullSettings])
+
+        assert [call.args[0] for call in walk.call_args_list] == [FullSettings, ExamplesSettings]
+
+    @staticmethod
+    def should_walk_invalidated_classes_again(mocker: MockerFixture):
+        renderer = Renderer()
+        renderer.render(OutputFormat.DOTENV, [FullSettings, ExamplesSettings])
+        walk = mocker.spy(streaming, "walk_settings")
+
+        renderer.invalidate(FullSettings)
+        renderer.render(OutputFormat.DOTENV, [FullSettings, ExamplesSettings])
+
+        assert [call.args[0] for call in walk.call_args_list] == [FullSettings]
+
+    @staticmethod
+    def should_expand_invalidated_classes_again():
+        renderer = Renderer()
+        renderer.render(OutputFormat.DOTENV, [FullSettings])
+        assert FullSettings in walking._EXPANSIONS  # pylint: disable=protected-access
+
+        renderer.invalidate(FullSettings)
+
+        assert FullSettings not in walking._EXPANSIONS  # pylint: disable=protected-access
+
+    @staticmethod
+    def should_resolve_import_paths_again_after_invalidating_all(mocker: MockerFixture):
+        renderer = Renderer()
+        renderer.render(OutputFormat.DOTENV, module_path=(_MODULE_PATH,))
+        import_module = mocker.spy(importing, "import_module")
+
+        renderer.render(OutputFormat.DOTENV, module_path=(_MODULE_PATH,))
+        assert import_module.call_count == 0
+
+        renderer.invalidate()
+        renderer.render(OutputFormat.DOTENV, module_path=(_MODULE_PATH,))
+        assert import_module.call_count == 1
+
+    @staticmethod
+    def should_load_invalidated_templates_again(tmp_path: Path):
+        template = tmp_path / "dotenv.jinja"
+        template.write_text("first", encoding="utf-8")
+        renderer = Renderer(templates=[tmp_path])
+        assert renderer.render(OutputFormat.DOTENV, [EmptySettings]) == "first"
+
+        template.write_text("second", encoding="utf-8")
+        renderer.invalidate_templates()
+
+        assert renderer.render(OutputFormat.DOTENV, [EmptySettings]) == "second"
+
+    @staticmethod
+    def should_not_invalidate_templates_of_other_renderers(tmp_path: Path):
+        template = tmp_path / "dotenv.jinja"
+        template.write_text("first", encoding="utf-8")
+        renderer, other_renderer = Renderer(templates=[tmp_path]), Renderer(templates=[tmp_path])
+        renderer.render(OutputFormat.DOTENV, [EmptySettings])
+        other_renderer.render(OutputFormat.DOTENV, [EmptySettings])
+
+        template.write_text("second", encoding="utf-8")
+        renderer.invalidate_templates()
+
+        assert other_renderer._env.cache  # pylint: disable=protected-access
+        assert not renderer._env.cache  # pylint: disable=protected-access
+
+    @staticmethod
+    def should_render_concurrently():
+        renderer = Renderer()
+        expected = render(OutputFormat.MARKDOWN, module_path=(_MODULE_PATH,))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            rendered_docs = list(
+                executor.map(lambda _: renderer.render(OutputFormat.MARKDOWN, module_path=(_MODULE_PATH,)), range(32))
+            )
+
+        assert rendered_docs == [expected] * 32
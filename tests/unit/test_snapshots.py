@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click import BadParameter
+
+from settings_doc import OutputFormat, render
+from settings_doc.snapshots import SNAPSHOT_VERSION, _decode, _encode, load_snapshot
+from tests.helpers import OUTPUT_FORMATS, assert_same_output_as_import, importable_modules
+
+_MODULE_PATH = "tests.fixtures.valid_settings"
+_SOURCE = """
+    from enum import Enum
+    from typing import Literal, Optional, Tuple
+
+    from pydantic import BaseModel, Field
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+    class Color(str, Enum):
+        RED = "red"
+        GREEN = "green"
+
+
+    class Database(BaseModel):
+        host: str = "localhost"
+
+
+    class AppSettings(BaseSettings):
+        \"\"\"Settings of the application.\"\"\"
+
+        model_config = SettingsConfigDict(env_prefix="APP_", env_nested_delimiter="__")
+
+        level: Literal["debug", "info"] = Field("info", description="Log level.", examples=["debug"])
+        color: Color = Color.RED
+        hosts: Tuple[str, ...] = ("a", "b")
+        ports: dict = {1: "one"}
+        database: Database
+        optional: Optional[int] = None
+    """
+
+
+@pytest.fixture()
+def snapshot_module(tmp_path: Path) -> Iterator[str]:
+    with importable_modules(tmp_path, {"snapshot_settings.py": _SOURCE}):
+        yield "snapshot_settings"
+
+
+class TestSnapshotValues:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(("a", 1), id="tuple"),
+            pytest.param({1, 2}, id="set"),
+            pytest.param(frozenset({"a"}), id="frozenset"),
+            pytest.param({1: ("a",)}, id="dict with non-string keys"),
+            pytest.param({"a": [{"b": (None,)}]}, id="nested"),
+        ],
+    )
+    def should_restore_values_json_cannot_represent(value):
+        restored = _decode(json.loads(json.dumps(_encode(value))))
+
+        assert restored == value
+        assert type(restored) is type(value)
+
+
+class TestSnapshotRendering:
+    @staticmethod
+    @OUTPUT_FORMATS
+    def should_render_the_same_output_as_import(output_format: OutputFormat, snapshot_module: str, tmp_path: Path):
+        module_path = (_MODULE_PATH, snapshot_module)
+        snapshot_file = tmp_path / "settings.json"
+        snapshot_file.write_text(render(OutputFormat.JSON, module_path=module_path), encoding="utf-8")
+
+        assert_same_output_as_import(output_format, render(output_format, snapshot_files=(snapshot_file,)), module_path)
+
+    @staticmethod
+    def should_describe_fields_with_their_classes(snapshot_module: str):
+        snapshot = json.loads(render(OutputFormat.JSON, module_path=(snapshot_module,)))
+
+        assert snapshot["version"] == SNAPSHOT_VERSION
+        (cls,) = snapshot["classes"]
+        assert cls["qualname"] == "AppSettings"
+        assert [env_field["env_name"] for env_field in cls["env_fields"]] == [
+            "APP_level",
+            "APP_color",
+            "APP_hosts",
+            "APP_ports",
+            "APP_database__host",
+            "APP_optional",
+        ]
+        level = snapshot["fields"][cls["env_fields"][0]["field"]]
+        assert level["description"] == "Log level."
+        assert level["possible_values"] == ["debug", "info"]
+
+    @staticmethod
+    def should_fail_for_unsupported_version(tmp_path: Path):
+        snapshot_file = tmp_path / "settings.json"
+        snapshot_file.write_text(json.dumps({"version": SNAPSHOT_VERSION + 1}), encoding="utf-8")
+
+        with pytest.raises(BadParameter, match=f"has version {SNAPSHOT_VERSION + 1}, but only version 1 is supported"):
+            load_snapshot(snapshot_file)
+
+    @staticmethod
+    def should_fail_for_malformed_snapshot(tmp_path: Path):
+        snapshot_file = tmp_path / "settings.json"
+        snapshot_file.write_text(json.dumps({"version": SNAPSHOT_VERSION, "classes": []}), encoding="utf-8")
+
+        with pytest.raises(BadParameter, match="malformed content"):
+            load_snapshot(snapshot_file)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+from click import BadParameter
+
+from settings_doc import OutputFormat, importing, render, static_importing
+from tests.helpers import OUTPUT_FORMATS, assert_same_output_as_import, importable_modules
+
+_SIDE_EFFECT = "raise RuntimeError('Application code must not run.')\n"
+
+
+@pytest.fixture()
+def write_module(tmp_path: Path):
+    package = tmp_path / "static_package"
+
+    def _write_module(name: str, source: str) -> str:
+        (package / f"{name}.py").write_text(dedent(source), encoding="utf-8")
+        return f"static_package.{name}"
+
+    with importable_modules(tmp_path, {"static_package/__init__.py": _SIDE_EFFECT}):
+        yield _write_module
+
+
+class TestStaticImportModulePath:
+    @staticmethod
+    @OUTPUT_FORMATS
+    def should_render_the_same_output_as_import(output_format: OutputFormat):
+        module_path = ("tests.fixtures.valid_settings",)
+        assert_same_output_as_import(
+            output_format, render(output_format, module_path=module_path, static=True), module_path
+        )
+
+    @staticmethod
+    def should_not_import_application_code(write_module):
+        module_path = write_module(
+            "settings",
+            f"""
+            from enum import Enum, IntEnum, auto
+            from typing import Literal, Optional
+
+            from pydantic import BaseModel, Field
+            from pydantic_settings import BaseSettings, SettingsConfigDict
+
+            DEFAULT_LEVEL = "info"
+
+
+            class Color(str, Enum):
+                RED = "red"
+                GREEN = "green"
+
+
+            class Priority(IntEnum):
+                LOW = auto()
+                HIGH = auto()
+
+
+            class Database(BaseModel):
+                host: str = "localhost"
+
+
+            class AppSettings(BaseSettings):
+                \"\"\"Application settings.\"\"\"
+
+                model_config = SettingsConfigDict(env_prefix="APP_", env_nested_delimiter="__")
+
+                level: Literal["debug", "info"] = Field(DEFAULT_LEVEL, description="Log level.")
+                color: Color = Color.RED
+                priority: Optional[Priority] = None
+                database: Database
+
+
+            {_SIDE_EFFECT}
+            """,
+        )
+
+        output = render(OutputFormat.DOTENV, module_path=(module_path,), static=True)
+
+        assert module_path not in sys.modules
+        assert "# Log level.\n# Possible values:\n#   `debug`, `info`\n# APP_LEVEL=info\n" in output
+        assert "#   `red`, `green`\n# APP_COLOR=red\n" in output
+        assert "# APP_PRIORITY=\n" in output
+        assert "# APP_DATABASE__HOST=localhost\n" in output
+
+    @staticmethod
+    def should_follow_imports_within_the_package(write_module):
+        write_module("models", "from pydantic import BaseModel\n\nclass Nested(BaseModel):\n    leaf: str\n")
+        module_path = write_module(
+            "settings",
+            f"""
+            from pydantic_settings import BaseSettings
+            from .models import Nested
+
+            class Settings(BaseSettings, env_nested_delimiter="__"):
+                nested: Nested
+
+            {_SIDE_EFFECT}
+            """,
+        )
+
+        output = render(OutputFormat.DOTENV, module_path=(module_path,), static=True)
+
+        assert "NESTED__LEAF=\n" in output
+        assert "static_package.models" not in sys.modules
+
+    @staticmethod
+    def should_call_re_created_models(write_module):
+        module_path = write_module(
+            "settings",
+            f"""
+            from pydantic import BaseModel
+            from pydantic_settings import BaseSettings
+
+            class Db(BaseModel):
+                host: str = "localhost"
+                port: int = 5432
+
+            class Settings(BaseSettings, env_nested_delimiter="__"):
+                db: Db = Db(port=6543)
+
+            {_SIDE_EFFECT}
+            """,
+        )
+
+        output = render(OutputFormat.DOTENV, module_path=(module_path,), static=True)
+
+        assert "DB__HOST=localhost\n" in output
+        assert module_path not in sys.modules
+
+    @staticmethod
+    def should_import_classes_that_cannot_be_resolved_statically(write_module):
+        write_module("__init__", "")
+        module_path = write_module(
+            "settings",
+            """
+            import os
+
+            from pydantic import Field
+            from pydantic_settings import BaseSettings
+
+
+            class StaticSettings(BaseSettings):
+                static_field: str = "static"
+
+
+            class DynamicSettings(BaseSettings):
+                dynamic_field: str = Field(default_factory=lambda: os.getcwd())
+            """,
+        )
+
+        settings = static_importing.import_module_path((module_path,))
+
+        assert module_path in sys.modules
+        assert [cls.__name__ for cls in settings] == ["StaticSettings", "DynamicSettings"]
+        assert next(iter(settings)) is not sys.modules[module_path].StaticSettings
+        assert list(settings)[1] is sys.modules[module_path].DynamicSettings
+
+    @staticmethod
+    def should_keep_the_definition_order_of_imported_classes(write_module):
+        write_module("__init__", "")
+        module_path = write_module(
+            "settings",
+            """
+            import os
+
+            from pydantic import Field
+            from pydantic_settings import BaseSettings
+
+
+            class FirstSettings(BaseSettings):
+                first_field: str = "first"
+
+
+            class DynamicSettings(BaseSettings):
+                dynamic_field: str = Field(default_factory=lambda: os.getcwd())
+
+
+            class LastSettings(BaseSettings):
+                last_field: str = "last"
+            """,
+        )
+
+        settings = static_importing.import_module_path((module_path,))
+
+        assert [cls.__name__ for cls in settings] == ["FirstSettings", "DynamicSettings", "LastSettings"]
+
+    @staticmethod
+    def should_fail_when_no_settings_are_found(write_module):
+        module_path = write_module(
+            "settings", "from pydantic import BaseModel\n\nclass Model(BaseModel):\n    a: int\n"
+        )
+
+        with pytest.raises(BadParameter, match=importing.MODULE_ERROR_MSG.format(module_path=module_path)):
+            static_importing.import_module_path((module_path,))
+
+
+class TestStaticImportClassPath:
+    @staticmethod
+    def should_resolve_class_without_importing(write_module):
+        module_path = write_module(
+            "settings",
+            "from pydantic_settings import BaseSettings\n\n"
+            f"class Settings(BaseSettings):\n    a: int\n\n{_SIDE_EFFECT}",
+        )
+
+        settings = static_importing.import_class_path((f"{module_path}.Settings",))
+
+        assert [cls.__name__ for cls in settings] == ["Settings"]
+        assert module_path not in sys.modules
+
+    @staticmethod
+    def should_raise_the_same_errors_as_import():
+        with pytest.raises(BadParameter, match="Target class must be a subclass of BaseSettings"):
+            static_importing.import_class_path(("tests.fixtures.valid_settings.DeepSubModel",))
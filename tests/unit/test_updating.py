@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from settings_doc.updating import find_between, map_file, replace, write_spliced
+
+_START = "<!-- start -->"
+_END = "<!-- end -->"
+
+
+def _regex_region(content: str) -> tuple[int, int] | None:
+    """The region matched by the regular expression used for `--between` before."""
+    match = re.search(f"({re.escape(_START)}\n?).*(\n?{re.escape(_END)})", content, re.DOTALL)
+    return None if match is None else (match.end(1), match.start(2))
+
+
+class TestFindBetween:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(f"before\n{_START}\nold\n{_END}\nafter", id="newlines around marks"),
+            pytest.param(f"{_START}old{_END}", id="no newlines"),
+            pytest.param(f"{_START}\n{_END}", id="empty region with newline"),
+            pytest.param(f"{_START}{_END}", id="empty region"),
+            pytest.param(f"{_START}\nfirst\n{_END}\n{_START}\nsecond\n{_END}\n", id="repeated marks"),
+            pytest.param(f"{_END}\n{_START}\nold\n", id="end mark only before start"),
+            pytest.param(f"{_START}\nold\n", id="missing end mark"),
+            pytest.param(f"old\n{_END}", id="missing start mark"),
+            pytest.param("", id="empty"),
+        ],
+    )
+    def should_find_the_same_region_as_regular_expression(content: str):
+        assert find_between(content.encode("utf-8"), _START, _END) == _regex_region(content)
+
+    @staticmethod
+    def should_keep_windows_line_ending_after_start_mark():
+        content = f"{_START}\r\nold\r\n{_END}".encode("utf-8")
+
+        assert find_between(content, _START, _END) == (len(_START) + 2, len(content) - len(_END))
+
+    @staticmethod
+    def should_return_byte_offsets_for_non_ascii_content():
+        content = f"žluťoučký\n{_START}\nkůň\n{_END}".encode("utf-8")
+
+        region = find_between(content, _START, _END)
+
+        assert region is not None
+        assert content[region[0] : region[1]] == "kůň\n".encode("utf-8")
+
+    @staticmethod
+    def should_stop_at_the_first_end_mark_when_not_greedy():
+        content = f"{_START}\nfirst\n{_END}\nbetween\n{_END}".encode("utf-8")
+
+        region = find_between(content, _START, _END, greedy=False)
+
+        assert region is not None
+        assert content[region[0] : region[1]] == b"first\n"
+
+
+class TestMapFile:
+    @staticmethod
+    @pytest.mark.parametrize("content", [b"", b"content"], ids=["empty", "non-empty"])
+    def should_give_file_content(tmp_path: Path, content: bytes):
+        path = tmp_path / "README.md"
+        path.write_bytes(content)
+
+        with open(path, "rb") as file, map_file(file) as mapped:
+            assert mapped[:] == content
+
+
+class TestWriteSpliced:
+    @staticmethod
+    def should_replace_region_with_chunks(tmp_path: Path):
+        path = tmp_path / "README.md"
+        content = b"before\nold\nafter"
+        path.write_bytes(content)
+
+        temporary_file = write_spliced(path, content, [((7, 11), iter(["new", "\n"]))])
+
+        assert temporary_file.parent == tmp_path
+        assert temporary_file.read_bytes() == b"before\n" + "new\n".replace("\n", os.linesep).encode() + b"after"
+
+    @staticmethod
+    def should_replace_several_regions(tmp_path: Path):
+        path = tmp_path / "README.md"
+        content = b"a[old]b[old]c"
+        path.write_bytes(content)
+
+        temporary_file = write_spliced(path, content, [((2, 5), ["first"]), ((8, 11), iter(["sec", "ond"]))])
+
+        assert temporary_file.read_bytes() == b"a[first]b[second]c"
+
+    @staticmethod
+    def should_copy_permissions_of_original_file(tmp_path: Path):
+        path = tmp_path / "README.md"
+        path.write_bytes(b"old")
+        path.chmod(0o640)
+
+        temporary_file = write_spliced(path, b"old", [((0, 3), ["new"])])
+
+        assert temporary_file.stat().st_mode & 0o777 == 0o640
+
+    @staticmethod
+    def should_remove_temporary_file_when_writing_fails(tmp_path: Path):
+        path = tmp_path / "README.md"
+        path.write_bytes(b"old")
+
+        def _failing_chunks():
+            yield "partial"
+            raise RuntimeError("Rendering failed.")
+
+        with pytest.raises(RuntimeError):
+            write_spliced(path, b"old", [((0, 3), _failing_chunks())])
+
+        assert os.listdir(tmp_path) == ["README.md"]
+
+
+class TestReplace:
+    @staticmethod
+    def should_replace_file_with_temporary_file(tmp_path: Path):
+        path = tmp_path / "README.md"
+        path.write_bytes(b"old")
+        temporary_file = write_spliced(path, b"old", [((0, 3), ["new"])])
+
+        replace(temporary_file, path)
+
+        assert path.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == ["README.md"]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from settings_doc.main import _render_job
+from settings_doc.manifest import ManifestJob
+from settings_doc.watching import Watcher
+from tests.helpers import importable_modules
+
+_SOURCE = "from pydantic_settings import BaseSettings\n\nclass Settings(BaseSettings):\n    first: str\n"
+
+
+@pytest.fixture()
+def watched_modules(tmp_path: Path) -> Iterator[Path]:
+    with importable_modules(tmp_path, {"watched_first.py": _SOURCE, "watched_second.py": _SOURCE}) as folder:
+        yield folder
+
+
+def _create_watcher(jobs: list[ManifestJob]) -> tuple[Watcher, dict[str, str]]:
+    outputs: dict[str, str] = {}
+    walked_fields: dict = {}
+
+    def _render(job: ManifestJob) -> None:
+        outputs[job.module_path[0]] = _render_job(job, walked_fields)
+
+    watcher = Watcher(jobs, _render)
+    watcher.start()
+    return watcher, outputs
+
+
+class TestWatcher:
+    @staticmethod
+    def should_render_only_affected_jobs_after_a_module_changes(watched_modules: Path):
+        watcher, outputs = _create_watcher(
+            [
+                ManifestJob(output_format="dotenv", module_path=("watched_first",)),
+                ManifestJob(output_format="dotenv", module_path=("watched_second",)),
+            ]
+        )
+        assert outputs == {"watched_first": "FIRST=\n\n", "watched_second": "FIRST=\n\n"}
+        outputs.clear()
+
+        (watched_modules / "watched_first.py").write_text(
+            "from pydantic_settings import BaseSettings\n\nclass Settings(BaseSettings):\n    changed_field: str\n",
+            encoding="utf-8",
+        )
+        affected = watcher.check()
+
+        assert [job.module_path for job in affected] == [("watched_first",)]
+        assert outputs == {"watched_first": "CHANGED_FIELD=\n\n"}
+
+    @staticmethod
+    def should_render_affected_jobs_after_a_template_changes(watched_modules: Path):
+        templates = watched_modules / "templates"
+        templates.mkdir()
+        (templates / "dotenv.jinja").write_text("old", encoding="utf-8")
+        watcher, outputs = _create_watcher(
+            [ManifestJob(output_format="dotenv", module_path=("watched_first",), templates=(templates,))]
+        )
+        assert outputs == {"watched_first": "old"}
+
+        (templates / "dotenv.jinja").write_text("new template", encoding="utf-8")
+        watcher.check()
+
+        assert outputs == {"watched_first": "new template"}
+
+    @staticmethod
+    def should_render_jobs_after_a_module_of_a_nested_model_changes(tmp_path: Path):
+        sources = {
+            "watched_models.py": "from pydantic import BaseModel\n\nclass Db(BaseModel):\n    host: str\n",
+            "watched_app.py": """
+                from pydantic_settings import BaseSettings, SettingsConfigDict
+
+                from watched_models import Db
+
+                class AppSettings(BaseSettings):
+                    model_config = SettingsConfigDict(env_nested_delimiter="__")
+
+                    db: Db
+                """,
+        }
+
+        with importable_modules(tmp_path, sources):
+            watcher, outputs = _create_watcher([ManifestJob(output_format="dotenv", module_path=("watched_app",))])
+            assert outputs == {"watched_app": "DB__HOST=\n\n"}
+
+            models = tmp_path / "watched_models.py"
+            models.write_text(models.read_text(encoding="utf-8") + "    port: int\n", encoding="utf-8")
+            affected = watcher.check()
+
+            assert [job.module_path for job in affected] == [("watched_app",)]
+            assert outputs == {"watched_app": "DB__HOST=\n\nDB__PORT=\n\n"}
+
+    @staticmethod
+    def should_not_render_anything_without_changes(watched_modules: Path):
+        del watched_modules
+        watcher, _ = _create_watcher([ManifestJob(output_format="dotenv", module_path=("watched_first",))])
+
+        assert not watcher.check()